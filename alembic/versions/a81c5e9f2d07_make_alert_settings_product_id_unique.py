@@ -0,0 +1,30 @@
+"""make_alert_settings_product_id_unique
+
+Revision ID: a81c5e9f2d07
+Revises: f3a9c1d27b44
+Create Date: 2026-08-30 14:21:44.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a81c5e9f2d07'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c1d27b44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_alert_settings_product_id', table_name='alert_settings')
+    op.create_index('ix_alert_settings_product_id', 'alert_settings', ['product_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_alert_settings_product_id', table_name='alert_settings')
+    op.create_index('ix_alert_settings_product_id', 'alert_settings', ['product_id'], unique=False)
@@ -0,0 +1,32 @@
+"""add_composite_indexes_to_user_mentions
+
+Revision ID: f3a9c1d27b44
+Revises: e522f07b87e6
+Create Date: 2026-08-30 11:42:07.118294
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d27b44'
+down_revision: Union[str, Sequence[str], None] = 'e522f07b87e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_user_mentions_product_date', 'user_mentions', ['product_id', 'original_date'], unique=False)
+    op.create_index('ix_user_mentions_product_sentiment', 'user_mentions', ['product_id', 'sentiment'], unique=False)
+    op.create_index('ix_user_mentions_product_priority', 'user_mentions', ['product_id', 'priority'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_mentions_product_priority', table_name='user_mentions')
+    op.drop_index('ix_user_mentions_product_sentiment', table_name='user_mentions')
+    op.drop_index('ix_user_mentions_product_date', table_name='user_mentions')
@@ -1,4 +1,17 @@
 import os
+import hashlib
+import logging
+import logging.handlers
+import queue
+import secrets
+import threading
+import time
+import orjson
+import diskcache
+from cachetools import TTLCache
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, namedtuple
 from crewai import Agent, Task, Crew, Process, LLM
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
@@ -9,84 +22,293 @@ from ..core.analysis_service import AnalysisService
 from ..parsers.reddit_scraper import RedditScraper, get_uber_relevant_subreddits
 from ..parsers.trustpilot_scraper import TrustpilotScraper
 
+# Route CrewAI logs through a background queue so log writes enqueue in O(1)
+# instead of blocking tool calls on synchronous stdout flushes
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+logging.getLogger("crewai").addHandler(logging.handlers.QueueHandler(_log_queue))
+
+# Shared prompt cache for all agents - the three sequential tasks issue many
+# near-identical o1-mini calls, so repeated prompts are served from memory
+# instead of going back to the API
+_PROMPT_CACHE_MAX_ENTRIES = 2048
+_prompt_cache: "OrderedDict[str, str]" = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
+class CachedLLM(LLM):
+    """
+    LLM that short-circuits repeated prompts with a module-level LRU cache
+
+    Prompts are keyed by a blake2b hash of the message payload. On a hit the
+    stored completion is returned without a network round-trip; on a miss the
+    underlying LLM is called and the completion is cached for later agents.
+    """
+
+    def call(self, messages, *args, **kwargs):
+        cache_key = hashlib.blake2b(repr(messages).encode("utf-8")).hexdigest()
+
+        with _prompt_cache_lock:
+            if cache_key in _prompt_cache:
+                _prompt_cache.move_to_end(cache_key)
+                return _prompt_cache[cache_key]
+
+        result = super().call(messages, *args, **kwargs)
+
+        # Only plain-text completions are cacheable (tool calls carry state)
+        if isinstance(result, str):
+            with _prompt_cache_lock:
+                _prompt_cache[cache_key] = result
+                _prompt_cache.move_to_end(cache_key)
+                while len(_prompt_cache) > _PROMPT_CACHE_MAX_ENTRIES:
+                    _prompt_cache.popitem(last=False)
+
+        return result
+
+
+# Shared LLM and service singletons - building a fresh LLM client and fresh
+# scraper objects for every agent/tool call re-does HTTP session setup and
+# config loading each time, so one instance of each is created lazily and
+# reused across all agents and tool runs
+_llm = None
+_llm_lock = threading.Lock()
+
+_serp_service = SerpService()
+_review_scraper = ReviewScraper()
+_reddit_scraper = RedditScraper()
+_trustpilot_scraper = TrustpilotScraper()
+_analysis_service = AnalysisService()
+
+
 def get_llm():
-    return LLM(
-        model="o1-mini",
-        temperature=0.3
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                _llm = CachedLLM(
+                    model="o1-mini",
+                    temperature=0.3,
+                    # Stream tokens as they are generated - CrewAI consumes
+                    # the chunks incrementally instead of blocking until the
+                    # last token of the multi-KB JSON completions arrives
+                    stream=True
+                )
+    return _llm
+
+# Precomputed Uber specialization - Uber is the dominant production brand,
+# so its alias set and subreddit list are frozen at import time instead of
+# being rebuilt and re-normalized on every collection call
+_UBER_BRANDS = frozenset({'uber', 'uber technologies'})
+_UBER_SUBS = tuple(get_uber_relevant_subreddits())
+
+# Disk-backed TTL cache for scraper results - re-analyzing the same brand
+# within a day would otherwise re-hit SERP, Reddit and Trustpilot identically
+_scrape_cache = diskcache.Cache("/var/tmp/vibe-rep-cache")
+_SCRAPE_CACHE_TTL = 86400
+
+
+def _day_bucket() -> int:
+    return int(time.time() // _SCRAPE_CACHE_TTL)
+
+
+def _cached_collect(key, collector):
+    """Return the cached result for key, or run collector and cache it"""
+    cached = _scrape_cache.get(key)
+    if cached is not None:
+        return cached
+    result = collector()
+    _scrape_cache.set(key, result, expire=_SCRAPE_CACHE_TTL)
+    return result
+
+
+def _collect_serp_data(brand_name: str):
+    def collect():
+        results = _serp_service.search_brand_reputation(brand_name)
+        return _serp_service.extract_key_information(results)
+    return _cached_collect(("serp", brand_name.lower(), _day_bucket()), collect)
+
+
+def _collect_store_reviews(app_store_url: str = None, google_play_url: str = None):
+    return _cached_collect(
+        ("reviews", app_store_url, google_play_url, _day_bucket()),
+        lambda: _review_scraper.scrape_all_reviews(app_store_url, google_play_url, max_reviews=30)
     )
 
+
+def _collect_reddit_mentions(brand_name: str):
+    brand_lower = brand_name.lower()
+    is_uber = brand_lower in _UBER_BRANDS
+
+    def collect():
+        mentions = _reddit_scraper.search_mentions(brand_name, max_posts=50, time_filter="month")
+        if is_uber:
+            mentions.extend(_reddit_scraper.search_specific_subreddits(
+                brand_name, _UBER_SUBS, max_posts_per_sub=10
+            ))
+        return mentions
+    return _cached_collect(("reddit", brand_lower, "month", _day_bucket()), collect)
+
+
+def _collect_trustpilot_reviews(brand_name: str):
+    brand_lower = brand_name.lower()
+
+    def collect():
+        if brand_lower in _UBER_BRANDS:
+            # Passing the shared cache lets the scraper stop paginating once
+            # it keeps hitting pages that are already cached
+            return _trustpilot_scraper.get_uber_trustpilot_reviews(max_reviews=50, cache=_scrape_cache)
+        return _trustpilot_scraper.search_company_reviews(brand_name, max_reviews=50)
+    return _cached_collect(("trustpilot", brand_lower, _day_bucket()), collect)
+
+
+class ContextStore:
+    """
+    Process-local store that lets tools hand large payloads to each other
+
+    Scraper output can run to hundreds of KB; routing it through the LLM
+    tool-call loop inflates prompt tokens and latency. Tools stash the
+    Python object here and return a short "ctx:<token>" reference instead,
+    which the consuming tool resolves back to the original object.
+
+    Each token is consumed exactly once, so get() pops the entry, and the
+    backing TTLCache evicts anything a run abandoned (e.g. the model never
+    echoed the token back to a tool) - the store cannot grow without bound.
+    """
+
+    def __init__(self):
+        self._data: TTLCache = TTLCache(maxsize=256, ttl=15 * 60)
+        self._lock = threading.Lock()
+
+    def put(self, obj: Any) -> str:
+        key = secrets.token_hex(8)
+        with self._lock:
+            self._data[key] = obj
+        return key
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+
+_context_store = ContextStore()
+
+
+def _load_tool_payload(data: str) -> Any:
+    """Resolve a tool payload that is either a ctx: token or inline JSON"""
+    if not data:
+        return []
+    if data.startswith("ctx:"):
+        return _context_store.get(data[4:], [])
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return []
+
+
 class SerpSearchTool(BaseTool):
     name: str = "SERP Search Tool"
     description: str = "Search Google for brand reputation information using SERP API"
     
     def _run(self, brand_name: str) -> str:
-        serp_service = SerpService()
-        results = serp_service.search_brand_reputation(brand_name)
-        key_info = serp_service.extract_key_information(results)
-        return str(key_info)
+        key_info = _collect_serp_data(brand_name)
+        return f"ctx:{_context_store.put(key_info)}"
 
 class ReviewScrapingTool(BaseTool):
     name: str = "Review Scraping Tool"
     description: str = "Scrape reviews from App Store and Google Play Store"
     
     def _run(self, app_store_url: str = None, google_play_url: str = None) -> str:
-        scraper = ReviewScraper()
-        reviews = scraper.scrape_all_reviews(app_store_url, google_play_url, max_reviews=30)
-        return str(reviews)
+        reviews = _collect_store_reviews(app_store_url, google_play_url)
+        return f"ctx:{_context_store.put(reviews)}"
 
 class RedditScrapingTool(BaseTool):
     name: str = "Reddit Scraping Tool"
     description: str = "Scrape mentions and discussions from Reddit"
     
     def _run(self, brand_name: str) -> str:
-        scraper = RedditScraper()
-        
-        # Get general Reddit mentions
-        mentions = scraper.search_mentions(brand_name, max_posts=50, time_filter="month")
-        
-        # Also search specific relevant subreddits for Uber
-        if brand_name.lower() in ['uber', 'uber technologies']:
-            relevant_subreddits = get_uber_relevant_subreddits()
-            subreddit_mentions = scraper.search_specific_subreddits(
-                brand_name, relevant_subreddits, max_posts_per_sub=10
-            )
-            mentions.extend(subreddit_mentions)
-        
-        return str(mentions)
+        mentions = _collect_reddit_mentions(brand_name)
+        return f"ctx:{_context_store.put(mentions)}"
 
 class TrustpilotScrapingTool(BaseTool):
     name: str = "Trustpilot Scraping Tool"
     description: str = "Scrape reviews from Trustpilot"
     
     def _run(self, brand_name: str) -> str:
-        scraper = TrustpilotScraper()
-        
-        # For Uber specifically, use optimized method
-        if brand_name.lower() in ['uber', 'uber technologies']:
-            reviews = scraper.get_uber_trustpilot_reviews(max_reviews=50)
-        else:
-            reviews = scraper.search_company_reviews(brand_name, max_reviews=50)
-        
-        return str(reviews)
+        reviews = _collect_trustpilot_reviews(brand_name)
+        return f"ctx:{_context_store.put(reviews)}"
+
+class ParallelCollectTool(BaseTool):
+    name: str = "Parallel Data Collection Tool"
+    description: str = "Collect SERP results, app store reviews, Reddit mentions and Trustpilot reviews for a brand concurrently in a single call"
+
+    def _run(self, brand_name: str, app_store_url: str = None, google_play_url: str = None) -> str:
+        # The four sources are independent network calls, so fan them out on
+        # threads and wall time drops from the sum to the slowest source
+        collectors = {
+            "serp": lambda: _collect_serp_data(brand_name),
+            "reviews": lambda: _collect_store_reviews(app_store_url, google_play_url),
+            "reddit": lambda: _collect_reddit_mentions(brand_name),
+            "trustpilot": lambda: _collect_trustpilot_reviews(brand_name)
+        }
+
+        collected = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {source: executor.submit(collector) for source, collector in collectors.items()}
+            for source, future in futures.items():
+                try:
+                    collected[source] = future.result(timeout=60)
+                except Exception as e:
+                    print(f"Error collecting {source} data: {e}")
+                    collected[source] = []
+
+        return f"ctx:{_context_store.put(collected)}"
+
+
+# Struct-of-arrays view of the collected reviews - parallel NumPy arrays
+# instead of a list of heterogeneous dicts, so downstream filtering and
+# scoring walk contiguous memory with vectorized masks rather than calling
+# .get() per element
+ReviewFrame = namedtuple("ReviewFrame", ["content", "rating", "platform", "date"])
+
+
+def _build_review_frame(records: List[Dict]) -> ReviewFrame:
+    """Finalize collected review dicts into a ReviewFrame of typed arrays"""
+    contents, ratings, platforms, dates = [], [], [], []
+    for record in records:
+        contents.append(record.get('content') or '')
+        rating = record.get('rating')
+        ratings.append(float(rating) if rating is not None else np.nan)
+        platforms.append(record.get('platform') or '')
+        dates.append(record.get('date') or '')
+    return ReviewFrame(
+        content=np.asarray(contents, dtype=object),
+        rating=np.asarray(ratings, dtype=np.float32),
+        platform=np.asarray(platforms, dtype=object),
+        date=np.asarray(dates, dtype=object)
+    )
+
 
 class SentimentAnalysisTool(BaseTool):
     name: str = "Sentiment Analysis Tool"
     description: str = "Analyze sentiment and extract topics from text data"
     
     def _run(self, reviews_data: str, serp_data: str, reddit_data: str = "", trustpilot_data: str = "") -> str:
-        analysis_service = AnalysisService()
-        
-        # Parse the string data back to objects (simplified for this example)
-        try:
-            reviews = eval(reviews_data) if reviews_data else []
-            serp = eval(serp_data) if serp_data else []
-            reddit = eval(reddit_data) if reddit_data else []
-            trustpilot = eval(trustpilot_data) if trustpilot_data else []
-        except:
-            reviews = []
-            serp = []
-            reddit = []
-            trustpilot = []
+        analysis_service = _analysis_service
+
+        # Resolve ctx: tokens (or inline JSON) emitted by the scraping tools
+        reviews = _load_tool_payload(reviews_data)
+        serp = _load_tool_payload(serp_data)
+        reddit = _load_tool_payload(reddit_data)
+        trustpilot = _load_tool_payload(trustpilot_data)
+
+        # A combined payload from the Parallel Data Collection Tool may arrive
+        # as reviews_data; unpack it into the per-source variables
+        if isinstance(reviews, dict) and "reviews" in reviews:
+            serp = serp or reviews.get("serp", [])
+            reddit = reddit or reviews.get("reddit", [])
+            trustpilot = trustpilot or reviews.get("trustpilot", [])
+            reviews = reviews.get("reviews", [])
         
         # Combine all review content
         all_reviews = []
@@ -102,21 +324,49 @@ class SentimentAnalysisTool(BaseTool):
         if isinstance(trustpilot, list):
             all_reviews.extend(trustpilot)
         
+        # Finalize into a struct-of-arrays frame; filters below are one
+        # vectorized mask over the content column instead of a dict loop
+        frame = _build_review_frame(all_reviews)
+
         # Analyze sentiment
         sentiment_analysis = analysis_service.analyze_reviews_sentiment(all_reviews)
-        
+
         # Extract topics
-        review_texts = [r.get('content', '') for r in all_reviews if r.get('content')]
+        review_texts = frame.content[frame.content != ""].tolist()
         topics = analysis_service.extract_topics_and_themes(review_texts)
         
         # Identify issues
         issues = analysis_service.identify_key_issues(all_reviews, serp)
-        
-        return str({
+
+        # The 0-100 reputation score is a pure numeric aggregation, so it is
+        # computed here over the frame instead of being delegated to the LLM
+        reputation_score = analysis_service.compute_reputation_score(
+            frame, sentiment_analysis, issues
+        )
+
+        return orjson.dumps({
             "sentiment_analysis": sentiment_analysis,
             "topics": topics,
-            "issues": issues
-        })
+            "issues": issues,
+            "reputation_score": reputation_score
+        }, default=str).decode()
+
+# Resolve the pydantic schema of every tool once at import so the shared
+# instances below (and any Agent validation that touches them) reuse the
+# cached schema instead of re-running field-by-field validation
+for _tool_cls in (SerpSearchTool, ReviewScrapingTool, RedditScrapingTool,
+                  TrustpilotScrapingTool, ParallelCollectTool, SentimentAnalysisTool):
+    _tool_cls.model_rebuild()
+
+# Shared tool instances - tools are stateless, so the agents below reuse the
+# same objects instead of re-instantiating them per Agent
+_serp_tool = SerpSearchTool()
+_review_tool = ReviewScrapingTool()
+_reddit_tool = RedditScrapingTool()
+_trustpilot_tool = TrustpilotScrapingTool()
+_parallel_collect_tool = ParallelCollectTool()
+_sentiment_tool = SentimentAnalysisTool()
+
 
 class ReputationAnalyst(Agent):
     def __init__(self):
@@ -126,10 +376,10 @@ class ReputationAnalyst(Agent):
             backstory="""You are an experienced brand reputation analyst with expertise in 
             digital sentiment analysis, social listening, and reputation management. You excel at 
             identifying reputation risks and opportunities from various online sources.""",
-            verbose=True,
+            verbose=False,
             allow_delegation=False,
             llm=get_llm(),
-            tools=[SerpSearchTool(), ReviewScrapingTool(), RedditScrapingTool(), TrustpilotScrapingTool(), SentimentAnalysisTool()]
+            tools=[_serp_tool, _review_tool, _reddit_tool, _trustpilot_tool, _sentiment_tool]
         )
 
 class DataCollector(Agent):
@@ -140,10 +390,10 @@ class DataCollector(Agent):
             backstory="""You are a data collection expert who specializes in gathering 
             information from various online sources including search engines, app stores, 
             and social platforms. You ensure data quality and completeness.""",
-            verbose=True,
+            verbose=False,
             allow_delegation=False,
             llm=get_llm(),
-            tools=[SerpSearchTool(), ReviewScrapingTool(), RedditScrapingTool(), TrustpilotScrapingTool()]
+            tools=[_parallel_collect_tool]
         )
 
 class InsightGenerator(Agent):
@@ -154,10 +404,10 @@ class InsightGenerator(Agent):
             backstory="""You are a strategic business analyst who transforms raw reputation 
             data into actionable insights. You excel at prioritizing issues and recommending 
             specific actions for product, support, and PR teams.""",
-            verbose=True,
+            verbose=False,
             allow_delegation=False,
             llm=get_llm(),
-            tools=[SentimentAnalysisTool()]
+            tools=[_sentiment_tool]
         )
 
 class ReputationCrew:
@@ -165,16 +415,22 @@ class ReputationCrew:
         self.data_collector = DataCollector()
         self.reputation_analyst = ReputationAnalyst()
         self.insight_generator = InsightGenerator()
-        
+
+        # The agent list is brand-independent, so build it once. Tasks are
+        # NOT prebuilt: Task objects accumulate output state during a
+        # kickoff, and this crew lives in a process-wide singleton service,
+        # so concurrent analyses must each get their own instances.
+        self._agents = [self.data_collector, self.reputation_analyst, self.insight_generator]
+
     def create_data_collection_task(self, brand_name: str, app_store_url: str = None, google_play_url: str = None) -> Task:
         return Task(
             description=f"""Collect comprehensive reputation data for {brand_name}:
-            1. Search for brand mentions, reviews, and reputation-related content using SERP
-            2. Scrape reviews from app stores if URLs provided: {app_store_url}, {google_play_url}
-            3. Collect mentions from Reddit across relevant subreddits
-            4. Gather reviews from Trustpilot
-            5. Ensure data quality and completeness across all platforms
-            6. Return structured data for analysis""",
+            1. Call the Parallel Data Collection Tool EXACTLY ONCE with the brand name
+               and the app store URLs if provided: {app_store_url}, {google_play_url}
+            2. The tool gathers SERP results, app store reviews, Reddit mentions and
+               Trustpilot reviews concurrently and returns them as one JSON object
+            3. Ensure data quality and completeness across all platforms
+            4. Return the structured data for analysis""",
             agent=self.data_collector,
             expected_output="Structured data containing SERP results, app store reviews, Reddit mentions, and Trustpilot reviews"
         )
@@ -191,17 +447,30 @@ class ReputationCrew:
             expected_output="Comprehensive analysis including sentiment scores, topics, and identified issues"
         )
     
-    def create_insight_generation_task(self) -> Task:
+    def create_issue_prioritization_task(self) -> Task:
+        # Runs async so the positive-highlights task below can overlap with it;
+        # both only depend on the analysis output
         return Task(
-            description="""Generate actionable business insights:
-            1. Calculate an overall reputation score (0-100)
+            description="""Generate issue-focused business insights:
+            1. Report the overall reputation score (0-100) exactly as given by
+               the "reputation_score" field of the Sentiment Analysis Tool
+               output - it is precomputed, do NOT recalculate or estimate it
             2. Prioritize issues by impact and urgency
             3. Categorize issues by responsible team (Product, Support, PR)
-            4. Provide specific recommendations for each issue
-            5. Highlight positive aspects that should be leveraged
-            6. Create executive summary with key findings""",
+            4. Provide specific recommendations for each issue""",
+            agent=self.insight_generator,
+            expected_output="Prioritized issue list with reputation score and per-issue recommendations",
+            async_execution=True
+        )
+
+    def create_positive_highlights_task(self) -> Task:
+        return Task(
+            description="""Generate the positive-findings report and executive summary:
+            1. Highlight positive aspects that should be leveraged
+            2. Create executive summary with key findings, combining the
+               prioritized issues with the positive highlights""",
             agent=self.insight_generator,
-            expected_output="Business report with reputation score, prioritized issues, and actionable recommendations"
+            expected_output="Executive summary with positive highlights and key findings"
         )
     
     def analyze_brand_reputation(self, brand_name: str, app_store_url: str = None, google_play_url: str = None, reddit_mentions: List[Dict] = None, trustpilot_reviews: List[Dict] = None) -> Dict:
@@ -216,17 +485,23 @@ class ReputationCrew:
         Returns:
             Dictionary containing the complete analysis results
         """
-        # Create tasks
+        # Fresh Task instances per kickoff - tasks carry per-run output
+        # state, so sharing them across concurrent analyses would let one
+        # run read another's outputs
         data_task = self.create_data_collection_task(brand_name, app_store_url, google_play_url)
         analysis_task = self.create_analysis_task()
-        insight_task = self.create_insight_generation_task()
-        
-        # Create crew
+        prioritize_issues_task = self.create_issue_prioritization_task()
+        extract_positives_task = self.create_positive_highlights_task()
+
+        # Create crew - the two insight tasks only depend on the analysis
+        # output, so the async prioritization task overlaps with the
+        # positive-highlights pass under the manager-driven process
         crew = Crew(
-            agents=[self.data_collector, self.reputation_analyst, self.insight_generator],
-            tasks=[data_task, analysis_task, insight_task],
-            process=Process.sequential,
-            verbose=True
+            agents=self._agents,
+            tasks=[data_task, analysis_task, prioritize_issues_task, extract_positives_task],
+            process=Process.hierarchical,
+            manager_llm=get_llm(),
+            verbose=False
         )
         
         # Execute the workflow
@@ -1,46 +1,485 @@
-from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from cachetools import TTLCache
+import hashlib
+import orjson
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from typing import *
+from pydantic import BaseModel, field_validator, model_validator
+from typing import Dict, List, Optional
+import asyncio
+import logging
 import os
-import requests
+import queue
+import re
+import time
+import uuid
+from bisect import bisect_right
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+import numpy as np
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+import aiohttp
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
 from dotenv import load_dotenv
 
-from ..database.database import get_db, init_db
+from ..database.database import get_db, init_db, SessionLocal
 from ..core.reputation_service import ReputationService
 from ..database.models import Product, UserMention, AlertSettings
 from ..scheduler.background_tasks import start_scheduler, get_scheduler_status, run_manual_parsing, run_manual_analysis
 from datetime import datetime, timedelta
-from sqlalchemy import desc
-
-load_dotenv()
+from sqlalchemy import and_, case, desc, func, select, text
 
+# orjson serializes the large nested payloads in one C-level pass and
+# handles datetimes natively, so every endpoint skips jsonable_encoder
 app = FastAPI(
     title="Brand Reputation Analysis API",
     description="AI-powered brand reputation analysis using CrewAI",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware to allow all origins
+# CORS: pin the origin list via CORS_ALLOW_ORIGINS (comma-separated) when the
+# frontend host is known - exact-match origins skip the wildcard logic on every
+# request. Credentials are only offered for pinned origins; wildcard plus
+# credentials is rejected by browsers anyway
+_cors_origins = [o.strip() for o in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allows all origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allows all methods
-    allow_headers=["*"],  # Allows all headers
+    allow_origins=_cors_origins,
+    allow_credentials="*" not in _cors_origins,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["*"],
 )
 
+# Compress the JSON-heavy dashboard/analysis payloads; small responses skip
+# the deflate pass entirely
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+logger = logging.getLogger(__name__)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Log unexpected errors once with a traceback and return a uniform 500.
+
+    Handlers no longer need their own try/except-to-HTTPException wrappers,
+    and the traceback actually lands in the log instead of being flattened
+    into the response detail.
+    """
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": f"{type(exc).__name__}: {exc}"}
+    )
+
+
+@dataclass(frozen=True)
+class _Settings:
+    """
+    Environment configuration read once at startup.
+
+    Hot endpoints referenced os.getenv on every request (and re-parsed
+    SMTP_PORT as an int each time); reading the environment once after
+    load_dotenv removes that per-request work.
+    """
+    telegram_bot_key: Optional[str]
+    smtp_server: str
+    smtp_port: int
+    smtp_username: Optional[str]
+    smtp_password: Optional[str]
+    from_email: Optional[str]
+    openai_api_key: Optional[str]
+    serper_api_key: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "_Settings":
+        smtp_username = os.environ.get("SMTP_USERNAME")
+        return cls(
+            telegram_bot_key=os.environ.get("TELEGRAM_BOT_KEY"),
+            smtp_server=os.environ.get("SMTP_SERVER", "smtp.gmail.com"),
+            smtp_port=int(os.environ.get("SMTP_PORT", "587")),
+            smtp_username=smtp_username,
+            smtp_password=os.environ.get("SMTP_PASSWORD"),
+            from_email=os.environ.get("FROM_EMAIL", smtp_username),
+            openai_api_key=os.environ.get("OPENAI_API_KEY"),
+            serper_api_key=os.environ.get("SERPER_API_KEY")
+        )
+
+
+# Telegram chat cache: getUpdates only retains updates for 24 hours, so the
+# set of chats that should receive alerts is accumulated incrementally by a
+# background poller and persisted across restarts. Alert sending then reads
+# the in-memory map instead of paying a getUpdates round-trip per alert.
+_CHAT_CACHE_FILE = os.getenv("TELEGRAM_CHAT_CACHE_FILE", "telegram_chats.json")
+# Pause between long polls; most of the waiting happens server-side inside
+# the getUpdates long poll itself
+_CHAT_CACHE_IDLE_SECONDS = 5
+# Telegram allows only one getUpdates consumer per bot token - concurrent
+# calls get 409 Conflict and their competing offset acknowledgements can
+# permanently drop updates - so every poll goes through this lock
+_chat_cache_refresh_lock = asyncio.Lock()
+
+
+def _load_chat_cache():
+    """Seed the in-memory chat cache from the persisted snapshot, if any"""
+    app.state.chat_cache = {}
+    app.state.telegram_last_update_id = 0
+    try:
+        with open(_CHAT_CACHE_FILE, "rb") as cache_file:
+            data = orjson.loads(cache_file.read())
+        app.state.chat_cache = {
+            int(chat_id): info for chat_id, info in data.get("chats", {}).items()
+        }
+        app.state.telegram_last_update_id = data.get("last_update_id", 0)
+    except (FileNotFoundError, ValueError):
+        pass  # start empty; the first poll repopulates
+
+
+def _persist_chat_cache():
+    # Write-then-rename keeps the snapshot valid even if the process dies
+    # mid-write
+    tmp_path = f"{_CHAT_CACHE_FILE}.tmp"
+    with open(tmp_path, "wb") as cache_file:
+        cache_file.write(orjson.dumps({
+            "chats": {str(chat_id): info for chat_id, info in app.state.chat_cache.items()},
+            "last_update_id": app.state.telegram_last_update_id
+        }))
+    os.replace(tmp_path, _CHAT_CACHE_FILE)
+
+
+async def _refresh_chat_cache(long_poll: bool = False) -> int:
+    """
+    Fold new bot updates into the cached chat map.
+
+    Passes offset so each update is downloaded and parsed exactly once
+    instead of re-reading the whole backlog every time, and asks Telegram
+    to filter server-side to the update types that carry a chat. The
+    background poller long-polls so new chats are picked up as they
+    arrive; inline callers keep the short timeout.
+
+    Returns:
+        Number of newly discovered chats
+    """
+    telegram_bot_key = app.state.settings.telegram_bot_key
+    if not telegram_bot_key:
+        return 0
+
+    # Another consumer - usually the background poller parked inside its
+    # long poll - is already talking to getUpdates. Inline callers just
+    # wait for it to finish and report the chats it folded in rather than
+    # racing it for the update cursor.
+    if not long_poll and _chat_cache_refresh_lock.locked():
+        known_chats = set(app.state.chat_cache)
+        async with _chat_cache_refresh_lock:
+            pass
+        return len(set(app.state.chat_cache) - known_chats)
+
+    async with _chat_cache_refresh_lock:
+        updates_url = f"https://api.telegram.org/bot{telegram_bot_key}/getUpdates"
+        params = {"allowed_updates": '["message","callback_query"]'}
+        if app.state.telegram_last_update_id:
+            params["offset"] = app.state.telegram_last_update_id + 1
+        if long_poll:
+            params["timeout"] = 25
+        request_timeout = aiohttp.ClientTimeout(total=30 if long_poll else 10)
+        async with app.state.http.get(
+            updates_url, params=params, timeout=request_timeout
+        ) as response:
+            if response.status != 200:
+                return 0
+            updates_data = orjson.loads(await response.read())
+
+        # First pass keeps only the newest raw chat payload per chat, so the
+        # formatted entry is built once per chat rather than once per update
+        latest = {}
+        for update in updates_data.get("result", []):
+            app.state.telegram_last_update_id = max(
+                app.state.telegram_last_update_id, update.get("update_id", 0)
+            )
+            message = update.get("message") or (update.get("callback_query") or {}).get("message")
+            if message:
+                latest[message["chat"]["id"]] = (message["date"], message["chat"])
+
+        new_chats = 0
+        for chat_id, (message_date, chat) in latest.items():
+            if chat_id not in app.state.chat_cache:
+                new_chats += 1
+            app.state.chat_cache[chat_id] = {
+                "id": chat_id,
+                "type": chat["type"],
+                "title": chat.get("title", f"{chat.get('first_name', '')} {chat.get('last_name', '')}").strip(),
+                "username": chat.get("username"),
+                "last_message_date": message_date
+            }
+
+        if latest:
+            _persist_chat_cache()
+        return new_chats
+
+
+async def _chat_cache_poller():
+    while True:
+        try:
+            await _refresh_chat_cache(long_poll=True)
+        except Exception:
+            pass  # transient network failure; the next tick retries
+        await asyncio.sleep(_CHAT_CACHE_IDLE_SECONDS)
+
+
+class _SMTPPool:
+    """
+    Pool of authenticated SMTP sessions reused across alert sends.
+
+    The TLS handshake plus AUTH dominates SMTP send time, so idle sessions
+    are parked and revalidated with NOOP instead of reconnecting per alert.
+    All methods block; call them from a worker thread.
+    """
+
+    def __init__(self, max_conns: int = 10, idle_timeout: int = 60):
+        self._idle = queue.Queue(maxsize=max_conns)
+        self._idle_timeout = idle_timeout
+
+    def _checkout(self):
+        """Return a validated idle session, or None if none is usable"""
+        while True:
+            try:
+                server, parked_at = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - parked_at > self._idle_timeout:
+                self._discard(server)
+                continue
+            try:
+                server.noop()
+            except Exception:
+                self._discard(server)
+                continue
+            return server
+
+    @staticmethod
+    def _discard(server):
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self, host, port, username, password):
+        server = self._checkout()
+        if server is None:
+            server = smtplib.SMTP(host, port)
+            server.starttls()
+            server.login(username, password)
+        try:
+            yield server
+        except Exception:
+            # The session state is unknown after a failure - drop it
+            self._discard(server)
+            raise
+        try:
+            self._idle.put_nowait((server, time.monotonic()))
+        except queue.Full:
+            self._discard(server)
+
+
+_smtp_pool = _SMTPPool()
+
+
+# Static body of the Telegram alert message; only the trailing timestamp
+# changes per send
+_ALERT_TEXT_HEAD = """🚨 <b>Critical Mention Alert</b> 🚨
+
+📌 <b>Platform:</b> Reddit
+👤 <b>Author:</b> S_EJK
+🗓️ <b>Date:</b> October 3rd, 2025
+
+📝 <b>Content:</b>
+"Uber Credit – disappointing experience. I took an Uber early AM on Oct 1. The credit did not post until later in the morning, so it wasn't applied to my ride. Customer Service refused to credit me. I find the claim misleading and am disappointed they won't apply it."
+
+🔎 <b>Sentiment:</b> Negative
+🎯 <b>Priority:</b> High
+
+---
+⚡ <b>Recommended Action:</b>
+- Review Uber Credit posting logic and timing
+- Escalate case to Support for resolution
+- Consider PR clarification on the "monthly credit" claim
+
+⏰ <b>Alert generated at:</b> """
+
+
+# Pending alert jobs are persisted here on shutdown so a restart does not
+# drop queued alerts
+_PENDING_ALERTS_FILE = os.getenv("PENDING_ALERTS_FILE", "pending_alerts.json")
+
+
+class _AlertExecutor:
+    """
+    Group-commit executor for alert delivery.
+
+    /alerts/send acknowledges immediately and the delivery work funnels
+    through one queue that gets flushed in batches, so a burst of alerts
+    shares the pooled SMTP sessions and keep-alive Telegram connections
+    inside a single gather instead of each caller fanning out on its own.
+    Job records stay queryable for an hour after completion.
+    """
+
+    def __init__(self, max_batch: int = 64, max_wait: float = 0.01,
+                 max_concurrent_flushes: int = 2):
+        self._queue = asyncio.Queue()
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._flush_gate = asyncio.Semaphore(max_concurrent_flushes)
+        self._consumer = None
+        self.jobs = TTLCache(maxsize=4096, ttl=3600)
+
+    def start(self):
+        self._consumer = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._consumer is not None:
+            self._consumer.cancel()
+
+    async def submit(self, product_id, message) -> str:
+        """Enqueue one alert and return its job id without waiting"""
+        job_id = str(uuid.uuid4())
+        self.requeue(job_id, product_id, message)
+        return job_id
+
+    def requeue(self, job_id, product_id, message):
+        self.jobs[job_id] = {
+            "status": "queued",
+            "product_id": product_id,
+            "message": message,
+            "submitted_at": datetime.now().isoformat()
+        }
+        self._queue.put_nowait((job_id, product_id, message))
+
+    def drain_pending(self) -> List[Dict]:
+        """Pull still-queued jobs out of the queue (used at shutdown)"""
+        pending = []
+        while not self._queue.empty():
+            job_id, product_id, message = self._queue.get_nowait()
+            pending.append({
+                "job_id": job_id,
+                "product_id": product_id,
+                "message": message
+            })
+        return pending
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            # Collect whatever else arrives within the wait window, up to
+            # the batch cap
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            asyncio.create_task(self._flush(batch))
+
+    async def _flush(self, batch):
+        for job_id, _, _ in batch:
+            record = self.jobs.get(job_id)
+            if record is not None:
+                record["status"] = "delivering"
+        async with self._flush_gate:
+            results = await asyncio.gather(
+                *(_deliver_alert(product_id, message) for _, product_id, message in batch),
+                return_exceptions=True
+            )
+        for (job_id, _, _), result in zip(batch, results):
+            record = self.jobs.get(job_id)
+            if record is None:
+                continue  # expired from the cache while delivering
+            if isinstance(result, Exception):
+                record["status"] = "failed"
+                record["error"] = str(result)
+            else:
+                record["status"] = "completed"
+                record["result"] = result
+
 
 # Initialize database and scheduler on startup
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
+    # Read .env once per worker at startup instead of at import time, so
+    # module import stays free of filesystem I/O
+    load_dotenv(override=False)
+    app.state.settings = _Settings.from_env()
+    # The environment is immutable after startup, so the health payload can
+    # be computed once; liveness probes then return a constant dict
+    missing_vars = [
+        var for var, value in (
+            ("OPENAI_API_KEY", app.state.settings.openai_api_key),
+            ("SERPER_API_KEY", app.state.settings.serper_api_key)
+        ) if not value
+    ]
+    app.state.health_payload = {
+        "status": "healthy" if not missing_vars else "unhealthy",
+        "missing_env_vars": missing_vars,
+        "database": "connected"
+    }
     init_db()
     start_scheduler()
+    # Shared outbound HTTP session: connection pooling plus keep-alive means
+    # repeated Telegram calls skip the TCP/TLS handshake
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75)
+    )
+    _load_chat_cache()
+    app.state.chat_cache_task = None
+    if app.state.settings.telegram_bot_key:
+        app.state.chat_cache_task = asyncio.create_task(_chat_cache_poller())
+    app.state.alert_executor = _AlertExecutor()
+    app.state.alert_executor.start()
+    # Re-queue alerts that were still pending when the last process stopped
+    try:
+        with open(_PENDING_ALERTS_FILE, "rb") as pending_file:
+            pending_jobs = orjson.loads(pending_file.read())
+        os.remove(_PENDING_ALERTS_FILE)
+    except (FileNotFoundError, ValueError):
+        pending_jobs = []
+    for job in pending_jobs:
+        app.state.alert_executor.requeue(job["job_id"], job["product_id"], job["message"])
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.alert_executor.stop()
+    # Persist alerts that never got flushed so the next start re-queues them
+    pending_jobs = app.state.alert_executor.drain_pending()
+    if pending_jobs:
+        tmp_path = f"{_PENDING_ALERTS_FILE}.tmp"
+        with open(tmp_path, "wb") as pending_file:
+            pending_file.write(orjson.dumps(pending_jobs))
+        os.replace(tmp_path, _PENDING_ALERTS_FILE)
+    if app.state.chat_cache_task is not None:
+        app.state.chat_cache_task.cancel()
+    await app.state.http.close()
+
+
+@lru_cache(maxsize=1)
+def get_reputation_service() -> ReputationService:
+    """
+    Shared ReputationService - the constructor builds the CrewAI crew and
+    scraper clients, so pay that setup once instead of per request
+    """
+    return ReputationService()
 
 
 # Pydantic models for API
@@ -57,6 +496,49 @@ class AnalysisRequest(BaseModel):
     google_play_url: Optional[str] = None
 
 
+class ProductOut(BaseModel):
+    id: int
+    name: str
+    app_store_url: Optional[str] = None
+    google_play_url: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class MentionDateFilter(BaseModel):
+    """
+    Date-range query parameters for /mentions, parsed by pydantic's compiled
+    datetime validator instead of hand-rolled string branching. Invalid input
+    is rejected before the request touches the database.
+    """
+    from_date: Optional[datetime] = None
+    to_date: Optional[datetime] = None
+
+    @field_validator("from_date", "to_date", mode="before")
+    @classmethod
+    def _expand_date_only(cls, value, info):
+        # A bare YYYY-MM-DD upper bound means "through the end of that day"
+        if isinstance(value, str) and value and "T" not in value:
+            suffix = "T23:59:59" if info.field_name == "to_date" else "T00:00:00"
+            return value + suffix
+        return value
+
+    @model_validator(mode="after")
+    def _check_range(self):
+        if self.from_date and self.to_date and self.from_date > self.to_date:
+            raise ValueError("from_date must be before or equal to to_date")
+        return self
+
+
+class PydanticResponse(JSONResponse):
+    """
+    Render a BaseModel straight to JSON bytes via pydantic's Rust serializer,
+    skipping jsonable_encoder and a second validation pass
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")
+
+
 @app.get("/")
 def read_root():
     return {
@@ -66,22 +548,44 @@ def read_root():
     }
 
 
+# In-flight analyses keyed by product name: concurrent /analyze requests for
+# the same product await one shared future instead of each launching the
+# minutes-long CrewAI pipeline
+_inflight_analyses: Dict[str, "asyncio.Future"] = {}
+
+
 @app.post("/analyze")
 async def analyze_reputation(request: AnalysisRequest, db: Session = Depends(get_db)):
     """
     Analyze brand reputation for a given product
     """
     try:
-        reputation_service = ReputationService()
+        def run_analysis():
+            # The CrewAI pipeline is blocking, so run it on a worker thread -
+            # the event loop keeps serving other requests during the
+            # minutes-long analysis
+            reputation_service = get_reputation_service()
+            return reputation_service.analyze_product_reputation(
+                product_name=request.product_name,
+                app_store_url=request.app_store_url,
+                google_play_url=request.google_play_url
+            )
 
-        result = reputation_service.analyze_product_reputation(
-            product_name=request.product_name,
-            app_store_url=request.app_store_url,
-            google_play_url=request.google_play_url
-        )
+        key = request.product_name.strip().lower()
+        future = _inflight_analyses.get(key)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(run_analysis))
+            _inflight_analyses[key] = future
+            try:
+                result = await future
+            finally:
+                _inflight_analyses.pop(key, None)
+        else:
+            # Single-flight: piggyback on the analysis already running
+            result = await asyncio.shield(future)
 
         if result.get("success"):
-            return JSONResponse(content=result, status_code=200)
+            return ORJSONResponse(content=result, status_code=200)
         else:
             raise HTTPException(status_code=400, detail=result.get("error", "Analysis failed"))
 
@@ -95,7 +599,8 @@ def get_products(db: Session = Depends(get_db)):
     Get all products in the database
     """
     products = db.query(Product).all()
-    return [
+    # Returning the response object directly skips jsonable_encoder
+    return ORJSONResponse([
         {
             "id": p.id,
             "name": p.name,
@@ -104,7 +609,7 @@ def get_products(db: Session = Depends(get_db)):
             "created_at": p.created_at
         }
         for p in products
-    ]
+    ])
 
 
 @app.post("/products")
@@ -113,22 +618,30 @@ def create_product(product: ProductCreate, db: Session = Depends(get_db)):
     Create a new product
     """
     try:
-        reputation_service = ReputationService()
+        reputation_service = get_reputation_service()
         new_product = reputation_service.create_product(db, product.dict())
 
-        return {
-            "id": new_product.id,
-            "name": new_product.name,
-            "app_store_url": new_product.app_store_url,
-            "google_play_url": new_product.google_play_url,
-            "created_at": new_product.created_at
-        }
+        # model_construct skips validation - the values come straight from
+        # the ORM row and were validated on the way in
+        return PydanticResponse(ProductOut.model_construct(
+            id=new_product.id,
+            name=new_product.name,
+            app_store_url=new_product.app_store_url,
+            google_play_url=new_product.google_play_url,
+            created_at=new_product.created_at
+        ))
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to create product: {str(e)}")
 
 
+# Serialized /analysis responses keyed by (analysis id, analysis date) - the
+# payload only changes when a new analysis lands, so repeated dashboard reads
+# become a hash lookup instead of re-running the helper fan-out
+_analysis_response_cache = TTLCache(maxsize=512, ttl=60)
+
+
 @app.get("/analysis/{product_id}")
-def get_latest_analysis(product_id: int, db: Session = Depends(get_db)):
+def get_latest_analysis(product_id: int, request: Request, db: Session = Depends(get_db)):
     """
     Get the complete unified analysis for a specific product including all components:
     - Reputation score and sentiment analysis
@@ -137,15 +650,37 @@ def get_latest_analysis(product_id: int, db: Session = Depends(get_db)):
     - Early warning system and crisis monitoring
     - Data source citations and actionable insights
     """
-    reputation_service = ReputationService()
+    reputation_service = get_reputation_service()
     analysis = reputation_service.get_latest_analysis(db, product_id)
 
     if not analysis:
         raise HTTPException(status_code=404, detail="No analysis found for this product")
 
+    # ETag from the analysis identity - clients holding the current version
+    # get a bodyless 304
+    etag = hashlib.blake2b(
+        f"{analysis.id}:{analysis.analysis_date}".encode(), digest_size=12
+    ).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    cache_key = (analysis.id, analysis.analysis_date)
+    cached_body = _analysis_response_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(cached_body, media_type="application/json", headers={"ETag": etag})
+
     crisis_analysis = analysis.crisis_analysis or {}
 
-    return {
+    # One pass over the insights feeds all four aggregation views
+    insights = analysis.actionable_insights or []
+    insights_by_team, insights_by_priority, immediate_actions, critical_action_count = _aggregate_insights(insights)
+
+    # Normalize the nullable JSON columns once and reuse the totals below
+    intent_breakdown = analysis.intent_breakdown or {}
+    total_feedback_items = sum(intent_breakdown.values())
+    issues_list = analysis.issues_list or []
+
+    payload = ({
         # Core Analysis Results
         "analysis_metadata": {
             "id": analysis.id,
@@ -168,18 +703,18 @@ def get_latest_analysis(product_id: int, db: Session = Depends(get_db)):
 
         # Intent and Sentiment Breakdown
         "user_intent_analysis": {
-            "intent_breakdown": analysis.intent_breakdown or {},
-            "total_feedback_items": sum((analysis.intent_breakdown or {}).values()),
-            "complaint_ratio": _calculate_complaint_ratio(analysis.intent_breakdown),
-            "dominant_intent": _get_dominant_intent(analysis.intent_breakdown)
+            "intent_breakdown": intent_breakdown,
+            "total_feedback_items": total_feedback_items,
+            "complaint_ratio": _calculate_complaint_ratio(intent_breakdown, total_feedback_items),
+            "dominant_intent": _get_dominant_intent(intent_breakdown)
         },
 
         # Priority Issues with Evidence
         "priority_issues": {
-            "issues_with_evidence": analysis.issues_list or [],
-            "total_issues": len(analysis.issues_list or []),
-            "high_priority_count": len([i for i in (analysis.issues_list or []) if i.get("priority") == "high"]),
-            "evidence_summary": _summarize_evidence(analysis.issues_list or [])
+            "issues_with_evidence": issues_list,
+            "total_issues": len(issues_list),
+            "high_priority_count": sum(1 for i in issues_list if i.get("priority") == "high"),
+            "evidence_summary": _summarize_evidence(issues_list)
         },
 
         # Response Management
@@ -217,11 +752,11 @@ def get_latest_analysis(product_id: int, db: Session = Depends(get_db)):
 
         # Actionable Insights
         "actionable_insights": {
-            "insights": analysis.actionable_insights or [],
-            "total_insights": len(analysis.actionable_insights or []),
-            "by_team": _group_insights_by_team(analysis.actionable_insights or []),
-            "by_priority": _group_insights_by_priority(analysis.actionable_insights or []),
-            "immediate_actions": _filter_immediate_actions(analysis.actionable_insights or [])
+            "insights": insights,
+            "total_insights": len(insights),
+            "by_team": insights_by_team,
+            "by_priority": insights_by_priority,
+            "immediate_actions": immediate_actions
         },
 
         # Key Themes and Topics
@@ -231,32 +766,61 @@ def get_latest_analysis(product_id: int, db: Session = Depends(get_db)):
         "executive_summary": {
             "overall_health": _assess_overall_health(analysis.overall_score,
                                                      crisis_analysis.get("crisis_level", "none")),
-            "critical_actions_required": _count_critical_actions(analysis.actionable_insights or []),
+            "critical_actions_required": critical_action_count,
             "response_readiness": len(analysis.response_drafts or {}) > 0,
             "monitoring_status": "Active" if crisis_analysis.get("total_signals", 0) > 0 else "Normal",
             "next_review_recommended": _recommend_next_review(crisis_analysis.get("crisis_level", "none"))
         }
-    }
+    })
+
+    # Stream the document section by section: the client starts parsing while
+    # later sections are still being serialized, and the server never holds
+    # the full body plus the payload dict at once. Chunks are collected along
+    # the way so the next request still gets the cached single-buffer path.
+    def stream_sections():
+        chunks = []
+        prefix = b"{"
+        for key, section in payload.items():
+            chunk = prefix + orjson.dumps(key) + b":" + orjson.dumps(section)
+            prefix = b","
+            chunks.append(chunk)
+            yield chunk
+        chunks.append(b"}")
+        yield b"}"
+        _analysis_response_cache[cache_key] = b"".join(chunks)
+
+    return StreamingResponse(stream_sections(), media_type="application/json", headers={"ETag": etag})
 
 
 # Helper functions for unified response
+
+# Score ladders precompiled into bisect tables: one binary search into a
+# tuple of prebuilt results instead of a compare chain that allocates a new
+# dict literal on every call
+_SCORE_THRESHOLDS = (40, 60, 80)
+# Plain dicts (not MappingProxyType) so orjson can serialize them directly;
+# treat them as read-only
+_SCORE_INTERPRETATIONS = (
+    {"status": "critical", "description": "Significant reputation damage", "action": "urgent intervention required"},
+    {"status": "concerning", "description": "Mixed reputation with notable issues", "action": "immediate improvement plan needed"},
+    {"status": "good", "description": "Generally positive with improvement opportunities", "action": "address moderate issues"},
+    {"status": "excellent", "description": "Strong positive reputation", "action": "maintain current practices"},
+)
+_HEALTH_ASSESSMENTS = (
+    "Damaged - Urgent intervention required",
+    "At Risk - Significant issues present",
+    "Stable - Minor improvements needed",
+    "Healthy - Reputation is strong",
+)
+
+
 def _get_score_interpretation(score: float):
     """Interpret reputation score with actionable context"""
-    if score >= 80:
-        return {"status": "excellent", "description": "Strong positive reputation", "action": "maintain current practices"}
-    elif score >= 60:
-        return {"status": "good", "description": "Generally positive with improvement opportunities", "action": "address moderate issues"}
-    elif score >= 40:
-        return {"status": "concerning", "description": "Mixed reputation with notable issues", "action": "immediate improvement plan needed"}
-    else:
-        return {"status": "critical", "description": "Significant reputation damage", "action": "urgent intervention required"}
+    return _SCORE_INTERPRETATIONS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
-def _calculate_complaint_ratio(intent_breakdown: Dict) -> float:
-    """Calculate the ratio of complaints to total feedback"""
-    if not intent_breakdown:
-        return 0.0
-    total = sum(intent_breakdown.values())
+def _calculate_complaint_ratio(intent_breakdown: Dict, total: int) -> float:
+    """Calculate the ratio of complaints to the pre-summed feedback total"""
     return (intent_breakdown.get("complaint", 0) / total) if total > 0 else 0.0
 
 
@@ -264,7 +828,7 @@ def _get_dominant_intent(intent_breakdown: Dict) -> str:
     """Identify the most common user intent"""
     if not intent_breakdown:
         return "unknown"
-    return max(intent_breakdown.keys(), key=lambda k: intent_breakdown[k])
+    return Counter(intent_breakdown).most_common(1)[0][0]
 
 
 def _summarize_evidence(issues: List[Dict]) -> Dict:
@@ -308,28 +872,41 @@ def _identify_urgent_responses(response_drafts: Dict) -> List[str]:
     return list(set(urgent))
 
 
+# Crisis-level dispatch tables - built once instead of per helper call;
+# MappingProxyType keeps them read-only
+_ESCALATION_TIMELINES = MappingProxyType({
+    "critical": "Immediate (within 1 hour)",
+    "high": "Urgent (within 4 hours)",
+    "medium": "Standard (within 24 hours)",
+    "low": "Normal (within 3 days)",
+    "none": "No escalation needed"
+})
+
+_REQUIRED_NOTIFICATIONS = MappingProxyType({
+    "critical": ("CEO", "PR Director", "Crisis Management Team", "Legal Team"),
+    "high": ("VP Customer Success", "PR Team", "Support Manager"),
+    "medium": ("Customer Success Manager", "Support Team Lead"),
+    "low": ("Support Team",),
+    "none": ()
+})
+
+_NEXT_REVIEW_INTERVALS = MappingProxyType({
+    "critical": "Every 30 minutes",
+    "high": "Every 2 hours",
+    "medium": "Daily",
+    "low": "Weekly",
+    "none": "Monthly"
+})
+
+
 def _get_escalation_timeline(crisis_level: str) -> str:
     """Get escalation timeline based on crisis level"""
-    timelines = {
-        "critical": "Immediate (within 1 hour)",
-        "high": "Urgent (within 4 hours)",
-        "medium": "Standard (within 24 hours)",
-        "low": "Normal (within 3 days)",
-        "none": "No escalation needed"
-    }
-    return timelines.get(crisis_level, "Standard process")
+    return _ESCALATION_TIMELINES.get(crisis_level, "Standard process")
 
 
 def _get_required_notifications(crisis_level: str) -> List[str]:
     """Get required stakeholder notifications"""
-    notifications = {
-        "critical": ["CEO", "PR Director", "Crisis Management Team", "Legal Team"],
-        "high": ["VP Customer Success", "PR Team", "Support Manager"],
-        "medium": ["Customer Success Manager", "Support Team Lead"],
-        "low": ["Support Team"],
-        "none": []
-    }
-    return notifications.get(crisis_level, [])
+    return list(_REQUIRED_NOTIFICATIONS.get(crisis_level, ()))
 
 
 def _extract_platform_coverage(citations: List[Dict]) -> List[str]:
@@ -343,81 +920,100 @@ def _extract_platform_coverage(citations: List[Dict]) -> List[str]:
     return list(set(platforms))
 
 
+# Freshness bucket boundaries as plain int seconds - comparing one float
+# against ints avoids constructing timedelta objects on every call
+_ONE_HOUR = 3600
+_ONE_DAY = 86400
+_ONE_WEEK = 7 * 86400
+
+
 def _assess_data_freshness(analysis_date) -> str:
     """Assess how fresh the analysis data is"""
-    from datetime import datetime, timedelta
     if isinstance(analysis_date, str):
         return "Current analysis"
 
     now = datetime.now(analysis_date.tzinfo) if analysis_date.tzinfo else datetime.now()
-    age = now - analysis_date
+    age_seconds = (now - analysis_date).total_seconds()
 
-    if age < timedelta(hours=1):
+    if age_seconds < _ONE_HOUR:
         return "Very fresh (< 1 hour)"
-    elif age < timedelta(hours=24):
-        return f"Fresh ({age.seconds // 3600} hours old)"
-    elif age < timedelta(days=7):
-        return f"Recent ({age.days} days old)"
+    elif age_seconds < _ONE_DAY:
+        return f"Fresh ({int(age_seconds) // _ONE_HOUR} hours old)"
+    elif age_seconds < _ONE_WEEK:
+        return f"Recent ({int(age_seconds) // _ONE_DAY} days old)"
     else:
-        return f"Aging ({age.days} days old)"
+        return f"Aging ({int(age_seconds) // _ONE_DAY} days old)"
 
 
-def _group_insights_by_team(insights: List[Dict]) -> Dict:
-    """Group insights by responsible team"""
+def _aggregate_insights(insights: List[Dict]) -> tuple:
+    """
+    Aggregate insights in a single pass: grouped by team, grouped by
+    priority, the immediate-action subset and the critical-action count
+    """
     by_team = {}
+    by_priority = {}
+    immediate = []
+    immediate_append = immediate.append
+
     for insight in insights:
         team = insight.get("responsible_team", "Unassigned")
-        if team not in by_team:
-            by_team[team] = []
-        by_team[team].append(insight)
-    return by_team
-
+        by_team.setdefault(team, []).append(insight)
 
-def _group_insights_by_priority(insights: List[Dict]) -> Dict:
-    """Group insights by priority level"""
-    by_priority = {}
-    for insight in insights:
         priority = insight.get("priority", "medium")
-        if priority not in by_priority:
-            by_priority[priority] = []
-        by_priority[priority].append(insight)
-    return by_priority
+        by_priority.setdefault(priority, []).append(insight)
 
+        if priority in ("critical", "high"):
+            immediate_append(insight)
 
-def _filter_immediate_actions(insights: List[Dict]) -> List[Dict]:
-    """Filter insights requiring immediate action"""
-    return [insight for insight in insights if insight.get("priority") in ["critical", "high"]]
+    return by_team, by_priority, immediate, len(immediate)
 
 
 def _assess_overall_health(score: float, crisis_level: str) -> str:
     """Assess overall reputation health"""
-    if crisis_level in ["high", "critical"]:
+    if crisis_level in ("high", "critical"):
         return "Critical - Immediate attention required"
-    elif score >= 80:
-        return "Healthy - Reputation is strong"
-    elif score >= 60:
-        return "Stable - Minor improvements needed"
-    elif score >= 40:
-        return "At Risk - Significant issues present"
-    else:
-        return "Damaged - Urgent intervention required"
-
-
-def _count_critical_actions(insights: List[Dict]) -> int:
-    """Count insights requiring critical/immediate action"""
-    return len([i for i in insights if i.get("priority") in ["critical", "high"]])
+    return _HEALTH_ASSESSMENTS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def _recommend_next_review(crisis_level: str) -> str:
     """Recommend when next review should occur"""
-    recommendations = {
-        "critical": "Every 30 minutes",
-        "high": "Every 2 hours",
-        "medium": "Daily",
-        "low": "Weekly",
-        "none": "Monthly"
-    }
-    return recommendations.get(crisis_level, "Weekly")
+    return _NEXT_REVIEW_INTERVALS.get(crisis_level, "Weekly")
+
+
+# Slotted response records for /mentions - cheaper to construct than per-row
+# dicts, and orjson serializes dataclasses natively at the C level with the
+# field order below as the JSON key order
+@dataclass(slots=True)
+class _AuthorOut:
+    name: Optional[str]
+    avatar_url: Optional[str]
+    profile_url: Optional[str]
+
+
+@dataclass(slots=True)
+class _MentionMetaOut:
+    processed_date: Optional[datetime]
+    source_url: Optional[str]
+    external_id: Optional[str]
+
+
+@dataclass(slots=True)
+class _MentionOut:
+    id: int
+    platform: Optional[str]
+    author: _AuthorOut
+    content: Optional[str]
+    sentiment: Optional[str]
+    intent: Optional[str]
+    priority: Optional[str]
+    date: Optional[datetime]
+    rating: Optional[float]
+    confidence_score: Optional[float]
+    keywords_matched: Optional[list]
+    topics: Optional[list]
+    response_suggested: Optional[str]
+    is_marked: bool
+    metadata: _MentionMetaOut
 
 
 @app.get("/mentions")
@@ -428,10 +1024,10 @@ def get_mentions(
     intent: Optional[str] = None,
     priority: Optional[str] = None,
     is_marked: Optional[bool] = None,
-    from_date: Optional[str] = None,
-    to_date: Optional[str] = None,
+    dates: MentionDateFilter = Depends(),
     page: int = 1,
     page_size: int = 10,
+    cursor: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -448,6 +1044,8 @@ def get_mentions(
     - to_date: Filter mentions up to this date (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
     - page: Page number (starts from 1)
     - page_size: Number of items per page (max 100)
+    - cursor: Keyset cursor (id of the last mention on the previous page);
+      when provided, replaces page/offset and skips the COUNT query
     """
     # Validate pagination parameters
     if page < 1:
@@ -455,106 +1053,110 @@ def get_mentions(
     if page_size < 1 or page_size > 100:
         raise HTTPException(status_code=400, detail="Page size must be between 1 and 100")
 
-    # Parse and validate date parameters
-    parsed_from_date = None
-    parsed_to_date = None
-
-    if from_date:
-        try:
-            # Support both date and datetime formats
-            if 'T' in from_date:
-                parsed_from_date = datetime.fromisoformat(from_date.replace('Z', '+00:00'))
-            else:
-                parsed_from_date = datetime.fromisoformat(from_date + 'T00:00:00')
-        except ValueError:
-            raise HTTPException(status_code=400,
-                                detail="Invalid from_date format. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS")
-
-    if to_date:
-        try:
-            # Support both date and datetime formats
-            if 'T' in to_date:
-                parsed_to_date = datetime.fromisoformat(to_date.replace('Z', '+00:00'))
-            else:
-                parsed_to_date = datetime.fromisoformat(to_date + 'T23:59:59')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid to_date format. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS")
-
-    # Validate date range
-    if parsed_from_date and parsed_to_date and parsed_from_date > parsed_to_date:
-        raise HTTPException(status_code=400, detail="from_date must be before or equal to to_date")
-
-    # Build query with filters
-    query = db.query(UserMention)
+    # Build a Core column select - plain tuples skip ORM object construction
+    # and identity-map bookkeeping for every row on the page
+    query = select(
+        UserMention.id,
+        UserMention.platform,
+        UserMention.author_name,
+        UserMention.author_avatar_url,
+        UserMention.author_profile_url,
+        UserMention.content,
+        UserMention.sentiment,
+        UserMention.intent,
+        UserMention.priority,
+        UserMention.original_date,
+        UserMention.rating,
+        UserMention.confidence_score,
+        UserMention.keywords_matched,
+        UserMention.topics,
+        UserMention.response_suggested,
+        UserMention.is_marked,
+        UserMention.processed_date,
+        UserMention.source_url,
+        UserMention.external_id
+    )
 
     if product_id:
-        query = query.filter(UserMention.product_id == product_id)
+        query = query.where(UserMention.product_id == product_id)
     if platform and len(platform) > 0:
-        query = query.filter(UserMention.platform == platform)
+        query = query.where(UserMention.platform == platform)
     if sentiment:
-        query = query.filter(UserMention.sentiment == sentiment)
+        query = query.where(UserMention.sentiment == sentiment)
     if intent:
-        query = query.filter(UserMention.intent == intent)
+        query = query.where(UserMention.intent == intent)
     if priority:
-        query = query.filter(UserMention.priority == priority)
+        query = query.where(UserMention.priority == priority)
     if is_marked is not None:
-        query = query.filter(UserMention.is_marked == is_marked)
-    if parsed_from_date:
-        query = query.filter(UserMention.original_date >= parsed_from_date)
-    if parsed_to_date:
-        query = query.filter(UserMention.original_date <= parsed_to_date)
-
-    # Get total count for pagination
-    total_count = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    mentions = query.offset(offset).limit(page_size).all()
-
-    # Calculate pagination metadata
-    total_pages = (total_count + page_size - 1) // page_size
-    has_next = page < total_pages
-    has_prev = page > 1
+        query = query.where(UserMention.is_marked == is_marked)
+    if dates.from_date:
+        query = query.where(UserMention.original_date >= dates.from_date)
+    if dates.to_date:
+        query = query.where(UserMention.original_date <= dates.to_date)
+
+    # Deterministic order so pages never overlap or skip rows between requests;
+    # newest mentions first matches how the dashboard consumes the feed
+    query = query.order_by(UserMention.id.desc())
+
+    if cursor is not None:
+        # Keyset pagination: seek directly to rows past the cursor instead of
+        # counting and discarding OFFSET rows on every deep page
+        rows = db.execute(
+            query.where(UserMention.id < cursor).limit(page_size)
+        ).all()
+        next_cursor = rows[-1].id if len(rows) == page_size else None
+        pagination = {
+            "page_size": page_size,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None
+        }
+    else:
+        # Cheap count: reuse the filtered select with a single COUNT(*) column
+        # instead of wrapping the full row query in a subquery
+        total_count = db.scalar(query.with_only_columns(func.count()).order_by(None))
 
-    # Format response
-    mentions_data = []
-    for mention in mentions:
-        mentions_data.append({
-            "id": mention.id,
-            "platform": mention.platform,
-            "author": {
-                "name": mention.author_name,
-                "avatar_url": mention.author_avatar_url,
-                "profile_url": mention.author_profile_url
-            },
-            "content": mention.content,
-            "sentiment": mention.sentiment,
-            "intent": mention.intent,
-            "priority": mention.priority,
-            "date": mention.original_date,
-            "rating": mention.rating,
-            "confidence_score": mention.confidence_score,
-            "keywords_matched": mention.keywords_matched,
-            "topics": mention.topics,
-            "response_suggested": mention.response_suggested,
-            "is_marked": mention.is_marked or False,
-            "metadata": {
-                "processed_date": mention.processed_date,
-                "source_url": mention.source_url,
-                "external_id": mention.external_id
-            }
-        })
+        # Apply pagination
+        offset = (page - 1) * page_size
+        rows = db.execute(query.offset(offset).limit(page_size)).all()
 
-    return {
-        "mentions": mentions_data,
-        "pagination": {
+        # Calculate pagination metadata
+        total_pages = (total_count + page_size - 1) // page_size
+        pagination = {
             "current_page": page,
             "page_size": page_size,
             "total_items": total_count,
             "total_pages": total_pages,
-            "has_next": has_next,
-            "has_prev": has_prev
-        },
+            "has_next": page < total_pages,
+            "has_prev": page > 1,
+            "next_cursor": rows[-1].id if len(rows) == page_size else None
+        }
+
+    # Format response
+    mentions_data = [
+        _MentionOut(
+            row.id,
+            row.platform,
+            _AuthorOut(row.author_name, row.author_avatar_url, row.author_profile_url),
+            row.content,
+            row.sentiment,
+            row.intent,
+            row.priority,
+            row.original_date,
+            row.rating,
+            row.confidence_score,
+            row.keywords_matched,
+            row.topics,
+            row.response_suggested,
+            row.is_marked or False,
+            _MentionMetaOut(row.processed_date, row.source_url, row.external_id)
+        )
+        for row in rows
+    ]
+
+    return ORJSONResponse({
+        "mentions": mentions_data,
+        "pagination": pagination,
         "filters_applied": {
             "product_id": product_id,
             "platform": platform,
@@ -562,8 +1164,8 @@ def get_mentions(
             "intent": intent,
             "priority": priority,
             "is_marked": is_marked,
-            "from_date": from_date,
-            "to_date": to_date
+            "from_date": dates.from_date,
+            "to_date": dates.to_date
         },
         "available_filters": {
             "platforms": ["App Store", "Reddit", "Instagram", "Google Serp", "Quora", "Google Play", "Trustpilot"],
@@ -571,7 +1173,7 @@ def get_mentions(
             "intents": ["complaint", "question", "recommendation", "neutral"],
             "priorities": ["critical", "high", "medium", "low"]
         }
-    }
+    })
 
 
 @app.get("/dashboard")
@@ -588,46 +1190,58 @@ def get_dashboard(
     - Reputation score with change percentage
     """
     try:
-        # Build base query
-        query = db.query(UserMention)
+        # Shared filter predicates - the aggregations below run as GROUP BY
+        # queries in the engine instead of materializing every mention row
+        filters = []
         if product_id:
-            query = query.filter(UserMention.product_id == product_id)
+            filters.append(UserMention.product_id == product_id)
 
         # Date range for trends (last 30 days by default)
         start_date = datetime.now() - timedelta(days=days_back)
-        recent_mentions = query.filter(UserMention.original_date >= start_date).all()
-        all_mentions = query.all()
+        recent_filters = filters + [UserMention.original_date >= start_date]
+
+        total_mentions = db.scalar(
+            select(func.count()).select_from(UserMention).where(*filters)
+        ) or 0
+        recent_count = db.scalar(
+            select(func.count()).select_from(UserMention).where(*recent_filters)
+        ) or 0
 
         # 1. TOP ISSUES REQUIRING ATTENTION
         top_issues = _get_top_issues_requiring_attention(db, product_id, limit=10)
 
-        # 2. SENTIMENT DISTRIBUTION 
-        sentiment_distribution = _get_sentiment_distribution(all_mentions)
+        # 2. SENTIMENT DISTRIBUTION
+        sentiment_rows = db.execute(
+            select(UserMention.sentiment, func.count())
+            .where(*filters)
+            .group_by(UserMention.sentiment)
+        ).all()
+        sentiment_distribution = _get_sentiment_distribution(sentiment_rows)
 
         # 3. SENTIMENT TREND (last 30 days)
-        sentiment_trend = _get_sentiment_trend(recent_mentions, days_back)
+        trend_rows = db.execute(
+            select(func.date(UserMention.original_date), UserMention.sentiment, func.count())
+            .where(*recent_filters)
+            .group_by(func.date(UserMention.original_date), UserMention.sentiment)
+        ).all()
+        sentiment_trend = _get_sentiment_trend(trend_rows, days_back)
 
         # 4. REPUTATION SCORE WITH CHANGE
         reputation_metrics = _get_reputation_score_with_change(db, product_id, days_back)
 
-        # 5. ADDITIONAL DASHBOARD METRICS
-        platform_distribution = _get_platform_distribution(all_mentions)
-        priority_breakdown = _get_priority_breakdown(all_mentions)
-        recent_activity = _get_recent_activity_summary(recent_mentions)
-
-        return {
+        return ORJSONResponse({
             "dashboard_data": {
                 "generated_at": datetime.now().isoformat(),
                 "product_id": product_id,
                 "time_period_days": days_back,
-                "total_mentions": len(all_mentions),
-                "recent_mentions": len(recent_mentions)
+                "total_mentions": total_mentions,
+                "recent_mentions": recent_count
             },
             "top_issues_requiring_attention": top_issues,
             "sentiment_distribution": sentiment_distribution,
             "sentiment_trend": sentiment_trend,
             "reputation_score": reputation_metrics,
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Dashboard generation failed: {str(e)}")
@@ -635,36 +1249,37 @@ def get_dashboard(
 
 def _get_top_issues_requiring_attention(db: Session, product_id: Optional[int], limit: int = 5) -> List[Dict]:
     """Get top issues requiring immediate attention, grouped by issue type with mention counts"""
-    query = db.query(UserMention)
+    # The grouping pass only reads four columns, so fetch those as plain
+    # tuples in fixed-size batches instead of hydrating full ORM entities
+    query = db.query(
+        UserMention.content,
+        UserMention.topics,
+        UserMention.keywords_matched,
+        UserMention.priority
+    )
     if product_id:
         query = query.filter(UserMention.product_id == product_id)
-
-    # Get all mentions with priority critical, high, or medium + complaint
     priority_mentions = query.filter(
         UserMention.priority.in_(["critical", "high", "medium"])
-    ).all()
+    ).yield_per(1000)
 
-    # Group mentions by topics and keywords to identify common issues
+    # Group mentions by topics and keywords to identify common issues - only
+    # the counters are kept, the rows themselves are never needed again
     issue_groups = {}
 
-    for mention in priority_mentions:
-        # Extract key issues from topics and keywords
-        topics = mention.topics or []
-        keywords = mention.keywords_matched or []
-
+    for content, topics, keywords, priority in priority_mentions:
         # Determine issue category based on content analysis
-        issue_category = _categorize_issue(mention.content, topics, keywords)
+        issue_category = _categorize_issue(content, topics or [], keywords or [])
 
-        if issue_category not in issue_groups:
-            issue_groups[issue_category] = {
-                "mentions": [],
+        group = issue_groups.get(issue_category)
+        if group is None:
+            group = issue_groups[issue_category] = {
                 "priority_counts": {"critical": 0, "high": 0, "medium": 0},
                 "total_mentions": 0
             }
 
-        issue_groups[issue_category]["mentions"].append(mention)
-        issue_groups[issue_category]["priority_counts"][mention.priority] += 1
-        issue_groups[issue_category]["total_mentions"] += 1
+        group["priority_counts"][priority] += 1
+        group["total_mentions"] += 1
 
     # Convert to list and sort by severity (critical count, then high count, then total)
     issues_list = []
@@ -677,12 +1292,8 @@ def _get_top_issues_requiring_attention(db: Session, product_id: Optional[int],
         else:
             group_priority = "medium"
 
-        # Get representative mention for description
-        representative_mention = max(data["mentions"], key=lambda m:
-        {"critical": 3, "high": 2, "medium": 1}.get(m.priority, 0))
-
         # Generate issue title and description
-        issue_title, issue_description = _generate_issue_title_and_description(issue_category, data["mentions"])
+        issue_title, issue_description = _generate_issue_title_and_description(issue_category)
 
         issues_list.append({
             "issue_category": issue_category,
@@ -701,116 +1312,132 @@ def _get_top_issues_requiring_attention(db: Session, product_id: Optional[int],
     return issues_list[:limit]
 
 
-def _categorize_issue(content: str, topics: List[str], keywords: List[str]) -> str:
-    """Categorize the issue based on content, topics, and keywords"""
-    content_lower = content.lower()
+# Issue categories with their identifying patterns - declared once at import
+_ISSUE_PATTERNS = {
+    "App Crashing/Technical Issues": [
+        "crash", "bug", "error", "broken", "not working", "glitch", "freeze",
+        "technical", "loading", "slow", "lag", "performance"
+    ],
+    "Payment Processing Issues": [
+        "payment", "billing", "charge", "card", "money", "transaction",
+        "refund", "charged twice", "payment failed", "billing issue"
+    ],
+    "Customer Service Problems": [
+        "support", "customer service", "help", "response", "contact",
+        "terrible service", "poor service", "no help", "rude"
+    ],
+    "Driver/Service Quality": [
+        "driver", "late", "rude driver", "car dirty", "unprofessional",
+        "bad experience", "service quality", "ride quality"
+    ],
+    "App Navigation/UI Issues": [
+        "confusing", "hard to use", "interface", "navigation", "ui",
+        "user experience", "design", "layout", "difficult"
+    ],
+    "Feature Requests/Missing Features": [
+        "feature", "request", "missing", "need", "should add", "would like",
+        "improvement", "suggestion", "enhance"
+    ],
+    "Pricing/Cost Concerns": [
+        "expensive", "price", "cost", "fare", "cheap", "overcharge",
+        "pricing", "surge", "fee"
+    ]
+}
+
+# Precompiled matcher per category: one alternation regex scans the content
+# in a single C-level pass instead of ~10 substring searches, and a frozenset
+# gives O(1) keyword membership. Category order is preserved.
+_ISSUE_MATCHERS = tuple(
+    (
+        category,
+        re.compile("|".join(re.escape(p) for p in patterns)),
+        frozenset(patterns)
+    )
+    for category, patterns in _ISSUE_PATTERNS.items()
+)
 
-    # Define issue categories with their identifying patterns
-    issue_patterns = {
-        "App Crashing/Technical Issues": [
-            "crash", "bug", "error", "broken", "not working", "glitch", "freeze",
-            "technical", "loading", "slow", "lag", "performance"
-        ],
-        "Payment Processing Issues": [
-            "payment", "billing", "charge", "card", "money", "transaction",
-            "refund", "charged twice", "payment failed", "billing issue"
-        ],
-        "Customer Service Problems": [
-            "support", "customer service", "help", "response", "contact",
-            "terrible service", "poor service", "no help", "rude"
-        ],
-        "Driver/Service Quality": [
-            "driver", "late", "rude driver", "car dirty", "unprofessional",
-            "bad experience", "service quality", "ride quality"
-        ],
-        "App Navigation/UI Issues": [
-            "confusing", "hard to use", "interface", "navigation", "ui",
-            "user experience", "design", "layout", "difficult"
-        ],
-        "Feature Requests/Missing Features": [
-            "feature", "request", "missing", "need", "should add", "would like",
-            "improvement", "suggestion", "enhance"
-        ],
-        "Pricing/Cost Concerns": [
-            "expensive", "price", "cost", "fare", "cheap", "overcharge",
-            "pricing", "surge", "fee"
-        ]
-    }
+_TOPIC_MATCHES = {
+    "bugs": "App Crashing/Technical Issues",
+    "performance": "App Crashing/Technical Issues",
+    "customer_service": "Customer Service Problems",
+    "pricing": "Pricing/Cost Concerns",
+    "usability": "App Navigation/UI Issues",
+    "features": "Feature Requests/Missing Features"
+}
 
-    # Check topics first
-    topic_matches = {
-        "bugs": "App Crashing/Technical Issues",
-        "performance": "App Crashing/Technical Issues",
-        "customer_service": "Customer Service Problems",
-        "pricing": "Pricing/Cost Concerns",
-        "usability": "App Navigation/UI Issues",
-        "features": "Feature Requests/Missing Features"
-    }
 
+def _categorize_issue(content: str, topics: List[str], keywords: List[str]) -> str:
+    """Categorize the issue based on content, topics, and keywords"""
+    # Check topics first
     for topic in topics:
-        if topic in topic_matches:
-            return topic_matches[topic]
+        if topic in _TOPIC_MATCHES:
+            return _TOPIC_MATCHES[topic]
+
+    content_lower = content.lower()
+    keywords_lower = [keyword.lower() for keyword in keywords]
 
     # Check keywords and content
-    for category, patterns in issue_patterns.items():
-        if any(pattern in content_lower for pattern in patterns):
+    for category, pattern_re, pattern_set in _ISSUE_MATCHERS:
+        if pattern_re.search(content_lower):
             return category
-        if any(keyword.lower() in patterns for keyword in keywords):
+        if any(keyword in pattern_set for keyword in keywords_lower):
             return category
 
     # Default category
     return "General Issues"
 
 
-def _generate_issue_title_and_description(category: str, mentions: List) -> tuple:
+_ISSUE_TITLES_DESCRIPTIONS = MappingProxyType({
+    "App Crashing/Technical Issues": (
+        "App Crashing/Technical Problems",
+        "Users reporting crashes, bugs, and technical difficulties"
+    ),
+    "Payment Processing Issues": (
+        "Payment Processing Problems",
+        "Multiple payment failures and billing issues reported"
+    ),
+    "Customer Service Problems": (
+        "Customer Support Issues",
+        "Users experiencing poor customer service response"
+    ),
+    "Driver/Service Quality": (
+        "Service Quality Concerns",
+        "Issues with driver behavior and ride experience"
+    ),
+    "App Navigation/UI Issues": (
+        "User Interface Problems",
+        "Navigation and usability difficulties reported"
+    ),
+    "Feature Requests/Missing Features": (
+        "Missing Feature Requests",
+        "Users requesting additional functionality"
+    ),
+    "Pricing/Cost Concerns": (
+        "Pricing and Cost Issues",
+        "Users concerned about pricing and fees"
+    ),
+    "General Issues": (
+        "General Concerns",
+        "Various user concerns and feedback"
+    )
+})
+
+
+def _generate_issue_title_and_description(category: str) -> tuple:
     """Generate a title and description for the issue category"""
-    titles_descriptions = {
-        "App Crashing/Technical Issues": (
-            "App Crashing/Technical Problems",
-            "Users reporting crashes, bugs, and technical difficulties"
-        ),
-        "Payment Processing Issues": (
-            "Payment Processing Problems",
-            "Multiple payment failures and billing issues reported"
-        ),
-        "Customer Service Problems": (
-            "Customer Support Issues",
-            "Users experiencing poor customer service response"
-        ),
-        "Driver/Service Quality": (
-            "Service Quality Concerns",
-            "Issues with driver behavior and ride experience"
-        ),
-        "App Navigation/UI Issues": (
-            "User Interface Problems",
-            "Navigation and usability difficulties reported"
-        ),
-        "Feature Requests/Missing Features": (
-            "Missing Feature Requests",
-            "Users requesting additional functionality"
-        ),
-        "Pricing/Cost Concerns": (
-            "Pricing and Cost Issues",
-            "Users concerned about pricing and fees"
-        ),
-        "General Issues": (
-            "General Concerns",
-            "Various user concerns and feedback"
-        )
-    }
-
-    return titles_descriptions.get(category, (category, f"Issues related to {category.lower()}"))
+    return _ISSUE_TITLES_DESCRIPTIONS.get(category, (category, f"Issues related to {category.lower()}"))
 
 
-def _get_sentiment_distribution(mentions: List[UserMention]) -> Dict:
-    """Calculate sentiment distribution across all mentions"""
+def _get_sentiment_distribution(sentiment_rows: List) -> Dict:
+    """Calculate sentiment distribution from (sentiment, count) GROUP BY rows"""
     sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-    total_mentions = len(mentions)
 
-    for mention in mentions:
-        sentiment = mention.sentiment or "neutral"
+    for sentiment, count in sentiment_rows:
+        sentiment = sentiment or "neutral"
         if sentiment in sentiment_counts:
-            sentiment_counts[sentiment] += 1
+            sentiment_counts[sentiment] += count
+
+    total_mentions = sum(sentiment_counts.values())
 
     # Calculate percentages
     sentiment_percentages = {}
@@ -822,51 +1449,74 @@ def _get_sentiment_distribution(mentions: List[UserMention]) -> Dict:
         "counts": sentiment_counts,
         "percentages": sentiment_percentages,
         "total_mentions": total_mentions,
-        "dominant_sentiment": max(sentiment_counts.keys(),
-                                  key=lambda k: sentiment_counts[k]) if total_mentions > 0 else "neutral"
+        "dominant_sentiment": Counter(sentiment_counts).most_common(1)[0][0] if total_mentions > 0 else "neutral"
     }
 
 
-def _get_sentiment_trend(mentions: List[UserMention], days_back: int) -> List[Dict]:
-    """Calculate daily sentiment trend over the specified period"""
-    from collections import defaultdict
-
+def _get_sentiment_trend(trend_rows: List, days_back: int) -> List[Dict]:
+    """Calculate daily sentiment trend from (day, sentiment, count) GROUP BY rows"""
     # Initialize date range
     end_date = datetime.now().date()
     start_date = end_date - timedelta(days=days_back)
+    n_days = days_back + 1
+
+    # Bucket the grouped rows into a (days x sentiments) count matrix with one
+    # bincount over a combined day/sentiment code, then do the totals/ratios
+    # as vectorized reductions instead of per-day dict math. func.date yields
+    # 'YYYY-MM-DD' strings on SQLite and date objects on Postgres, so
+    # normalize via str()
+    counts = np.zeros((n_days, 3), dtype=np.int64)
+    rows = [
+        (str(day)[:10], sentiment or "neutral", count)
+        for day, sentiment, count in trend_rows
+        if day is not None
+    ]
+    if rows:
+        day_idx = (
+            np.array([r[0] for r in rows], dtype="datetime64[D]")
+            - np.datetime64(start_date, "D")
+        ).astype(np.int64)
+        sentiments = np.array([r[1] for r in rows])
+        weights = np.array([r[2] for r in rows], dtype=np.int64)
+        sent_code = np.where(sentiments == "positive", 0,
+                             np.where(sentiments == "negative", 1, 2))
+        in_range = (day_idx >= 0) & (day_idx < n_days)
+        counts = np.bincount(
+            (day_idx[in_range] * 3 + sent_code[in_range]),
+            weights=weights[in_range],
+            minlength=n_days * 3
+        ).astype(np.int64).reshape(n_days, 3)
+
+    totals = counts.sum(axis=1)
+    safe_totals = np.where(totals > 0, totals, 1)
+    ratios = np.round(counts / safe_totals[:, None] * 100, 1)
+    ratios[totals == 0] = 0
+
+    # Convert to Python scalars once, then assemble the per-day dicts against
+    # a date axis built in one C call rather than repeated timedelta addition
+    dates = np.arange(
+        np.datetime64(start_date, "D"),
+        np.datetime64(start_date, "D") + n_days
+    ).astype(str).tolist()
+    counts_list = counts.tolist()
+    totals_list = totals.tolist()
+    ratios_list = ratios.tolist()
 
-    # Group mentions by date
-    daily_sentiments = defaultdict(lambda: {"positive": 0, "negative": 0, "neutral": 0})
-
-    for mention in mentions:
-        if mention.original_date:
-            mention_date = mention.original_date.date()
-            sentiment = mention.sentiment or "neutral"
-            if sentiment in daily_sentiments[mention_date]:
-                daily_sentiments[mention_date][sentiment] += 1
-
-    # Create trend data for each day
-    trend_data = []
-    current_date = start_date
-    while current_date <= end_date:
-        day_data = daily_sentiments[current_date]
-        total_day = sum(day_data.values())
-
-        trend_data.append({
-            "date": current_date.isoformat(),
-            "positive": day_data["positive"],
-            "negative": day_data["negative"],
-            "neutral": day_data["neutral"],
-            "total": total_day,
+    return [
+        {
+            "date": day,
+            "positive": day_counts[0],
+            "negative": day_counts[1],
+            "neutral": day_counts[2],
+            "total": day_total,
             "sentiment_ratio": {
-                "positive": round(day_data["positive"] / total_day * 100, 1) if total_day > 0 else 0,
-                "negative": round(day_data["negative"] / total_day * 100, 1) if total_day > 0 else 0,
-                "neutral": round(day_data["neutral"] / total_day * 100, 1) if total_day > 0 else 0
+                "positive": day_ratios[0],
+                "negative": day_ratios[1],
+                "neutral": day_ratios[2]
             }
-        })
-        current_date += timedelta(days=1)
-
-    return trend_data
+        }
+        for day, day_counts, day_total, day_ratios in zip(dates, counts_list, totals_list, ratios_list)
+    ]
 
 
 def _get_reputation_score_with_change(db: Session, product_id: Optional[int], days_back: int) -> Dict:
@@ -875,24 +1525,32 @@ def _get_reputation_score_with_change(db: Session, product_id: Optional[int], da
     current_period_start = current_period_end - timedelta(days=days_back)
     previous_period_start = current_period_start - timedelta(days=days_back)
 
-    # Get mentions for current and previous periods
-    query = db.query(UserMention)
-    if product_id:
-        query = query.filter(UserMention.product_id == product_id)
-
-    current_mentions = query.filter(
-        UserMention.original_date >= current_period_start,
-        UserMention.original_date <= current_period_end
-    ).all()
+    # The weighted score only depends on the (sentiment, priority, intent)
+    # combination plus summed confidence, so GROUP BY collapses each period
+    # to a handful of tuples instead of hydrating every mention row
+    def period_groups(start, end, end_exclusive=False):
+        group_query = db.query(
+            UserMention.sentiment,
+            UserMention.priority,
+            UserMention.intent,
+            func.sum(func.coalesce(UserMention.confidence_score, 0.5)),
+            func.count()
+        )
+        if product_id:
+            group_query = group_query.filter(UserMention.product_id == product_id)
+        upper = UserMention.original_date < end if end_exclusive else UserMention.original_date <= end
+        return group_query.filter(
+            UserMention.original_date >= start, upper
+        ).group_by(
+            UserMention.sentiment, UserMention.priority, UserMention.intent
+        ).all()
 
-    previous_mentions = query.filter(
-        UserMention.original_date >= previous_period_start,
-        UserMention.original_date < current_period_start
-    ).all()
+    current_groups = period_groups(current_period_start, current_period_end)
+    previous_groups = period_groups(previous_period_start, current_period_start, end_exclusive=True)
 
     # Calculate scores using weighted sentiment analysis
-    current_score = _calculate_reputation_score(current_mentions)
-    previous_score = _calculate_reputation_score(previous_mentions)
+    current_score = _calculate_reputation_score(current_groups)
+    previous_score = _calculate_reputation_score(previous_groups)
 
     # Calculate percentage change
     percentage_change = 0
@@ -914,56 +1572,41 @@ def _get_reputation_score_with_change(db: Session, product_id: Optional[int], da
         "current_period": {
             "start": current_period_start.isoformat(),
             "end": current_period_end.isoformat(),
-            "mentions_count": len(current_mentions)
+            "mentions_count": sum(group[4] for group in current_groups)
         },
         "previous_period": {
             "start": previous_period_start.isoformat(),
             "end": current_period_start.isoformat(),
-            "mentions_count": len(previous_mentions)
+            "mentions_count": sum(group[4] for group in previous_groups)
         }
     }
 
 
-def _calculate_reputation_score(mentions: List[UserMention]) -> float:
-    """Calculate reputation score (0-100) based on sentiment, priority, and other factors"""
-    if not mentions:
-        return 50.0  # Neutral baseline
-
-    total_weight = 0
-    weighted_score = 0
-
-    for mention in mentions:
-        # Base sentiment score
-        sentiment_score = 50  # Neutral baseline
-        if mention.sentiment == "positive":
-            sentiment_score = 80
-        elif mention.sentiment == "negative":
-            sentiment_score = 20
-
-        # Weight based on priority (higher priority has more impact)
-        priority_weight = 1.0
-        if mention.priority == "critical":
-            priority_weight = 3.0
-        elif mention.priority == "high":
-            priority_weight = 2.0
-        elif mention.priority == "medium":
-            priority_weight = 1.5
-
-        # Weight based on intent
-        intent_modifier = 1.0
-        if mention.intent == "complaint":
-            intent_modifier = 2.0  # Complaints have higher impact
-        elif mention.intent == "recommendation":
-            intent_modifier = 1.5  # Recommendations are valuable
-
-        # Consider confidence score
-        confidence_weight = mention.confidence_score or 0.5
-
-        final_weight = priority_weight * intent_modifier * confidence_weight
-        weighted_score += sentiment_score * final_weight
-        total_weight += final_weight
-
-    # Calculate final score
+# Scoring weights; neutral/unknown values fall back to the baseline via .get
+_SENTIMENT_BASE_SCORES = MappingProxyType({"positive": 80, "negative": 20})
+_PRIORITY_WEIGHTS = MappingProxyType({"critical": 3.0, "high": 2.0, "medium": 1.5})
+_INTENT_MODIFIERS = MappingProxyType({"complaint": 2.0, "recommendation": 1.5})
+
+
+def _calculate_reputation_score(groups: List) -> float:
+    """
+    Calculate reputation score (0-100) from (sentiment, priority, intent,
+    confidence_sum, count) GROUP BY rows - each group's weight is its
+    priority/intent multiplier times the summed confidence of its mentions
+    """
+    total_weight = 0.0
+    weighted_score = 0.0
+
+    for sentiment, priority, intent, confidence_sum, _count in groups:
+        group_weight = (
+            _PRIORITY_WEIGHTS.get(priority, 1.0)
+            * _INTENT_MODIFIERS.get(intent, 1.0)
+            * (confidence_sum or 0.0)
+        )
+        weighted_score += _SENTIMENT_BASE_SCORES.get(sentiment, 50) * group_weight
+        total_weight += group_weight
+
+    # No mentions (or zero total confidence) falls back to the neutral baseline
     final_score = weighted_score / total_weight if total_weight > 0 else 50.0
 
     # Ensure score is within 0-100 range
@@ -972,16 +1615,14 @@ def _calculate_reputation_score(mentions: List[UserMention]) -> float:
 
 def _get_platform_distribution(mentions: List[UserMention]) -> Dict:
     """Get distribution of mentions across platforms"""
-    platform_counts = {}
     total_mentions = len(mentions)
 
-    for mention in mentions:
-        platform = mention.platform or "Unknown"
-        platform_counts[platform] = platform_counts.get(platform, 0) + 1
+    # Counter tallies in C and most_common() returns the sorted distribution
+    platform_counts = Counter(mention.platform or "Unknown" for mention in mentions)
 
-    # Calculate percentages and sort by count
+    # Calculate percentages, sorted by count
     platform_distribution = []
-    for platform, count in sorted(platform_counts.items(), key=lambda x: x[1], reverse=True):
+    for platform, count in platform_counts.most_common():
         percentage = (count / total_mentions * 100) if total_mentions > 0 else 0
         platform_distribution.append({
             "platform": platform,
@@ -997,13 +1638,10 @@ def _get_platform_distribution(mentions: List[UserMention]) -> Dict:
 
 def _get_priority_breakdown(mentions: List[UserMention]) -> Dict:
     """Get breakdown of mentions by priority level"""
-    priority_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
     total_mentions = len(mentions)
 
-    for mention in mentions:
-        priority = mention.priority or "low"
-        if priority in priority_counts:
-            priority_counts[priority] += 1
+    tallied = Counter(mention.priority or "low" for mention in mentions)
+    priority_counts = {level: tallied.get(level, 0) for level in ("critical", "high", "medium", "low")}
 
     # Calculate percentages
     priority_breakdown = []
@@ -1034,22 +1672,12 @@ def _get_recent_activity_summary(mentions: List[UserMention]) -> Dict:
         }
 
     # Most active platform
-    platform_counts = {}
-    intent_counts = {}
-    critical_count = 0
-
-    for mention in mentions:
-        platform = mention.platform or "Unknown"
-        intent = mention.intent or "unknown"
-
-        platform_counts[platform] = platform_counts.get(platform, 0) + 1
-        intent_counts[intent] = intent_counts.get(intent, 0) + 1
+    platform_counts = Counter(mention.platform or "Unknown" for mention in mentions)
+    intent_counts = Counter(mention.intent or "unknown" for mention in mentions)
+    critical_count = sum(1 for mention in mentions if mention.priority in ("critical", "high"))
 
-        if mention.priority in ["critical", "high"]:
-            critical_count += 1
-
-    most_active_platform = max(platform_counts.keys(), key=lambda k: platform_counts[k]) if platform_counts else None
-    most_common_intent = max(intent_counts.keys(), key=lambda k: intent_counts[k]) if intent_counts else None
+    most_active_platform = platform_counts.most_common(1)[0][0] if platform_counts else None
+    most_common_intent = intent_counts.most_common(1)[0][0] if intent_counts else None
 
     # Calculate daily average
     days_span = 30  # Based on the period
@@ -1064,6 +1692,22 @@ def _get_recent_activity_summary(mentions: List[UserMention]) -> Dict:
     }
 
 
+# Computed analytics/alert pages keyed by request args plus a data watermark.
+# Dashboards poll these endpoints with identical arguments far more often than
+# the mention table changes, so one cheap MAX/COUNT query decides whether the
+# cached response is still valid; the TTL is only a safety net
+_analytics_response_cache = TTLCache(maxsize=256, ttl=60)
+_alerts_response_cache = TTLCache(maxsize=256, ttl=60)
+
+
+def _mention_watermark(db: Session, product_id: Optional[int]):
+    """Cheap change marker: (max updated_at, row count) for the product slice"""
+    watermark_query = db.query(func.max(UserMention.updated_at), func.count())
+    if product_id:
+        watermark_query = watermark_query.filter(UserMention.product_id == product_id)
+    return watermark_query.one()
+
+
 @app.get("/analytics")
 def get_analytics(
     product_id: Optional[int] = None,
@@ -1077,69 +1721,97 @@ def get_analytics(
     - Detailed topic analysis with sentiment, trend, and mention counts
     """
     try:
-        # Build base query
-        query = db.query(UserMention)
-        if product_id:
-            query = query.filter(UserMention.product_id == product_id)
+        cache_key = (product_id, days_back, *_mention_watermark(db, product_id))
+        cached = _analytics_response_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Date range for trends
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
-        recent_mentions = query.filter(UserMention.original_date >= start_date).all()
-        all_mentions = query.all()
-
-        # Previous period for trend comparison
         previous_start = start_date - timedelta(days=days_back)
-        previous_mentions = query.filter(
-            UserMention.original_date >= previous_start,
-            UserMention.original_date < start_date
+
+        # Sentiment-by-platform comes straight from a GROUP BY - no reason to
+        # hydrate the whole table into ORM objects just to count it
+        platform_query = db.query(
+            UserMention.platform, UserMention.sentiment, func.count()
+        )
+        if product_id:
+            platform_query = platform_query.filter(UserMention.product_id == product_id)
+        platform_rows = platform_query.group_by(
+            UserMention.platform, UserMention.sentiment
         ).all()
+        total_mentions = sum(count for _, _, count in platform_rows)
+
+        # The topic scans need the text fields, so select only those columns
+        # as plain tuples instead of full ORM entities
+        columns = db.query(
+            UserMention.content,
+            UserMention.topics,
+            UserMention.keywords_matched,
+            UserMention.sentiment
+        )
+        if product_id:
+            columns = columns.filter(UserMention.product_id == product_id)
+        # Stream the tuples in batches and keep only the prepared form: the
+        # content gets lowered and the label lists frozen once per mention,
+        # and the chart and detailed scans below share the prepared tuples
+        recent_prepared = _prepare_mentions_for_matching(
+            columns.filter(UserMention.original_date >= start_date).yield_per(1000)
+        )
+        previous_prepared = _prepare_mentions_for_matching(
+            columns.filter(
+                UserMention.original_date >= previous_start,
+                UserMention.original_date < start_date
+            ).yield_per(1000)
+        )
 
         # 1. SENTIMENT BY PLATFORM
-        sentiment_by_platform = _get_sentiment_by_platform(all_mentions)
+        sentiment_by_platform = _get_sentiment_by_platform(platform_rows)
 
         # 2. TOPIC ANALYSIS (for radar chart)
-        topic_analysis_chart = _get_topic_analysis_chart(recent_mentions)
+        topic_analysis_chart = _get_topic_analysis_chart(recent_prepared)
 
         # 3. DETAILED TOPIC ANALYSIS
-        detailed_topic_analysis = _get_detailed_topic_analysis(recent_mentions, previous_mentions)
+        detailed_topic_analysis = _get_detailed_topic_analysis(recent_prepared, previous_prepared)
 
-        return {
+        response = {
             "analytics_data": {
                 "generated_at": datetime.now().isoformat(),
                 "product_id": product_id,
                 "time_period_days": days_back,
-                "total_mentions": len(all_mentions),
-                "recent_mentions": len(recent_mentions),
-                "previous_period_mentions": len(previous_mentions)
+                "total_mentions": total_mentions,
+                "recent_mentions": len(recent_prepared),
+                "previous_period_mentions": len(previous_prepared)
             },
             "sentiment_by_platform": sentiment_by_platform,
             "topic_analysis": topic_analysis_chart,
             "detailed_topic_analysis": detailed_topic_analysis
         }
+        _analytics_response_cache[cache_key] = response
+        return response
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analytics generation failed: {str(e)}")
 
 
-def _get_sentiment_by_platform(mentions: List[UserMention]) -> Dict:
-    """Get sentiment distribution grouped by platform"""
+def _get_sentiment_by_platform(platform_rows: List) -> Dict:
+    """Get sentiment distribution from (platform, sentiment, count) GROUP BY rows"""
     platform_sentiment = {}
 
-    for mention in mentions:
-        platform = mention.platform or "Unknown"
-        sentiment = mention.sentiment or "neutral"
+    for platform, sentiment, count in platform_rows:
+        platform = platform or "Unknown"
+        sentiment = sentiment or "neutral"
 
-        if platform not in platform_sentiment:
-            platform_sentiment[platform] = {
-                "positive": 0,
-                "negative": 0,
-                "neutral": 0,
-                "total": 0
-            }
-
-        platform_sentiment[platform][sentiment] += 1
-        platform_sentiment[platform]["total"] += 1
+        bucket = platform_sentiment.setdefault(platform, {
+            "positive": 0,
+            "negative": 0,
+            "neutral": 0,
+            "total": 0
+        })
+        if sentiment in bucket:
+            bucket[sentiment] += count
+        bucket["total"] += count
 
     # Calculate percentages
     result = []
@@ -1166,42 +1838,99 @@ def _get_sentiment_by_platform(mentions: List[UserMention]) -> Dict:
     return {
         "platforms": result,
         "total_platforms": len(result),
-        "overall_sentiment": _calculate_overall_sentiment(
-            [m for platform in platform_sentiment.values() for m in [platform]])
+        "overall_sentiment": _calculate_overall_sentiment(list(platform_sentiment.values()))
     }
 
 
-def _get_topic_analysis_chart(mentions: List[UserMention]) -> Dict:
-    """Generate topic analysis data for radar/spider chart visualization"""
+# Topic categories for the radar chart and the detailed breakdown
+_CHART_TOPIC_CATEGORIES = MappingProxyType({
+    "Performance": ("performance", "speed", "slow", "fast", "loading", "lag", "optimization"),
+    "Features": ("features", "functionality", "feature", "capability", "missing", "request"),
+    "Support": ("support", "customer service", "help", "assistance", "response"),
+    "Pricing": ("price", "cost", "expensive", "cheap", "pricing", "fee", "billing"),
+    "UI/UX": ("ui", "ux", "interface", "design", "usability", "navigation", "user experience"),
+    "Bugs": ("bug", "error", "crash", "broken", "issue", "problem", "glitch"),
+    "Security": ("security", "privacy", "safe", "secure", "protection", "data")
+})
+
+_DETAILED_TOPIC_CATEGORIES = MappingProxyType({
+    "Performance": ("performance", "speed", "slow", "fast", "loading", "lag", "optimization"),
+    "Features": ("features", "functionality", "feature", "capability", "missing", "request"),
+    "Customer Support": ("support", "customer service", "help", "assistance", "response"),
+    "Pricing": ("price", "cost", "expensive", "cheap", "pricing", "fee", "billing"),
+    "User Interface": ("ui", "ux", "interface", "design", "usability", "navigation"),
+    "Bugs & Issues": ("bug", "error", "crash", "broken", "issue", "problem", "glitch"),
+    "Security": ("security", "privacy", "safe", "secure", "protection", "data"),
+    "Payment System": ("payment", "billing", "charge", "card", "transaction", "refund"),
+    "Driver Quality": ("driver", "service quality", "ride", "professional", "behavior"),
+    "App Reliability": ("reliable", "stability", "consistent", "available", "uptime")
+})
+
+
+def _compile_topic_matchers(categories):
+    """
+    Precompile one alternation pattern plus a keyword frozenset per category:
+    each mention's content gets a single C-level scan per category and the
+    topics/keywords lists become set intersections instead of nested any()
+    loops. Word boundaries keep short keywords like 'ui' or 'lag' from firing
+    on unrelated substrings
+    """
+    return MappingProxyType({
+        category: (
+            re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b"),
+            frozenset(keywords)
+        )
+        for category, keywords in categories.items()
+    })
+
+
+_CHART_TOPIC_MATCHERS = _compile_topic_matchers(_CHART_TOPIC_CATEGORIES)
+_DETAILED_TOPIC_MATCHERS = _compile_topic_matchers(_DETAILED_TOPIC_CATEGORIES)
+
 
-    # Define topic categories based on the chart image
-    topic_categories = {
-        "Performance": ["performance", "speed", "slow", "fast", "loading", "lag", "optimization"],
-        "Features": ["features", "functionality", "feature", "capability", "missing", "request"],
-        "Support": ["support", "customer service", "help", "assistance", "response"],
-        "Pricing": ["price", "cost", "expensive", "cheap", "pricing", "fee", "billing"],
-        "UI/UX": ["ui", "ux", "interface", "design", "usability", "navigation", "user experience"],
-        "Bugs": ["bug", "error", "crash", "broken", "issue", "problem", "glitch"],
-        "Security": ["security", "privacy", "safe", "secure", "protection", "data"]
+def _prepare_mentions_for_matching(mentions: List) -> List[tuple]:
+    """
+    Normalize each mention into (content_lower, topics_set, keywords_set,
+    sentiment) once, so every category check reuses the lowered string and
+    frozensets instead of rebuilding them per category
+    """
+    return [
+        (
+            (mention.content or "").lower(),
+            frozenset(mention.topics or ()),
+            frozenset(mention.keywords_matched or ()),
+            mention.sentiment or "neutral"
+        )
+        for mention in mentions
+    ]
+
+
+def _match_topic_categories(content_lower: str, topics: frozenset, keywords_matched: frozenset, matchers) -> set:
+    """Return every category whose keywords hit the content, topics or keywords"""
+    # isdisjoint short-circuits on the first shared element without building
+    # an intersection set
+    return {
+        category
+        for category, (pattern, keyword_set) in matchers.items()
+        if pattern.search(content_lower)
+        or not keyword_set.isdisjoint(topics)
+        or not keyword_set.isdisjoint(keywords_matched)
     }
 
-    # Count mentions for each topic category
-    topic_scores = {}
-    total_mentions = len(mentions)
 
-    for category, keywords in topic_categories.items():
-        count = 0
-        for mention in mentions:
-            content_lower = (mention.content or "").lower()
-            topics = mention.topics or []
-            keywords_matched = mention.keywords_matched or []
+def _get_topic_analysis_chart(prepared_mentions: List[tuple]) -> Dict:
+    """Generate topic analysis data for radar/spider chart visualization"""
+    # One pass over the prepared mentions, matching all categories per mention
+    topic_counts = dict.fromkeys(_CHART_TOPIC_CATEGORIES, 0)
+    total_mentions = len(prepared_mentions)
 
-            # Check if any keywords match in content, topics, or keywords_matched
-            if (any(keyword in content_lower for keyword in keywords) or
-                any(keyword in topics for keyword in keywords) or
-                any(keyword in keywords_matched for keyword in keywords)):
-                count += 1
+    for content_lower, topics, keywords_matched, _sentiment in prepared_mentions:
+        matched = _match_topic_categories(content_lower, topics, keywords_matched, _CHART_TOPIC_MATCHERS)
+        for category in matched:
+            topic_counts[category] += 1
 
+    topic_scores = {}
+    for category, count in topic_counts.items():
         # Calculate score as percentage of total mentions, then scale to 100
         score = (count / total_mentions * 100) if total_mentions > 0 else 0
         topic_scores[category] = {
@@ -1212,8 +1941,8 @@ def _get_topic_analysis_chart(mentions: List[UserMention]) -> Dict:
 
     # Format for radar chart
     chart_data = {
-        "categories": list(topic_categories.keys()),
-        "values": [topic_scores[cat]["score"] for cat in topic_categories.keys()],
+        "categories": list(_CHART_TOPIC_CATEGORIES),
+        "values": [topic_scores[cat]["score"] for cat in _CHART_TOPIC_CATEGORIES],
         "detailed_scores": topic_scores
     }
 
@@ -1225,59 +1954,33 @@ def _get_topic_analysis_chart(mentions: List[UserMention]) -> Dict:
     }
 
 
-def _get_detailed_topic_analysis(current_mentions: List[UserMention], previous_mentions: List[UserMention]) -> List[
-    Dict]:
+def _get_detailed_topic_analysis(current_mentions: List[tuple], previous_mentions: List[tuple]) -> List[Dict]:
     """Generate detailed topic analysis with sentiment, trend, and mention counts"""
-
-    # Define comprehensive topic categories
-    topic_categories = {
-        "Performance": ["performance", "speed", "slow", "fast", "loading", "lag", "optimization"],
-        "Features": ["features", "functionality", "feature", "capability", "missing", "request"],
-        "Customer Support": ["support", "customer service", "help", "assistance", "response"],
-        "Pricing": ["price", "cost", "expensive", "cheap", "pricing", "fee", "billing"],
-        "User Interface": ["ui", "ux", "interface", "design", "usability", "navigation"],
-        "Bugs & Issues": ["bug", "error", "crash", "broken", "issue", "problem", "glitch"],
-        "Security": ["security", "privacy", "safe", "secure", "protection", "data"],
-        "Payment System": ["payment", "billing", "charge", "card", "transaction", "refund"],
-        "Driver Quality": ["driver", "service quality", "ride", "professional", "behavior"],
-        "App Reliability": ["reliable", "stability", "consistent", "available", "uptime"]
-    }
+    # Fused pass: classify each prepared mention once against all categories
+    # and accumulate the per-topic sentiment counters in the same traversal,
+    # instead of rescanning both mention lists once per topic
+    current_sentiments = {topic: {"positive": 0, "negative": 0, "neutral": 0} for topic in _DETAILED_TOPIC_CATEGORIES}
+    current_totals = dict.fromkeys(_DETAILED_TOPIC_CATEGORIES, 0)
+    previous_totals = dict.fromkeys(_DETAILED_TOPIC_CATEGORIES, 0)
+
+    for content_lower, topics, keywords_matched, sentiment in current_mentions:
+        matched = _match_topic_categories(content_lower, topics, keywords_matched, _DETAILED_TOPIC_MATCHERS)
+        for topic in matched:
+            current_totals[topic] += 1
+            if sentiment in current_sentiments[topic]:
+                current_sentiments[topic][sentiment] += 1
+
+    for content_lower, topics, keywords_matched, _sentiment in previous_mentions:
+        matched = _match_topic_categories(content_lower, topics, keywords_matched, _DETAILED_TOPIC_MATCHERS)
+        for topic in matched:
+            previous_totals[topic] += 1
 
     detailed_analysis = []
 
-    for topic, keywords in topic_categories.items():
-        # Current period analysis
-        current_topic_mentions = []
-        for mention in current_mentions:
-            content_lower = (mention.content or "").lower()
-            topics = mention.topics or []
-            keywords_matched = mention.keywords_matched or []
-
-            if (any(keyword in content_lower for keyword in keywords) or
-                any(keyword in topics for keyword in keywords) or
-                any(keyword in keywords_matched for keyword in keywords)):
-                current_topic_mentions.append(mention)
-
-        # Previous period analysis
-        previous_topic_mentions = []
-        for mention in previous_mentions:
-            content_lower = (mention.content or "").lower()
-            topics = mention.topics or []
-            keywords_matched = mention.keywords_matched or []
-
-            if (any(keyword in content_lower for keyword in keywords) or
-                any(keyword in topics for keyword in keywords) or
-                any(keyword in keywords_matched for keyword in keywords)):
-                previous_topic_mentions.append(mention)
-
-        # Calculate sentiment distribution
-        sentiment_scores = {"positive": 0, "negative": 0, "neutral": 0}
-        for mention in current_topic_mentions:
-            sentiment = mention.sentiment or "neutral"
-            sentiment_scores[sentiment] += 1
-
-        total_current = len(current_topic_mentions)
-        total_previous = len(previous_topic_mentions)
+    for topic in _DETAILED_TOPIC_CATEGORIES:
+        sentiment_scores = current_sentiments[topic]
+        total_current = current_totals[topic]
+        total_previous = previous_totals[topic]
 
         # Calculate sentiment percentage (negative bias for negative sentiment)
         if total_current > 0:
@@ -1469,47 +2172,78 @@ def get_alerts(
         if page_size < 1 or page_size > 100:
             page_size = 20
 
+        # The updated_at watermark also catches mark/unmark toggles, so a
+        # cached page can never show a stale alert_type
+        cache_key = (product_id, page, page_size, *_mention_watermark(db, product_id))
+        cached = _alerts_response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Build base query
         query = db.query(UserMention)
         if product_id:
             query = query.filter(UserMention.product_id == product_id)
 
-        # Calculate offset for pagination
-        offset = (page - 1) * page_size
+        # Classify in the SELECT itself: the CASE mirrors the old Python
+        # branching (critical conditions win over resolved/high), so rows come
+        # back as lightweight tuples already carrying their alert type
+        alert_type = case(
+            (UserMention.priority == "critical", "critical"),
+            (and_(UserMention.sentiment == "negative", UserMention.confidence_score > 0.8), "critical"),
+            (UserMention.priority == "high", "high_priority"),
+            (UserMention.is_marked == True, "resolved"),
+            else_="active"
+        ).label("alert_type")
+
+        # Page in SQL: the previous code computed an offset but then pulled
+        # every row with .all(), so responses grew with the table and ignored
+        # the page parameters entirely
+        mentions = (
+            query.with_entities(
+                UserMention.id,
+                UserMention.platform,
+                UserMention.author_name,
+                UserMention.content,
+                UserMention.sentiment,
+                UserMention.priority,
+                UserMention.original_date,
+                UserMention.is_marked,
+                UserMention.rating,
+                UserMention.source_url,
+                alert_type,
+                # Window count rides along with the page - no separate
+                # COUNT(*) round-trip over the same filter
+                func.count().over().label("total")
+            )
+            .order_by(desc(UserMention.original_date))
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
 
-        # Get total count of all mentions
-        total_mentions = query.count()
+        total_mentions = mentions[0].total if mentions else 0
         total_pages = (total_mentions + page_size - 1) // page_size if total_mentions > 0 else 1
 
-        # Get paginated mentions ordered by priority and date
-        mentions = query.order_by(desc(UserMention.original_date)).all()
-
         # Convert mentions to response format
         alerts = []
         for mention in mentions:
-            alert_type = "resolved" if mention.is_marked else "active"
-            if mention.priority == "critical" or (
-                mention.sentiment == "negative" and (mention.confidence_score or 0) > 0.8):
-                alert_type = "critical"
-            elif mention.priority == "high":
-                alert_type = "high_priority"
-
+            content = mention.content
             alerts.append({
                 "id": mention.id,
                 "platform": mention.platform,
                 "author_name": mention.author_name,
-                "content": mention.content[:200] + "..." if len(mention.content or "") > 200 else mention.content,
-                "full_content": mention.content,
+                "content": content[:200] + "..." if content and len(content) > 200 else content,
+                "full_content": content,
                 "sentiment": mention.sentiment,
                 "priority": mention.priority,
                 "original_date": mention.original_date.isoformat() if mention.original_date else None,
                 "is_marked": mention.is_marked,
                 "rating": mention.rating,
                 "source_url": mention.source_url,
-                "alert_type": alert_type
+                "alert_type": mention.alert_type
             })
 
-        return {
+        response = {
             "pagination": {
                 "page": page,
                 "page_size": page_size,
@@ -1520,6 +2254,8 @@ def get_alerts(
             },
             "alerts": alerts
         }
+        _alerts_response_cache[cache_key] = response
+        return response
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Alerts generation failed: {str(e)}")
@@ -1544,7 +2280,7 @@ def simulate_alert(
                 product_id=product_id,
                 threshold=0.8,
                 platforms=["Reddit", "app_store", "google_play", "Google Serp"],
-                telegram_bot_enabled=bool(os.getenv("TELEGRAM_BOT_KEY")),
+                telegram_bot_enabled=bool(app.state.settings.telegram_bot_key),
                 email=None
             )
             db.add(alert_settings)
@@ -1552,13 +2288,16 @@ def simulate_alert(
             db.refresh(alert_settings)
 
         # Check if TELEGRAM_BOT_KEY is configured
-        telegram_bot_key = os.getenv("TELEGRAM_BOT_KEY")
+        telegram_bot_key = app.state.settings.telegram_bot_key
         telegram_enabled = alert_settings.telegram_bot_enabled and bool(telegram_bot_key)
 
+        # One timestamp for the whole simulated alert
+        now_iso = datetime.now().isoformat()
+
         # Simulate alert content
         sample_alert = {
             "alert_id": "ALERT_2025_001",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "product_id": product_id,
             "severity": "HIGH",
             "platform": "Reddit",
@@ -1577,14 +2316,14 @@ def simulate_alert(
                     "enabled": telegram_enabled,
                     "status": "SUCCESS" if telegram_enabled else "DISABLED",
                     "message": f"Alert sent to Telegram bot (Key: {'***' + telegram_bot_key[-4:] if telegram_bot_key else 'NOT_CONFIGURED'})" if telegram_enabled else "Telegram bot not configured",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 },
                 "email": {
                     "enabled": bool(alert_settings.email),
                     "status": "SUCCESS" if alert_settings.email else "DISABLED",
                     "recipient": alert_settings.email if alert_settings.email else "Not configured",
                     "message": f"Alert sent to {alert_settings.email}" if alert_settings.email else "Email notifications not configured",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 }
             },
             "alert_settings": {
@@ -1602,172 +2341,217 @@ def simulate_alert(
         raise HTTPException(status_code=500, detail=f"Alert simulation failed: {str(e)}")
 
 
-@app.post("/alerts/send")
-def send_real_alert(
-    product_id: Optional[int] = 1,
-    message: str = "Test alert notification",
-    db: Session = Depends(get_db)
-):
+# Detached snapshot of one AlertSettings row; namedtuple keeps the
+# attribute access the handlers already use
+_AlertSettingsSnapshot = namedtuple("_AlertSettingsSnapshot", [
+    "id", "product_id", "threshold", "platforms", "telegram_bot_enabled",
+    "email", "max_alerts_per_hour", "max_alerts_per_day", "created_at",
+    "updated_at"
+])
+
+_alert_settings_cache = TTLCache(maxsize=1024, ttl=30)
+
+
+def _get_alert_settings(db: Session, product_id: int):
     """
-    Send a REAL alert to both Telegram bot and email.
-    Actually delivers notifications using configured services.
+    Alert settings for a product, cached for 30 seconds.
+
+    Alert delivery and the settings GET look this row up on every call;
+    the snapshot skips the query on repeats and stays valid after the
+    session closes. update_alert_settings invalidates on write.
     """
+    snapshot = _alert_settings_cache.get(product_id)
+    if snapshot is None:
+        settings = db.query(AlertSettings).filter(AlertSettings.product_id == product_id).first()
+        if settings is None:
+            return None
+        snapshot = _AlertSettingsSnapshot(
+            id=settings.id,
+            product_id=settings.product_id,
+            threshold=settings.threshold,
+            platforms=settings.platforms,
+            telegram_bot_enabled=settings.telegram_bot_enabled,
+            email=settings.email,
+            max_alerts_per_hour=settings.max_alerts_per_hour,
+            max_alerts_per_day=settings.max_alerts_per_day,
+            created_at=settings.created_at,
+            updated_at=settings.updated_at
+        )
+        _alert_settings_cache[product_id] = snapshot
+    return snapshot
+
+
+async def _deliver_alert(product_id: Optional[int], message: str) -> Dict:
+    """Deliver one alert over both transports; runs inside the alert executor"""
+    db = SessionLocal()
     try:
         # Get alert settings
-        alert_settings = db.query(AlertSettings).filter(AlertSettings.product_id == product_id).first()
+        alert_settings = _get_alert_settings(db, product_id)
 
         if not alert_settings:
-            raise HTTPException(status_code=404, detail="Alert settings not found. Please configure settings first.")
-
-        telegram_success = False
-        email_success = False
-        telegram_error = None
-        email_error = None
+            # Missing settings are rejected with a 404 at submission; this
+            # only triggers if they were deleted while the job was queued.
+            # Plain exception - there is no HTTP response to attach to here.
+            raise RuntimeError("Alert settings not found. Please configure settings first.")
+
+        # One timestamp per delivery, shared by the Telegram text, the email
+        # body and the response
+        now = datetime.now()
+        now_fmt = now.strftime('%Y-%m-%d %H:%M:%S')
+
+        # Telegram and email are independent downstreams; running the two
+        # branches concurrently means the caller waits for the slower one
+        # instead of the sum of both
+        async def _send_telegram():
+            if not alert_settings.telegram_bot_enabled:
+                return False, "Telegram notifications disabled in settings"
+
+            telegram_bot_key = app.state.settings.telegram_bot_key
+            if not telegram_bot_key:
+                return False, "TELEGRAM_BOT_KEY not configured"
 
-        # Send Telegram notification to all chat IDs
-        if alert_settings.telegram_bot_enabled:
-            telegram_bot_key = os.getenv("TELEGRAM_BOT_KEY")
-
-            if telegram_bot_key:
-                try:
-                    # Get all chat IDs that have interacted with the bot
-                    updates_url = f"https://api.telegram.org/bot{telegram_bot_key}/getUpdates"
-                    updates_response = requests.get(updates_url, timeout=10)
-
-                    if updates_response.status_code == 200:
-                        updates_data = updates_response.json()
-
-                        # Extract unique chat IDs from all messages
-                        chat_ids = set()
-                        for update in updates_data.get("result", []):
-                            if "message" in update:
-                                chat_id = update["message"]["chat"]["id"]
-                                chat_ids.add(chat_id)
-                            elif "callback_query" in update:
-                                chat_id = update["callback_query"]["message"]["chat"]["id"]
-                                chat_ids.add(chat_id)
-
-                        if chat_ids:
-                            send_url = f"https://api.telegram.org/bot{telegram_bot_key}/sendMessage"
-                            alert_text = f"""🚨 <b>Critical Mention Alert</b> 🚨
-
-📌 <b>Platform:</b> Reddit  
-👤 <b>Author:</b> S_EJK  
-🗓️ <b>Date:</b> October 3rd, 2025  
-
-📝 <b>Content:</b>  
-"Uber Credit – disappointing experience. I took an Uber early AM on Oct 1. The credit did not post until later in the morning, so it wasn't applied to my ride. Customer Service refused to credit me. I find the claim misleading and am disappointed they won't apply it."
+            try:
+                # Recipients come from the chat cache the background
+                # poller maintains, so sending an alert no longer pays a
+                # getUpdates round-trip first
+                if not app.state.chat_cache:
+                    await _refresh_chat_cache()
+                chat_ids = set(app.state.chat_cache)
+
+                if not chat_ids:
+                    return False, "No chat IDs found. Users need to start a conversation with the bot first."
+
+                send_url = f"https://api.telegram.org/bot{telegram_bot_key}/sendMessage"
+                # Only the timestamp varies, so append it to the constant
+                # body instead of re-interpolating the whole template
+                alert_text = _ALERT_TEXT_HEAD + now_fmt
+
+                successful_sends = 0
+                failed_sends = 0
+                send_errors = []
+
+                # Fan the sends out concurrently - total latency
+                # collapses to roughly one round-trip instead of
+                # one per chat. The semaphore keeps the burst
+                # under Telegram's ~30 messages/second limit
+                send_gate = asyncio.Semaphore(20)
+
+                async def send_one(chat_id):
+                    payload = {
+                        "chat_id": chat_id,
+                        "text": alert_text,
+                        "parse_mode": "HTML"
+                    }
+                    async with send_gate:
+                        async with app.state.http.post(
+                            send_url, json=payload,
+                            timeout=aiohttp.ClientTimeout(total=10)
+                        ) as response:
+                            if response.status == 200:
+                                # Nothing in the 200 body is used; release
+                                # the connection back to the pool without
+                                # reading it
+                                response.release()
+                                return chat_id, 200, None
+                            return chat_id, response.status, await response.text()
+
+                # Dispatch in batches of 30 with one second
+                # between them so large broadcasts respect
+                # Telegram's 30 messages/second quota while every
+                # send inside a batch still overlaps on the
+                # keep-alive connections
+                ordered_chat_ids = list(chat_ids)
+                results = []
+                for batch_start in range(0, len(ordered_chat_ids), 30):
+                    batch = ordered_chat_ids[batch_start:batch_start + 30]
+                    if batch_start:
+                        await asyncio.sleep(1)
+                    results.extend(await asyncio.gather(
+                        *(send_one(chat_id) for chat_id in batch),
+                        return_exceptions=True
+                    ))
+
+                for chat_id, result in zip(ordered_chat_ids, results):
+                    if isinstance(result, Exception):
+                        failed_sends += 1
+                        send_errors.append(f"Chat {chat_id}: {str(result)}")
+                    elif result[1] == 200:
+                        successful_sends += 1
+                    else:
+                        failed_sends += 1
+                        send_errors.append(f"Chat {chat_id}: {result[2]}")
 
-🔎 <b>Sentiment:</b> Negative  
-🎯 <b>Priority:</b> High  
+                if successful_sends > 0:
+                    if failed_sends > 0:
+                        return True, f"Sent to {successful_sends}/{len(chat_ids)} chats. Failures: {'; '.join(send_errors[:3])}"
+                    return True, f"Successfully sent to all {successful_sends} chats"
+                return False, f"Failed to send to any chats: {'; '.join(send_errors[:3])}"
 
----
-⚡ <b>Recommended Action:</b>  
-- Review Uber Credit posting logic and timing  
-- Escalate case to Support for resolution  
-- Consider PR clarification on the "monthly credit" claim  
-
-⏰ <b>Alert generated at:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
-
-                            successful_sends = 0
-                            failed_sends = 0
-                            send_errors = []
-
-                            # Send to each chat ID
-                            for chat_id in chat_ids:
-                                try:
-                                    payload = {
-                                        "chat_id": chat_id,
-                                        "text": alert_text,
-                                        "parse_mode": "HTML"
-                                    }
-
-                                    response = requests.post(send_url, json=payload, timeout=10)
-
-                                    if response.status_code == 200:
-                                        successful_sends += 1
-                                    else:
-                                        failed_sends += 1
-                                        send_errors.append(f"Chat {chat_id}: {response.text}")
-
-                                except Exception as e:
-                                    failed_sends += 1
-                                    send_errors.append(f"Chat {chat_id}: {str(e)}")
-
-                            if successful_sends > 0:
-                                telegram_success = True
-                                if failed_sends > 0:
-                                    telegram_error = f"Sent to {successful_sends}/{len(chat_ids)} chats. Failures: {'; '.join(send_errors[:3])}"
-                                else:
-                                    telegram_error = f"Successfully sent to all {successful_sends} chats"
-                            else:
-                                telegram_error = f"Failed to send to any chats: {'; '.join(send_errors[:3])}"
-                        else:
-                            telegram_error = "No chat IDs found. Users need to start a conversation with the bot first."
-                    else:
-                        telegram_error = f"Failed to get bot updates: {updates_response.text}"
+            except Exception as e:
+                return False, f"Telegram sending failed: {str(e)}"
 
-                except Exception as e:
-                    telegram_error = f"Telegram sending failed: {str(e)}"
-            else:
-                telegram_error = "TELEGRAM_BOT_KEY not configured"
-        else:
-            telegram_error = "Telegram notifications disabled in settings"
+        async def _send_email():
+            if not alert_settings.email:
+                return False, "Email notifications not configured in settings"
 
-        # Send Email notification
-        if alert_settings.email:
             try:
-                # Email configuration from environment variables
-                smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-                smtp_port = int(os.getenv("SMTP_PORT", "587"))
-                smtp_username = os.getenv("SMTP_USERNAME")
-                smtp_password = os.getenv("SMTP_PASSWORD")
-                from_email = os.getenv("FROM_EMAIL", smtp_username)
-
-                if smtp_username and smtp_password:
-                    # Create email
-                    msg = MIMEMultipart()
-                    msg['From'] = from_email
-                    msg['To'] = alert_settings.email
-                    msg['Subject'] = f"Brand Alert - Product {product_id}"
-
-                    body = f"""
+                # Email configuration parsed once at startup
+                smtp_server = app.state.settings.smtp_server
+                smtp_port = app.state.settings.smtp_port
+                smtp_username = app.state.settings.smtp_username
+                smtp_password = app.state.settings.smtp_password
+                from_email = app.state.settings.from_email
+
+                if not (smtp_username and smtp_password):
+                    return False, "SMTP credentials not configured (SMTP_USERNAME, SMTP_PASSWORD)"
+
+                # Create email - EmailMessage serializes in one pass and
+                # the SMTP policy emits correctly folded wire format
+                msg = EmailMessage(policy=SMTP_POLICY)
+                msg['From'] = from_email
+                msg['To'] = alert_settings.email
+                msg['Subject'] = f"Brand Alert - Product {product_id}"
+
+                body = f"""
 Brand Reputation Alert
 
 Message: {message}
 
 Product ID: {product_id}
-Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Timestamp: {now_fmt}
 Threshold: {alert_settings.threshold}
 Monitored Platforms: {', '.join(alert_settings.platforms)}
 
 This is an automated alert from your Brand Reputation Monitoring System.
-                    """
+                """
 
-                    msg.attach(MIMEText(body, 'plain'))
+                msg.set_content(body)
 
-                    # Send email
-                    server = smtplib.SMTP(smtp_server, smtp_port)
-                    server.starttls()
-                    server.login(smtp_username, smtp_password)
-                    text = msg.as_string()
-                    server.sendmail(from_email, alert_settings.email, text)
-                    server.quit()
+                # smtplib is blocking, so run the SMTP conversation on a
+                # worker thread. The pooled session means a warm send
+                # only pays the DATA round-trip, not TLS + AUTH
+                def send_email():
+                    with _smtp_pool.connection(
+                        smtp_server, smtp_port, smtp_username, smtp_password
+                    ) as server:
+                        server.send_message(msg)
 
-                    email_success = True
-                else:
-                    email_error = "SMTP credentials not configured (SMTP_USERNAME, SMTP_PASSWORD)"
+                await asyncio.to_thread(send_email)
+
+                return True, None
 
             except Exception as e:
-                email_error = f"Email sending failed: {str(e)}"
-        else:
-            email_error = "Email notifications not configured in settings"
+                return False, f"Email sending failed: {str(e)}"
+
+        (telegram_success, telegram_error), (email_success, email_error) = await asyncio.gather(
+            _send_telegram(), _send_email()
+        )
 
         return {
             "alert_sent": True,
             "message": message,
             "product_id": product_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "delivery_results": {
                 "telegram": {
                     "enabled": alert_settings.telegram_bot_enabled,
@@ -1788,72 +2572,102 @@ This is an automated alert from your Brand Reputation Monitoring System.
             "note": "Telegram alerts will be sent to all users who have started a conversation with the bot"
         }
 
+    finally:
+        db.close()
+
+
+# Fixed-window quota counters keyed by (product_id, window kind, window
+# index); the TTL just bounds memory, the window index does the bucketing
+_alert_quota_counters = TTLCache(maxsize=20_000, ttl=86400 * 2)
+
+
+def _consume_alert_quota(product_id: int, settings) -> None:
+    """
+    Enforce max_alerts_per_hour / max_alerts_per_day for one product.
+
+    Raises 429 without touching Telegram or SMTP when a quota is spent.
+    Counted at submission so a stuck retry loop cannot flood the queue.
+    """
+    now = time.time()
+    hour_key = (product_id, "h", int(now // 3600))
+    day_key = (product_id, "d", int(now // 86400))
+    if _alert_quota_counters.get(hour_key, 0) >= settings.max_alerts_per_hour:
+        raise HTTPException(status_code=429, detail="Hourly alert quota exceeded")
+    if _alert_quota_counters.get(day_key, 0) >= settings.max_alerts_per_day:
+        raise HTTPException(status_code=429, detail="Daily alert quota exceeded")
+    _alert_quota_counters[hour_key] = _alert_quota_counters.get(hour_key, 0) + 1
+    _alert_quota_counters[day_key] = _alert_quota_counters.get(day_key, 0) + 1
+
+
+@app.post("/alerts/send", status_code=202)
+async def send_real_alert(
+    product_id: Optional[int] = 1,
+    message: str = "Test alert notification",
+    db: Session = Depends(get_db)
+):
+    """
+    Queue a REAL alert for delivery to both Telegram bot and email.
+
+    Responds immediately with 202 and a job id; delivery runs on the
+    background executor. Poll /alerts/status/{job_id} for the per-channel
+    delivery results. Products over their configured alert quota get a
+    429 before any work is queued.
+    """
+    alert_settings = _get_alert_settings(db, product_id)
+    if alert_settings is None:
+        # Reject before queueing - otherwise the caller gets a 202 for a
+        # job that is guaranteed to fail in the background
+        raise HTTPException(status_code=404, detail="Alert settings not found. Please configure settings first.")
+    _consume_alert_quota(product_id, alert_settings)
+
+    try:
+        job_id = await app.state.alert_executor.submit(product_id, message)
+        return {
+            "accepted": True,
+            "job_id": job_id,
+            "status_url": f"/alerts/status/{job_id}"
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Real alert sending failed: {str(e)}")
 
 
+@app.get("/alerts/status/{job_id}")
+async def get_alert_status(job_id: str):
+    """Check delivery status and results for a queued alert job"""
+    record = app.state.alert_executor.jobs.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired alert job")
+    return {"job_id": job_id, **record}
+
+
 @app.get("/alerts/telegram/chats")
-def get_telegram_chat_ids():
+async def get_telegram_chat_ids():
     """
     Get all chat IDs that have interacted with the Telegram bot.
     Useful for checking who will receive alerts.
+
+    Served from the cached chat map the background poller maintains;
+    POST /alerts/telegram/chats/refresh forces an immediate poll.
     """
     try:
-        telegram_bot_key = os.getenv("TELEGRAM_BOT_KEY")
-
-        if not telegram_bot_key:
+        if not app.state.settings.telegram_bot_key:
             return {
                 "error": "TELEGRAM_BOT_KEY not configured",
                 "chat_ids": [],
                 "total_chats": 0
             }
 
-        # Get all updates from the bot
-        updates_url = f"https://api.telegram.org/bot{telegram_bot_key}/getUpdates"
-        updates_response = requests.get(updates_url, timeout=10)
-
-        if updates_response.status_code != 200:
-            return {
-                "error": f"Failed to get bot updates: {updates_response.text}",
-                "chat_ids": [],
-                "total_chats": 0
-            }
-
-        updates_data = updates_response.json()
+        # Cold start: no poll has completed yet, so fetch once inline
+        if not app.state.chat_cache:
+            await _refresh_chat_cache()
 
-        # Extract chat information
-        chats = {}
-        for update in updates_data.get("result", []):
-            chat_info = None
-
-            if "message" in update:
-                chat = update["message"]["chat"]
-                chat_info = {
-                    "id": chat["id"],
-                    "type": chat["type"],
-                    "title": chat.get("title", f"{chat.get('first_name', '')} {chat.get('last_name', '')}").strip(),
-                    "username": chat.get("username"),
-                    "last_message_date": update["message"]["date"]
-                }
-            elif "callback_query" in update:
-                chat = update["callback_query"]["message"]["chat"]
-                chat_info = {
-                    "id": chat["id"],
-                    "type": chat["type"],
-                    "title": chat.get("title", f"{chat.get('first_name', '')} {chat.get('last_name', '')}").strip(),
-                    "username": chat.get("username"),
-                    "last_message_date": update["callback_query"]["message"]["date"]
-                }
-
-            if chat_info:
-                chat_id = chat_info["id"]
-                # Keep the most recent info for each chat
-                if chat_id not in chats or chat_info["last_message_date"] > chats[chat_id]["last_message_date"]:
-                    chats[chat_id] = chat_info
-
-        # Convert to list and sort by last message date
-        chat_list = list(chats.values())
-        chat_list.sort(key=lambda x: x["last_message_date"], reverse=True)
+        # Sort by last message date, most recent first; itemgetter runs the
+        # key extraction in C
+        chat_list = sorted(
+            app.state.chat_cache.values(),
+            key=itemgetter("last_message_date"),
+            reverse=True
+        )
 
         return {
             "chat_ids": [chat["id"] for chat in chat_list],
@@ -1870,44 +2684,77 @@ def get_telegram_chat_ids():
         }
 
 
+@app.post("/alerts/telegram/chats/refresh")
+async def refresh_telegram_chat_ids():
+    """Poll getUpdates immediately and fold any new chats into the cache"""
+    if not app.state.settings.telegram_bot_key:
+        return {
+            "error": "TELEGRAM_BOT_KEY not configured",
+            "chat_ids": [],
+            "total_chats": 0
+        }
+
+    try:
+        new_chats = await _refresh_chat_cache()
+        return {
+            "new_chats": new_chats,
+            "chat_ids": sorted(app.state.chat_cache),
+            "total_chats": len(app.state.chat_cache)
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to refresh chat IDs: {str(e)}",
+            "chat_ids": sorted(app.state.chat_cache),
+            "total_chats": len(app.state.chat_cache)
+        }
+
+
+# Default payload for products without stored alert settings; copied per
+# request so the tuple of platforms only becomes a fresh list on the way out
+_DEFAULT_ALERT_SETTINGS = MappingProxyType({
+    "threshold": 0.8,
+    "platforms": ("Reddit", "app_store", "google_play", "Google Serp"),
+    "email": None,
+    "max_alerts_per_hour": 10,
+    "max_alerts_per_day": 50,
+    "exists": False
+})
+
+# Platforms accepted by update_alert_settings; frozenset makes the
+# per-platform membership check O(1)
+_VALID_PLATFORMS = frozenset(["Reddit", "app_store", "google_play", "Google Serp", "Trustpilot"])
+
+
 @app.get("/alerts/settings/")
 def get_alert_settings(
     product_id: int = 1,
     db: Session = Depends(get_db)
 ):
     """Get alert settings for a specific product"""
-    try:
-        settings = db.query(AlertSettings).filter(AlertSettings.product_id == product_id).first()
-
-        if not settings:
-            # Return default settings
-            return {
-                "product_id": product_id,
-                "threshold": 0.8,
-                "platforms": ["Reddit", "app_store", "google_play", "Google Serp"],
-                "telegram_bot_enabled": bool(os.getenv("TELEGRAM_BOT_KEY")),
-                "email": None,
-                "max_alerts_per_hour": 10,
-                "max_alerts_per_day": 50,
-                "exists": False
-            }
+    settings = _get_alert_settings(db, product_id)
 
-        return {
-            "id": settings.id,
-            "product_id": settings.product_id,
-            "threshold": settings.threshold,
-            "platforms": settings.platforms,
-            "telegram_bot_enabled": settings.telegram_bot_enabled,
-            "email": settings.email,
-            "max_alerts_per_hour": settings.max_alerts_per_hour,
-            "max_alerts_per_day": settings.max_alerts_per_day,
-            "created_at": settings.created_at.isoformat(),
-            "updated_at": settings.updated_at.isoformat(),
-            "exists": True
-        }
+    if not settings:
+        # Return default settings
+        defaults = dict(_DEFAULT_ALERT_SETTINGS)
+        defaults["product_id"] = product_id
+        defaults["platforms"] = list(defaults["platforms"])
+        defaults["telegram_bot_enabled"] = bool(app.state.settings.telegram_bot_key)
+        return defaults
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get alert settings: {str(e)}")
+    return {
+        "id": settings.id,
+        "product_id": settings.product_id,
+        "threshold": settings.threshold,
+        "platforms": settings.platforms,
+        "telegram_bot_enabled": settings.telegram_bot_enabled,
+        "email": settings.email,
+        "max_alerts_per_hour": settings.max_alerts_per_hour,
+        "max_alerts_per_day": settings.max_alerts_per_day,
+        # orjson encodes datetimes natively, no isoformat() needed
+        "created_at": settings.created_at,
+        "updated_at": settings.updated_at,
+        "exists": True
+    }
 
 
 @app.put("/alerts/settings/")
@@ -1922,63 +2769,61 @@ def update_alert_settings(
     db: Session = Depends(get_db)
 ):
     """Update or create alert settings for a specific product"""
-    try:
-        # Validate threshold
-        if not 0.0 <= threshold <= 1.0:
-            raise HTTPException(status_code=400, detail="Threshold must be between 0.0 and 1.0")
-
-        # Validate platforms
-        valid_platforms = ["Reddit", "app_store", "google_play", "Google Serp", "Trustpilot"]
-        for platform in platforms:
-            if platform not in valid_platforms:
-                raise HTTPException(status_code=400,
-                                    detail=f"Invalid platform: {platform}. Valid platforms: {valid_platforms}")
-
-        # Get existing settings or create new
-        settings = db.query(AlertSettings).filter(AlertSettings.product_id == product_id).first()
+    # Validate threshold
+    if not 0.0 <= threshold <= 1.0:
+        raise HTTPException(status_code=400, detail="Threshold must be between 0.0 and 1.0")
 
-        if settings:
-            # Update existing settings
-            settings.threshold = threshold
-            settings.platforms = platforms
-            settings.telegram_bot_enabled = telegram_bot_enabled
-            settings.email = email
-            settings.max_alerts_per_hour = max_alerts_per_hour
-            settings.max_alerts_per_day = max_alerts_per_day
-            settings.updated_at = datetime.now()
-        else:
-            # Create new settings
-            settings = AlertSettings(
-                product_id=product_id,
-                threshold=threshold,
-                platforms=platforms,
-                telegram_bot_enabled=telegram_bot_enabled,
-                email=email,
-                max_alerts_per_hour=max_alerts_per_hour,
-                max_alerts_per_day=max_alerts_per_day
-            )
-            db.add(settings)
+    # Validate platforms
+    for platform in platforms:
+        if platform not in _VALID_PLATFORMS:
+            raise HTTPException(status_code=400,
+                                detail=f"Invalid platform: {platform}. Valid platforms: {sorted(_VALID_PLATFORMS)}")
+
+    # Get existing settings or create new
+    settings = db.query(AlertSettings).filter(AlertSettings.product_id == product_id).first()
+
+    if settings:
+        # Update existing settings
+        settings.threshold = threshold
+        settings.platforms = platforms
+        settings.telegram_bot_enabled = telegram_bot_enabled
+        settings.email = email
+        settings.max_alerts_per_hour = max_alerts_per_hour
+        settings.max_alerts_per_day = max_alerts_per_day
+        settings.updated_at = datetime.now()
+    else:
+        # Create new settings
+        settings = AlertSettings(
+            product_id=product_id,
+            threshold=threshold,
+            platforms=platforms,
+            telegram_bot_enabled=telegram_bot_enabled,
+            email=email,
+            max_alerts_per_hour=max_alerts_per_hour,
+            max_alerts_per_day=max_alerts_per_day
+        )
+        db.add(settings)
 
-        db.commit()
-        db.refresh(settings)
+    db.commit()
+    db.refresh(settings)
+    # Drop the cached snapshot so readers see the new values right away
+    _alert_settings_cache.pop(product_id, None)
 
-        return {
-            "message": "Alert settings updated successfully",
-            "settings": {
-                "id": settings.id,
-                "product_id": settings.product_id,
-                "threshold": settings.threshold,
-                "platforms": settings.platforms,
-                "telegram_bot_enabled": settings.telegram_bot_enabled,
-                "email": settings.email,
-                "max_alerts_per_hour": settings.max_alerts_per_hour,
-                "max_alerts_per_day": settings.max_alerts_per_day,
-                "updated_at": settings.updated_at.isoformat()
-            }
+    return {
+        "message": "Alert settings updated successfully",
+        "settings": {
+            "id": settings.id,
+            "product_id": settings.product_id,
+            "threshold": settings.threshold,
+            "platforms": settings.platforms,
+            "telegram_bot_enabled": settings.telegram_bot_enabled,
+            "email": settings.email,
+            "max_alerts_per_hour": settings.max_alerts_per_hour,
+            "max_alerts_per_day": settings.max_alerts_per_day,
+            "updated_at": settings.updated_at
         }
+    }
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to update alert settings: {str(e)}")
 
 
 @app.get("/scheduler/status")
@@ -1986,17 +2831,14 @@ def get_scheduler_info():
     """
     Get background scheduler status and job information
     """
-    try:
-        status = get_scheduler_status()
-        return {
-            "scheduler": status,
-            "environment": {
-                "ENV_RUN_SCHEDULER": os.getenv("ENV_RUN_SCHEDULER", "false"),
-                "timezone": "Europe/Kiev"
-            }
+    status = get_scheduler_status()
+    return {
+        "scheduler": status,
+        "environment": {
+            "ENV_RUN_SCHEDULER": os.getenv("ENV_RUN_SCHEDULER", "false"),
+            "timezone": "Europe/Kiev"
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get scheduler status: {str(e)}")
+    }
 
 
 @app.post("/scheduler/manual/parse")
@@ -2004,15 +2846,12 @@ async def trigger_manual_parsing():
     """
     Manually trigger data parsing task (for testing/debugging)
     """
-    try:
-        await run_manual_parsing()
-        return {
-            "success": True,
-            "message": "Manual data parsing completed successfully",
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Manual parsing failed: {str(e)}")
+    await run_manual_parsing()
+    return {
+        "success": True,
+        "message": "Manual data parsing completed successfully",
+        "timestamp": datetime.now()
+    }
 
 
 @app.post("/scheduler/manual/analyze")
@@ -2020,28 +2859,31 @@ async def trigger_manual_analysis():
     """
     Manually trigger AI analysis task (for testing/debugging)
     """
-    try:
-        await run_manual_analysis()
-        return {
-            "success": True,
-            "message": "Manual AI analysis completed successfully",
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Manual analysis failed: {str(e)}")
+    await run_manual_analysis()
+    return {
+        "success": True,
+        "message": "Manual AI analysis completed successfully",
+        "timestamp": datetime.now()
+    }
 
 
 @app.get("/health")
 def health_check():
     """
-    Health check endpoint
+    Health check endpoint - returns the payload precomputed at startup so
+    liveness probes cost a dict serialization and nothing else
     """
-    # Check if required environment variables are set
-    required_vars = ["OPENAI_API_KEY", "SERPER_API_KEY"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    return app.state.health_payload
 
-    return {
-        "status": "healthy" if not missing_vars else "unhealthy",
-        "missing_env_vars": missing_vars,
-        "database": "connected"
-    }
+
+@app.get("/health/db")
+def db_health_check(db: Session = Depends(get_db)):
+    """Database health check - runs an actual round-trip to the database"""
+    try:
+        db.execute(text("SELECT 1"))
+        return {"status": "healthy", "database": "connected"}
+    except Exception as e:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "database": f"error: {str(e)}"}
+        )
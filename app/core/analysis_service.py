@@ -1,13 +1,142 @@
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from textblob import TextBlob
 from collections import Counter, defaultdict
+from cachetools import LRUCache
 import numpy as np
 from datetime import datetime, timedelta
 from crewai import Agent, Task, Crew
 import os
 
+def _fuse_context_patterns(*pattern_tables):
+    """
+    Fuse (pattern, delta) tables into one alternation regex plus a
+    group-name -> delta lookup
+
+    Wrapping each pattern as its own named group lets a single finditer
+    pass over the text replace one re.search per pattern. Inner groups in
+    the source patterns must be non-capturing so match.lastgroup always
+    names the branch that matched.
+    """
+    branches = []
+    deltas = {}
+    index = 0
+    for table in pattern_tables:
+        for pattern, delta in table:
+            name = f"g{index}"
+            branches.append(f"(?P<{name}>{pattern})")
+            deltas[name] = delta
+            index += 1
+    return re.compile("|".join(branches), re.IGNORECASE), deltas
+
+
+def _compile_keyword_alternation(keywords):
+    """
+    Compile a keyword list into one alternation regex for multi-keyword scans
+
+    A single pass with findall replaces one substring scan per keyword.
+    Longest-first ordering makes sure a keyword that starts with another
+    keyword still wins at the same position. Keywords keep their plain
+    substring semantics (no word boundaries), matching the previous
+    'keyword in text' checks.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+
+def _build_term_matcher(terms):
+    """
+    Compile terms into one alternation regex plus a group-name -> term map
+
+    Used by the evidence lookups to make a single pass per text instead of
+    one substring scan per term. Longest-first ordering prefers the longest
+    term where terms overlap in the text.
+    """
+    ordered = sorted(set(terms), key=len, reverse=True)
+    pattern = "|".join(
+        f"(?P<g{index}>{re.escape(term)})" for index, term in enumerate(ordered)
+    )
+    groups = {f"g{index}": term for index, term in enumerate(ordered)}
+    return re.compile(pattern), groups
+
+
 class AnalysisService:
+    # Context-adjustment pattern tables for _apply_context_adjustments.
+    # These are fused below into two scan-once alternation regexes:
+    # dissatisfaction and negative reinforcement always apply, positive
+    # reinforcement only applies when the base polarity is positive.
+
+    # Patterns that indicate dissatisfaction despite positive words
+    DISSATISFACTION_PATTERNS = [
+        # Seeking alternatives (strong indicator of dissatisfaction)
+        (r'\b(?:alternative|alternatives)\s+to\b', -0.4),
+        (r'\bother\s+(?:apps?|options?|services?)\s+(?:than|instead of|better than)\b', -0.4),
+        (r'\breplace(?:ment)?\s+(?:for|to)\b', -0.3),
+        (r'\bswitch\s+(?:from|away from)\b', -0.3),
+
+        # Comparison seeking (moderate dissatisfaction)
+        (r'\bbetter\s+(?:than|alternatives?|options?)\b', -0.2),
+        (r'\bcheaper\s+(?:than|alternatives?|options?)\b', -0.2),
+        (r'\bwhat.*better\b', -0.2),
+        (r'\banything\s+(?:better|cheaper)\b', -0.2),
+
+        # Implicit complaints
+        (r'\bstop\s+using\b', -0.4),
+        (r'\buninstall\b', -0.4),
+        (r'\bdelete\b.*\bapp\b', -0.4),
+        (r'\bworse\s+than\b', -0.3),
+        (r'\bnot\s+worth\b', -0.3),
+        (r'\bwaste\s+of\b', -0.4),
+
+        # Conditional dissatisfaction
+        (r'\bokay\s+but\b', -0.2),
+        (r'\bfine\s+but\b', -0.2),
+        (r'\bdecent\s+but\b', -0.2),
+        (r'\bused\s+to\s+be\s+(?:good|great|better)\b', -0.3),
+        (r'\bwant\s+(?:better|cheaper|different)\b', -0.2),
+        (r'\bneed\s+(?:something|anything)\s+(?:better|cheaper|else)\b', -0.3),
+    ]
+
+    # Patterns that reinforce positive sentiment
+    POSITIVE_REINFORCEMENT_PATTERNS = [
+        (r'\blove\s+(?:this|it|uber|lyft)\b', 0.2),
+        (r'\bamazing\b', 0.3),
+        (r'\bawesome\b', 0.3),
+        (r'\bperfect\b', 0.3),
+        (r'\bexcellent\b', 0.3),
+        (r'\bhighly\s+recommend\b', 0.4),
+        (r'\bbest\s+(?:app|service)\b', 0.3),
+    ]
+
+    # Patterns that reinforce negative sentiment
+    NEGATIVE_REINFORCEMENT_PATTERNS = [
+        (r'\bterrible\b', -0.4),
+        (r'\bawful\b', -0.4),
+        (r'\bhorrible\b', -0.4),
+        (r'\bnever\s+(?:again|use|using)\b', -0.4),
+        (r'\bworst\b', -0.4),
+        (r'\bhate\b', -0.4),
+        (r'\bdisgusting\b', -0.4),
+    ]
+
+    # Tokenizer and stop-word list for extract_topics_and_themes, hoisted
+    # to class scope so neither is rebuilt per call
+    _WORD_RE = re.compile(r'\b\w+\b')
+    _STOP_WORDS = frozenset({
+        'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+        'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does',
+        'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can',
+        'a', 'an', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it',
+        'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
+    })
+
+    _BASE_ADJUSTMENT_REGEX, _BASE_ADJUSTMENT_DELTAS = _fuse_context_patterns(
+        DISSATISFACTION_PATTERNS, NEGATIVE_REINFORCEMENT_PATTERNS
+    )
+    _POSITIVE_ADJUSTMENT_REGEX, _POSITIVE_ADJUSTMENT_DELTAS = _fuse_context_patterns(
+        POSITIVE_REINFORCEMENT_PATTERNS
+    )
+
     def __init__(self):
         self.negative_keywords = [
             'terrible', 'awful', 'horrible', 'bad', 'worst', 'hate', 'disgusting',
@@ -49,7 +178,25 @@ class AnalysisService:
             'security': ['hacked', 'security', 'privacy', 'data breach', 'stolen'],
             'service': ['rude', 'unprofessional', 'terrible service', 'bad support']
         }
-        
+
+        # Per-category keyword matchers compiled once so classify_intent and
+        # detect_crisis_signals scan each text once per category instead of
+        # once per keyword
+        self._intent_matchers = {
+            intent: _compile_keyword_alternation(keywords)
+            for intent, keywords in self.intent_patterns.items()
+        }
+        self._crisis_matchers = {
+            category: _compile_keyword_alternation(keywords)
+            for category, keywords in self.crisis_keywords.items()
+        }
+
+        # Memo of sentiment results keyed by exact text. The same content
+        # flows through analyze_reviews_sentiment, identify_key_issues and
+        # analyze_with_evidence within one request, so each text pays the
+        # TextBlob (or LLM) cost once. LRU-capped for memory safety.
+        self._sentiment_cache = LRUCache(maxsize=10_000)
+
     def analyze_sentiment(self, text: str) -> Dict:
         """
         Analyze sentiment of text using OpenAI via CrewAI for enhanced accuracy
@@ -60,22 +207,42 @@ class AnalysisService:
         Returns:
             Dictionary containing sentiment analysis results
         """
+        cached = self._sentiment_cache.get(text)
+        if cached is not None:
+            return cached
+
+        result = None
+
         # Try OpenAI-powered analysis first (if API key available)
         if os.getenv("OPENAI_API_KEY"):
             try:
-                openai_result = self._analyze_sentiment_with_openai(text)
-                if openai_result:
-                    return openai_result
+                result = self._analyze_sentiment_with_openai(text)
             except Exception as e:
                 print(f"OpenAI sentiment analysis failed, falling back to TextBlob: {e}")
-        
+
         # Fallback to enhanced TextBlob analysis
+        if result is None:
+            result = self._analyze_sentiment_textblob(text)
+
+        self._sentiment_cache[text] = result
+        return result
+
+    def _analyze_sentiment_textblob(self, text: str) -> Dict:
+        """
+        Enhanced TextBlob sentiment analysis (local fallback path)
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Dictionary containing sentiment analysis results
+        """
         blob = TextBlob(text)
         base_polarity = blob.sentiment.polarity
-        
+
         # Apply context-aware adjustments
         adjusted_polarity = self._apply_context_adjustments(text, base_polarity)
-        
+
         return {
             "polarity": adjusted_polarity,  # -1 to 1
             "subjectivity": blob.sentiment.subjectivity,  # 0 to 1
@@ -83,7 +250,7 @@ class AnalysisService:
             "base_polarity": base_polarity,  # Original TextBlob score for debugging
             "method": "textblob_enhanced"
         }
-    
+
     def _apply_context_adjustments(self, text: str, base_polarity: float) -> float:
         """
         Apply context-aware adjustments to sentiment polarity
@@ -95,79 +262,19 @@ class AnalysisService:
         Returns:
             Adjusted polarity score
         """
-        text_lower = text.lower()
         adjusted_polarity = base_polarity
-        
-        # Patterns that indicate dissatisfaction despite positive words
-        dissatisfaction_patterns = [
-            # Seeking alternatives (strong indicator of dissatisfaction)
-            (r'\b(alternative|alternatives)\s+to\b', -0.4),
-            (r'\bother\s+(apps?|options?|services?)\s+(than|instead of|better than)\b', -0.4),
-            (r'\breplace(ment)?\s+(for|to)\b', -0.3),
-            (r'\bswitch\s+(from|away from)\b', -0.3),
-            
-            # Comparison seeking (moderate dissatisfaction)
-            (r'\bbetter\s+(than|alternatives?|options?)\b', -0.2),
-            (r'\bcheaper\s+(than|alternatives?|options?)\b', -0.2),
-            (r'\bwhat.*better\b', -0.2),
-            (r'\banything\s+(better|cheaper)\b', -0.2),
-            
-            # Implicit complaints
-            (r'\bstop\s+using\b', -0.4),
-            (r'\buninstall\b', -0.4),
-            (r'\bdelete\b.*\bapp\b', -0.4),
-            (r'\bworse\s+than\b', -0.3),
-            (r'\bnot\s+worth\b', -0.3),
-            (r'\bwaste\s+of\b', -0.4),
-            
-            # Conditional dissatisfaction
-            (r'\bokay\s+but\b', -0.2),
-            (r'\bfine\s+but\b', -0.2),
-            (r'\bdecent\s+but\b', -0.2),
-            (r'\bused\s+to\s+be\s+(good|great|better)\b', -0.3),
-            (r'\bwant\s+(better|cheaper|different)\b', -0.2),
-            (r'\bneed\s+(something|anything)\s+(better|cheaper|else)\b', -0.3),
-        ]
-        
-        # Patterns that reinforce positive sentiment
-        positive_reinforcement_patterns = [
-            (r'\blove\s+(this|it|uber|lyft)\b', 0.2),
-            (r'\bamazing\b', 0.3),
-            (r'\bawesome\b', 0.3),
-            (r'\bperfect\b', 0.3),
-            (r'\bexcellent\b', 0.3),
-            (r'\bhighly\s+recommend\b', 0.4),
-            (r'\bbest\s+(app|service)\b', 0.3),
-        ]
-        
-        # Patterns that reinforce negative sentiment
-        negative_reinforcement_patterns = [
-            (r'\bterrible\b', -0.4),
-            (r'\bawful\b', -0.4),
-            (r'\bhorrible\b', -0.4),
-            (r'\bnever\s+(again|use|using)\b', -0.4),
-            (r'\bworst\b', -0.4),
-            (r'\bhate\b', -0.4),
-            (r'\bdisgusting\b', -0.4),
-        ]
-        
-        # Apply dissatisfaction pattern adjustments
-        import re
-        for pattern, adjustment in dissatisfaction_patterns:
-            if re.search(pattern, text_lower):
-                adjusted_polarity += adjustment
-                
+
+        # Single pass over the text; collecting matched branch names into a
+        # set keeps the old one-adjustment-per-pattern semantics even when a
+        # pattern matches more than once
+        matched = {m.lastgroup for m in self._BASE_ADJUSTMENT_REGEX.finditer(text)}
+        adjusted_polarity += sum(self._BASE_ADJUSTMENT_DELTAS[name] for name in matched)
+
         # Apply positive reinforcement (only if already positive)
         if base_polarity > 0:
-            for pattern, adjustment in positive_reinforcement_patterns:
-                if re.search(pattern, text_lower):
-                    adjusted_polarity += adjustment
-                    
-        # Apply negative reinforcement (amplify negative sentiment)
-        for pattern, adjustment in negative_reinforcement_patterns:
-            if re.search(pattern, text_lower):
-                adjusted_polarity += adjustment
-        
+            matched = {m.lastgroup for m in self._POSITIVE_ADJUSTMENT_REGEX.finditer(text)}
+            adjusted_polarity += sum(self._POSITIVE_ADJUSTMENT_DELTAS[name] for name in matched)
+
         # Clamp to valid range
         return max(-1.0, min(1.0, adjusted_polarity))
     
@@ -274,7 +381,288 @@ class AnalysisService:
             print(f"OpenAI sentiment analysis error: {e}")
             
         return None
-    
+
+    # Token budget of review text packed into one batched sentiment prompt;
+    # well under the model context window, leaving room for instructions
+    # and the JSON answer
+    BATCH_PROMPT_TOKEN_BUDGET = 3000
+
+    def _analyze_sentiment_batch_openai(self, texts: List[str]) -> Dict[int, Dict]:
+        """
+        Classify many texts with one OpenAI call per chunk instead of one per text
+
+        Texts are numbered as '[i] "..."' lines and packed into prompts up
+        to BATCH_PROMPT_TOKEN_BUDGET tokens; the model answers with a JSON
+        array of {index, sentiment, confidence, polarity} entries keyed
+        back by position. Entries the model omits - and whole chunks that
+        fail - are simply absent from the returned mapping so the caller
+        can fall back per text.
+
+        Args:
+            texts: List of texts to classify
+
+        Returns:
+            Mapping of input position to sentiment result dictionary
+        """
+        results: Dict[int, Dict] = {}
+        if not texts:
+            return results
+
+        try:
+            import tiktoken
+            encoder = tiktoken.get_encoding("cl100k_base")
+
+            def count_tokens(value: str) -> int:
+                return len(encoder.encode(value))
+        except Exception:
+            # Rough chars-per-token estimate when the encoding is unavailable
+            def count_tokens(value: str) -> int:
+                return len(value) // 4 + 1
+
+        # Pack numbered lines into chunks below the token budget
+        chunks: List[List[Tuple[int, str]]] = []
+        current: List[Tuple[int, str]] = []
+        current_tokens = 0
+        for position, text in enumerate(texts):
+            line = f'[{position}] "{" ".join(text.split())}"'
+            line_tokens = count_tokens(line)
+            if current and current_tokens + line_tokens > self.BATCH_PROMPT_TOKEN_BUDGET:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append((position, line))
+            current_tokens += line_tokens
+        if current:
+            chunks.append(current)
+
+        for chunk in chunks:
+            try:
+                results.update(self._run_sentiment_batch_task(chunk))
+            except Exception as e:
+                print(f"OpenAI batch sentiment chunk failed: {e}")
+
+        return results
+
+    def _run_sentiment_batch_task(self, chunk: List[Tuple[int, str]]) -> Dict[int, Dict]:
+        """
+        Run one batched sentiment Crew task over pre-numbered text lines
+
+        Args:
+            chunk: List of (position, numbered line) pairs for one prompt
+
+        Returns:
+            Mapping of input position to sentiment result dictionary
+        """
+        # Import LLM for model configuration
+        from crewai import LLM
+
+        llm = LLM(
+            model="o1-mini",
+            temperature=0.3
+        )
+
+        sentiment_agent = Agent(
+            role="Expert Sentiment Analyzer",
+            goal="Accurately classify sentiment in text, especially detecting sarcasm, irony, and subtle negative feedback",
+            backstory="""You are an expert at understanding human emotions and sentiment in text.
+            You excel at detecting sarcasm, irony, subtle complaints, and negative experiences that might be
+            disguised with positive words. You understand context, tone, and implied meaning.""",
+            verbose=False,
+            allow_delegation=False,
+            llm=llm
+        )
+
+        numbered_texts = "\n".join(line for _, line in chunk)
+        sentiment_task = Task(
+            description=f"""
+            Analyze the sentiment of each numbered text below with high accuracy:
+
+            {numbered_texts}
+
+            Pay special attention to:
+            1. Sarcasm and irony (e.g., "great ambiance" when describing something bad)
+            2. Negative experiences described with seemingly positive words
+            3. Subtle complaints and dissatisfaction
+            4. Context and implied meaning
+
+            Respond with ONLY a JSON array with one object per input text,
+            in this exact format:
+            [
+                {{
+                    "index": 0,
+                    "sentiment": "positive|negative|neutral",
+                    "confidence": 0.85,
+                    "polarity": -0.6
+                }}
+            ]
+
+            Where:
+            - index: The number in square brackets before the text
+            - sentiment: The detected sentiment (positive, negative, or neutral)
+            - confidence: How confident you are (0.0 to 1.0)
+            - polarity: Numeric score from -1.0 (very negative) to +1.0 (very positive)
+            """,
+            agent=sentiment_agent,
+            expected_output="JSON array with one sentiment object per input text"
+        )
+
+        crew = Crew(
+            agents=[sentiment_agent],
+            tasks=[sentiment_task],
+            verbose=False
+        )
+
+        result = crew.kickoff()
+
+        # Parse the result
+        import json
+        result_text = str(result).strip()
+        start_idx = result_text.find('[')
+        end_idx = result_text.rfind(']') + 1
+        if start_idx == -1 or end_idx == 0:
+            return {}
+
+        parsed = json.loads(result_text[start_idx:end_idx])
+        valid_positions = {position for position, _ in chunk}
+
+        chunk_results: Dict[int, Dict] = {}
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            position = entry.get("index")
+            if position in valid_positions:
+                chunk_results[position] = {
+                    "polarity": entry.get("polarity", 0.0),
+                    "subjectivity": 0.8,  # Default subjectivity for OpenAI results
+                    "sentiment_label": entry.get("sentiment", "neutral"),
+                    "confidence": entry.get("confidence", 0.8),
+                    "method": "openai_crewai_batch"
+                }
+        return chunk_results
+
+    def submit_sentiment_batch(self, texts: List[str]) -> str:
+        """
+        Submit texts to the OpenAI Batch API for deferred sentiment analysis
+
+        Suited to bulk backfills and scheduled jobs where results are not
+        needed synchronously: batch requests are priced at half the
+        interactive rate and do not consume the interactive rate limit.
+        Poll the returned id with fetch_sentiment_batch.
+
+        Args:
+            texts: List of texts to classify
+
+        Returns:
+            Batch id to poll with fetch_sentiment_batch
+        """
+        import io
+        import json
+        from openai import OpenAI
+
+        client = OpenAI()
+
+        lines = []
+        for position, text in enumerate(texts):
+            request = {
+                "custom_id": str(position),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "o1-mini",
+                    "messages": [
+                        {"role": "user", "content": self._sentiment_prompt(text)}
+                    ]
+                }
+            }
+            lines.append(json.dumps(request))
+
+        buffer = io.BytesIO("\n".join(lines).encode("utf-8"))
+        batch_file = client.files.create(
+            file=("sentiment_batch.jsonl", buffer),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def fetch_sentiment_batch(self, batch_id: str) -> Optional[Dict[int, Dict]]:
+        """
+        Fetch results of a sentiment batch submitted via submit_sentiment_batch
+
+        Args:
+            batch_id: Batch id returned by submit_sentiment_batch
+
+        Returns:
+            Mapping of input position to sentiment result dictionary once
+            the batch has completed, or None while it is still running
+        """
+        import json
+        from openai import OpenAI
+
+        client = OpenAI()
+
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return None
+
+        output = client.files.content(batch.output_file_id)
+
+        results: Dict[int, Dict] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                content = entry["response"]["body"]["choices"][0]["message"]["content"]
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                continue
+
+            # Extract the JSON object from the model's answer
+            start_idx = content.find('{')
+            end_idx = content.rfind('}') + 1
+            if start_idx == -1 or end_idx == 0:
+                continue
+            try:
+                parsed = json.loads(content[start_idx:end_idx])
+            except json.JSONDecodeError:
+                continue
+
+            results[int(entry["custom_id"])] = {
+                "polarity": parsed.get("polarity", 0.0),
+                "subjectivity": 0.8,  # Default subjectivity for OpenAI results
+                "sentiment_label": parsed.get("sentiment", "neutral"),
+                "confidence": parsed.get("confidence", 0.8),
+                "reasoning": parsed.get("reasoning", ""),
+                "method": "openai_batch_api"
+            }
+        return results
+
+    @staticmethod
+    def _sentiment_prompt(text: str) -> str:
+        """Build the single-text sentiment prompt used by the Batch API path"""
+        return f"""
+        Analyze the sentiment of this text with high accuracy:
+
+        Text: "{text}"
+
+        Pay special attention to:
+        1. Sarcasm and irony (e.g., "great ambiance" when describing something bad)
+        2. Negative experiences described with seemingly positive words
+        3. Subtle complaints and dissatisfaction
+        4. Context and implied meaning
+
+        Respond with ONLY a JSON object in this exact format:
+        {{
+            "sentiment": "positive|negative|neutral",
+            "confidence": 0.85,
+            "polarity": -0.6,
+            "reasoning": "Brief explanation of why this sentiment was chosen"
+        }}
+        """
+
     def _get_sentiment_label(self, polarity: float) -> str:
         """Convert polarity score to sentiment label"""
         if polarity > 0.05:
@@ -283,6 +671,19 @@ class AnalysisService:
             return "negative"
         else:
             return "neutral"
+
+    @staticmethod
+    def _label_codes_array(polarities: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of _get_sentiment_label over a polarity array
+
+        Applies the same +/-0.05 thresholds with one np.select call instead
+        of a Python branch per value, returning the int8 label codes used
+        by the batch aggregation (0 negative, 1 neutral, 2 positive).
+        """
+        return np.select(
+            [polarities > 0.05, polarities < -0.05], [2, 0], default=1
+        ).astype(np.int8)
     
     def extract_topics_and_themes(self, texts: List[str], min_frequency: int = 3) -> Dict:
         """
@@ -299,29 +700,23 @@ class AnalysisService:
         combined_text = " ".join(texts).lower()
         
         # Extract common phrases and keywords
-        words = re.findall(r'\b\w+\b', combined_text)
+        words = self._WORD_RE.findall(combined_text)
         word_freq = Counter(words)
-        
+
         # Filter out common words and short words
-        stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'a', 'an', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their'}
-        
         filtered_words = {
             word: freq for word, freq in word_freq.items()
-            if len(word) > 3 and word not in stop_words and freq >= min_frequency
+            if len(word) > 3 and word not in self._STOP_WORDS and freq >= min_frequency
         }
         
-        # Extract bigrams (two-word phrases)
-        bigrams = []
-        words_list = words
-        for i in range(len(words_list) - 1):
-            bigram = f"{words_list[i]} {words_list[i+1]}"
-            if len(bigram) > 6:  # Filter short bigrams
-                bigrams.append(bigram)
-        
-        bigram_freq = Counter(bigrams)
+        # Extract bigrams (two-word phrases): count adjacent word pairs as
+        # tuples so no per-position string is allocated, then format only
+        # the pairs that survive the frequency and length filters
+        bigram_freq = Counter(zip(words, words[1:]))
         common_bigrams = {
-            phrase: freq for phrase, freq in bigram_freq.items()
-            if freq >= min_frequency
+            f"{first} {second}": freq
+            for (first, second), freq in bigram_freq.items()
+            if freq >= min_frequency and len(first) + len(second) + 1 > 6
         }
         
         return {
@@ -350,23 +745,73 @@ class AnalysisService:
                 "total_reviews": 0
             }
         
-        sentiments = []
-        sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-        
-        for review in reviews:
-            content = review.get("content", "") or review.get("title", "")
-            if content:
-                sentiment = self.analyze_sentiment(content)
-                sentiments.append(sentiment["polarity"])
-                sentiment_counts[sentiment["sentiment_label"]] += 1
-        
+        # Duplicate texts are common (reposted complaints, cross-posted reviews),
+        # so analyze each unique content once and reuse the result
+        contents = [
+            review.get("content", "") or review.get("title", "")
+            for review in reviews
+        ]
+        unique_texts = list(dict.fromkeys(c for c in contents if c))
+
+        # Serve texts already classified elsewhere in the pipeline from the
+        # shared sentiment memo and only batch what is left
+        unique_sentiments = {}
+        uncached_texts = []
+        for text in unique_texts:
+            cached = self._sentiment_cache.get(text)
+            if cached is not None:
+                unique_sentiments[text] = cached
+            else:
+                uncached_texts.append(text)
+
+        # One batched OpenAI round-trip for all remaining texts instead of
+        # a Crew kickoff per review
+        if os.getenv("OPENAI_API_KEY") and uncached_texts:
+            batch_results = self._analyze_sentiment_batch_openai(uncached_texts)
+            for position, sentiment in batch_results.items():
+                unique_sentiments[uncached_texts[position]] = sentiment
+
+        # TextBlob fallback for anything the batch omitted (or for every
+        # text when no API key is configured)
+        for text in uncached_texts:
+            if text not in unique_sentiments:
+                unique_sentiments[text] = self._analyze_sentiment_textblob(text)
+            self._sentiment_cache[text] = unique_sentiments[text]
+
+        analyzed = [unique_sentiments[content] for content in contents if content]
+
+        # Aggregate into preallocated typed arrays so the mean and the
+        # per-label tally run in C: one bincount over int8 label codes
+        # replaces the per-review dict increments
+        label_codes = {"negative": 0, "neutral": 1, "positive": 2}
+        polarities = np.empty(len(analyzed), dtype=np.float32)
+        labels = np.empty(len(analyzed), dtype=np.int8)
+        for i, sentiment in enumerate(analyzed):
+            polarities[i] = sentiment["polarity"]
+            # -1 marks locally analyzed entries, whose label is by
+            # construction the polarity threshold - those are labeled in
+            # one vectorized pass below. Model-provided labels stay
+            # authoritative for the OpenAI paths.
+            labels[i] = (
+                -1 if sentiment["method"] == "textblob_enhanced"
+                else label_codes[sentiment["sentiment_label"]]
+            )
+
+        local = labels == -1
+        if local.any():
+            labels[local] = self._label_codes_array(polarities[local])
+
+        counts = np.bincount(labels, minlength=3)  # [negative, neutral, positive]
+
         return {
-            "average_sentiment": np.mean(sentiments) if sentiments else 0,
-            "positive_count": sentiment_counts["positive"],
-            "negative_count": sentiment_counts["negative"],
-            "neutral_count": sentiment_counts["neutral"],
+            "average_sentiment": float(polarities.mean()) if analyzed else 0,
+            "positive_count": int(counts[2]),
+            "negative_count": int(counts[0]),
+            "neutral_count": int(counts[1]),
             "sentiment_distribution": {
-                k: v / len(reviews) for k, v in sentiment_counts.items()
+                "positive": int(counts[2]) / len(reviews),
+                "negative": int(counts[0]) / len(reviews),
+                "neutral": int(counts[1]) / len(reviews)
             },
             "total_reviews": len(reviews)
         }
@@ -470,7 +915,39 @@ class AnalysisService:
         
         # Ensure score is between 0 and 100
         return max(0, min(100, final_score))
-    
+
+    def compute_reputation_score(self, frame, sentiment_data: Dict, issues: List[Dict]) -> float:
+        """
+        Compute the 0-100 reputation score numerically over a review frame
+
+        The score is a deterministic weighted mean - positive sentiment share
+        (50%), inverse issue rate (30%) and average Trustpilot star rating
+        (20%) - so it never needs an LLM round-trip and is reproducible
+        across runs.
+
+        Args:
+            frame: ReviewFrame of parallel arrays (content, rating, platform, date)
+            sentiment_data: Aggregated output of analyze_reviews_sentiment
+            issues: List of identified issues
+
+        Returns:
+            Reputation score from 0 to 100
+        """
+        total_reviews = int(frame.content.size)
+        if total_reviews == 0:
+            return 50.0
+
+        positive_share = sentiment_data.get("sentiment_distribution", {}).get("positive", 0.0)
+        issue_rate = min(len(issues) / total_reviews, 1.0)
+
+        # Average star rating across Trustpilot reviews, neutral when absent
+        ratings = frame.rating[frame.platform == "Trustpilot"]
+        ratings = ratings[~np.isnan(ratings)]
+        star_term = float(ratings.mean()) / 5.0 if ratings.size else 0.6
+
+        score = 100.0 * (0.5 * positive_share + 0.3 * (1.0 - issue_rate) + 0.2 * star_term)
+        return round(max(0.0, min(100.0, score)), 1)
+
     def classify_intent(self, text: str) -> Dict:
         """
         Classify the intent of user feedback
@@ -483,23 +960,27 @@ class AnalysisService:
         """
         text_lower = text.lower()
         intent_scores = {}
-        
-        for intent, keywords in self.intent_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                intent_scores[intent] = score
-        
+        matched_by_intent = {}
+
+        # One alternation scan per intent; deduping repeats keeps the score
+        # a count of distinct keywords present, as before
+        for intent, matcher in self._intent_matchers.items():
+            found = set(matcher.findall(text_lower))
+            if found:
+                intent_scores[intent] = len(found)
+                matched_by_intent[intent] = found
+
         if not intent_scores:
             return {"intent": "neutral_mention", "confidence": 0.5, "keywords_matched": []}
-        
+
         # Get the intent with highest score
         primary_intent = max(intent_scores.keys(), key=lambda k: intent_scores[k])
         confidence = min(1.0, intent_scores[primary_intent] / 3)  # Normalize confidence
-        
-        # Get matched keywords
+
+        # Get matched keywords (in pattern-list order)
         matched_keywords = [
             keyword for keyword in self.intent_patterns[primary_intent]
-            if keyword in text_lower
+            if keyword in matched_by_intent[primary_intent]
         ]
         
         return {
@@ -509,6 +990,31 @@ class AnalysisService:
             "all_scores": intent_scores
         }
     
+    @staticmethod
+    def _prepare_reviews(reviews: List[Dict]) -> List[Dict]:
+        """
+        Decorate reviews with the lowercased text the analysis loops need
+
+        detect_crisis_signals and the evidence lookup both scan
+        (content + title).lower() per review; computing it once up front
+        keeps repeated case folding and concatenation out of the hot
+        loops. Copies are shallow so the caller's dicts are not mutated.
+
+        Args:
+            reviews: List of review dictionaries
+
+        Returns:
+            Shallow copies of the reviews with a cached "_lc_text" field
+        """
+        prepared = []
+        for review in reviews:
+            item = dict(review)
+            item["_lc_text"] = (
+                review.get('content', '') + ' ' + review.get('title', '')
+            ).lower()
+            prepared.append(item)
+        return prepared
+
     def detect_crisis_signals(self, reviews: List[Dict], time_window_hours: int = 24) -> Dict:
         """
         Detect potential crisis signals from recent reviews
@@ -530,20 +1036,27 @@ class AnalysisService:
         affected_reviews = []
         
         for review in recent_reviews:
-            content = (review.get('content', '') + ' ' + review.get('title', '')).lower()
-            
-            for category, keywords in self.crisis_keywords.items():
-                for keyword in keywords:
-                    if keyword in content:
-                        crisis_signals[category] += 1
-                        affected_reviews.append({
-                            "review_id": review.get('id', 'unknown'),
-                            "content_snippet": content[:100] + "...",
-                            "category": category,
-                            "keyword": keyword,
-                            "platform": review.get('platform', 'unknown')
-                        })
-                        break
+            content = review.get('_lc_text')
+            if content is None:
+                content = (review.get('content', '') + ' ' + review.get('title', '')).lower()
+
+            for category, matcher in self._crisis_matchers.items():
+                found = set(matcher.findall(content))
+                if found:
+                    # Record at most one signal per category per review,
+                    # attributed to the first keyword in list order - the
+                    # same semantics as the old per-keyword loop with break
+                    keyword = next(
+                        k for k in self.crisis_keywords[category] if k in found
+                    )
+                    crisis_signals[category] += 1
+                    affected_reviews.append({
+                        "review_id": review.get('id', 'unknown'),
+                        "content_snippet": content[:100] + "...",
+                        "category": category,
+                        "keyword": keyword,
+                        "platform": review.get('platform', 'unknown')
+                    })
         
         # Determine crisis level
         total_signals = sum(crisis_signals.values())
@@ -598,9 +1111,13 @@ class AnalysisService:
         Returns:
             Enhanced analysis with evidence and citations
         """
+        # Lowercase each review's text once for the passes below instead of
+        # re-folding it in every helper
+        prepared_reviews = self._prepare_reviews(reviews)
+
         # Basic sentiment analysis
         sentiment_analysis = self.analyze_reviews_sentiment(reviews)
-        
+
         # Intent classification for all reviews
         intent_breakdown = defaultdict(int)
         classified_reviews = []
@@ -619,10 +1136,10 @@ class AnalysisService:
                 })
         
         # Crisis detection
-        crisis_analysis = self.detect_crisis_signals(reviews)
-        
+        crisis_analysis = self.detect_crisis_signals(prepared_reviews)
+
         # Enhanced issue identification with evidence
-        issues = self.identify_key_issues_with_evidence(reviews, serp_data)
+        issues = self.identify_key_issues_with_evidence(prepared_reviews, serp_data)
         
         # Key themes with supporting evidence
         themes = self.extract_themes_with_evidence(reviews, serp_data)
@@ -644,76 +1161,99 @@ class AnalysisService:
     def identify_key_issues_with_evidence(self, reviews: List[Dict], serp_data: List[Dict]) -> List[Dict]:
         """Enhanced issue identification with supporting evidence"""
         issues = self.identify_key_issues(reviews, serp_data)
-        
-        # Add evidence and citations for each issue
-        enhanced_issues = []
-        for issue in issues:
-            evidence = []
-            
-            # Find supporting reviews
-            for review in reviews:
+        if not issues:
+            return []
+
+        # One alternation matcher over every issue string, so collecting
+        # evidence is a single pass per review and per SERP item instead of
+        # an issues x reviews substring scan
+        term_indices = defaultdict(list)
+        for index, issue in enumerate(issues):
+            term_indices[issue['issue'].lower()].append(index)
+        matcher, groups = _build_term_matcher(term_indices.keys())
+
+        # Find supporting reviews
+        review_evidence = [[] for _ in issues]
+        for review in reviews:
+            content = review.get('_lc_text')
+            if content is None:
                 content = (review.get('content', '') + ' ' + review.get('title', '')).lower()
-                if issue['issue'].lower() in content:
-                    evidence.append({
-                        "type": "review",
-                        "platform": review.get('platform', 'unknown'),
-                        "snippet": content[:150] + "...",
-                        "rating": review.get('rating'),
-                        "date": review.get('date', 'unknown')
-                    })
-                    if len(evidence) >= 3:  # Limit evidence per issue
-                        break
-            
-            # Find supporting SERP data
-            for serp_item in serp_data:
-                title_snippet = (serp_item.get('title', '') + ' ' + serp_item.get('snippet', '')).lower()
-                if issue['issue'].lower() in title_snippet:
-                    evidence.append({
-                        "type": "serp",
-                        "title": serp_item.get('title', ''),
-                        "snippet": serp_item.get('snippet', ''),
-                        "source": serp_item.get('source', ''),
-                        "link": serp_item.get('link', '')
-                    })
-                    if len([e for e in evidence if e['type'] == 'serp']) >= 2:
-                        break
-            
+            for name in {m.lastgroup for m in matcher.finditer(content)}:
+                for index in term_indices[groups[name]]:
+                    if len(review_evidence[index]) < 3:  # Limit evidence per issue
+                        review_evidence[index].append({
+                            "type": "review",
+                            "platform": review.get('platform', 'unknown'),
+                            "snippet": content[:150] + "...",
+                            "rating": review.get('rating'),
+                            "date": review.get('date', 'unknown')
+                        })
+            if all(len(evidence) >= 3 for evidence in review_evidence):
+                break
+
+        # Find supporting SERP data
+        serp_evidence = [[] for _ in issues]
+        for serp_item in serp_data:
+            title_snippet = (serp_item.get('title', '') + ' ' + serp_item.get('snippet', '')).lower()
+            for name in {m.lastgroup for m in matcher.finditer(title_snippet)}:
+                for index in term_indices[groups[name]]:
+                    if len(serp_evidence[index]) < 2:
+                        serp_evidence[index].append({
+                            "type": "serp",
+                            "title": serp_item.get('title', ''),
+                            "snippet": serp_item.get('snippet', ''),
+                            "source": serp_item.get('source', ''),
+                            "link": serp_item.get('link', '')
+                        })
+            if all(len(evidence) >= 2 for evidence in serp_evidence):
+                break
+
+        enhanced_issues = []
+        for index, issue in enumerate(issues):
+            evidence = review_evidence[index] + serp_evidence[index]
             enhanced_issues.append({
                 **issue,
                 "evidence": evidence,
                 "evidence_count": len(evidence),
                 "actionable_insight": self._generate_issue_insight(issue, evidence)
             })
-        
+
         return enhanced_issues
     
     def extract_themes_with_evidence(self, reviews: List[Dict], serp_data: List[Dict]) -> Dict:
         """Extract themes with supporting evidence"""
         review_texts = [r.get('content', '') for r in reviews if r.get('content')]
         themes = self.extract_topics_and_themes(review_texts)
-        
-        # Add evidence for top themes
-        enhanced_themes = {}
-        for theme, frequency in list(themes.get('common_words', {}).items())[:5]:
-            supporting_reviews = []
-            for review in reviews:
-                content = review.get('content', '').lower()
-                if theme in content:
-                    supporting_reviews.append({
+
+        top_themes = list(themes.get('common_words', {}).items())[:5]
+        if not top_themes:
+            return {}
+
+        # Same inverted lookup as the issue evidence: one matcher pass per
+        # review collects evidence for all top themes at once
+        matcher, groups = _build_term_matcher(theme for theme, _ in top_themes)
+        supporting_reviews = {theme: [] for theme, _ in top_themes}
+        for review in reviews:
+            content = review.get('content', '').lower()
+            for name in {m.lastgroup for m in matcher.finditer(content)}:
+                theme = groups[name]
+                if len(supporting_reviews[theme]) < 3:
+                    supporting_reviews[theme].append({
                         "platform": review.get('platform'),
                         "snippet": content[:100] + "...",
                         "rating": review.get('rating')
                     })
-                    if len(supporting_reviews) >= 3:
-                        break
-            
-            enhanced_themes[theme] = {
+            if all(len(evidence) >= 3 for evidence in supporting_reviews.values()):
+                break
+
+        return {
+            theme: {
                 "frequency": frequency,
-                "supporting_evidence": supporting_reviews,
+                "supporting_evidence": supporting_reviews[theme],
                 "sentiment_context": self._analyze_theme_sentiment(theme, review_texts)
             }
-        
-        return enhanced_themes
+            for theme, frequency in top_themes
+        }
     
     def _generate_issue_insight(self, issue: Dict, evidence: List[Dict]) -> str:
         """Generate actionable insight for an issue"""
@@ -25,28 +25,34 @@ class MentionService:
         Returns:
             List of created UserMention objects
         """
+        mentions = [
+            self._create_mention_from_review(review_data, product_id, analysis_id)
+            for review_data in raw_reviews
+        ]
+
+        # Check for duplicates with one set-based query instead of a SELECT
+        # per review
+        existing_pairs = set()
+        external_ids = [m["external_id"] for m in mentions]
+        if external_ids:
+            existing_pairs = {
+                (row.external_id, row.platform)
+                for row in db.query(UserMention.external_id, UserMention.platform)
+                .filter(UserMention.external_id.in_(external_ids))
+            }
+
         created_mentions = []
-        
-        for review_data in raw_reviews:
-            mention = self._create_mention_from_review(review_data, product_id, analysis_id)
-            
-            # Check if mention already exists (avoid duplicates)
-            existing = db.query(UserMention).filter(
-                UserMention.external_id == mention["external_id"],
-                UserMention.platform == mention["platform"]
-            ).first()
-            
-            if not existing:
-                db_mention = UserMention(**mention)
-                db.add(db_mention)
-                created_mentions.append(db_mention)
-        
+        for mention in mentions:
+            pair = (mention["external_id"], mention["platform"])
+            if pair not in existing_pairs:
+                existing_pairs.add(pair)  # also dedupe within this batch
+                created_mentions.append(UserMention(**mention))
+
+        # Group-commit: one INSERT batch and one fsync for the whole batch
+        db.add_all(created_mentions)
+        db.flush()  # assigns primary keys before the objects expire on commit
         db.commit()
-        
-        # Refresh all created mentions to get their IDs
-        for mention in created_mentions:
-            db.refresh(mention)
-            
+
         return created_mentions
     
     def _create_mention_from_review(self, review_data: Dict, product_id: int, analysis_id: Optional[int] = None) -> Dict:
@@ -10,6 +10,11 @@ from ..parsers.reddit_scraper import RedditScraper, get_uber_relevant_subreddits
 from ..parsers.trustpilot_scraper import TrustpilotScraper
 from datetime import datetime
 import json
+import sys
+
+# Frozen Uber alias set - O(1) membership with no per-call list allocation
+# for the brand checks scattered through the collection helpers
+UBER_ALIASES = frozenset({'uber', 'uber technologies'})
 
 class ReputationService:
     def __init__(self):
@@ -726,7 +731,7 @@ class ReputationService:
             mentions = self.reddit_scraper.search_mentions(product_name, max_posts=100, time_filter="month")
             
             # For Uber specifically, search relevant subreddits
-            if product_name.lower() in ['uber', 'uber technologies']:
+            if sys.intern(product_name.lower()) in UBER_ALIASES:
                 relevant_subreddits = get_uber_relevant_subreddits()
                 subreddit_mentions = self.reddit_scraper.search_specific_subreddits(
                     product_name, relevant_subreddits, max_posts_per_sub=15
@@ -754,7 +759,7 @@ class ReputationService:
             print(f"Searching Trustpilot for {product_name}...")
             
             # For Uber specifically, use optimized method
-            if product_name.lower() in ['uber', 'uber technologies']:
+            if sys.intern(product_name.lower()) in UBER_ALIASES:
                 reviews = self.trustpilot_scraper.get_uber_trustpilot_reviews(max_reviews=100)
             else:
                 reviews = self.trustpilot_scraper.search_company_reviews(product_name, max_reviews=100)
@@ -774,7 +779,7 @@ class ReputationService:
             scraper = ReviewScraper()
             
             # For Uber, use known App Store URL, otherwise try to find it
-            if product_name.lower() in ['uber', 'uber technologies']:
+            if sys.intern(product_name.lower()) in UBER_ALIASES:
                 app_store_url = "https://apps.apple.com/us/app/uber-request-a-ride/id368677368"
                 result = scraper.scrape_app_store_reviews(app_store_url, max_reviews=50)
                 if result and 'reviews' in result:
@@ -793,7 +798,7 @@ class ReputationService:
             scraper = ReviewScraper()
             
             # For Uber, use known Google Play URL, otherwise try to find it
-            if product_name.lower() in ['uber', 'uber technologies']:
+            if sys.intern(product_name.lower()) in UBER_ALIASES:
                 google_play_url = "https://play.google.com/store/apps/details?id=com.ubercab"
                 result = scraper.scrape_google_play_reviews(google_play_url, max_reviews=50)
                 if result and 'reviews' in result:
@@ -8,7 +8,23 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./main.db")
 
-engine = create_engine(DATABASE_URL, echo=True)
+# echo=True logged every statement synchronously, which dominates query time
+# under load. SQLite connections are shared across the request threadpool;
+# server databases get an explicitly sized pool without pre-ping round-trips.
+if DATABASE_URL.startswith("sqlite"):
+    engine = create_engine(
+        DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False}
+    )
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        echo=False,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=False
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
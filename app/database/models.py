@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, JSON, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, JSON, ForeignKey, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -43,7 +43,15 @@ class ReputationAnalysis(Base):
 
 class UserMention(Base):
     __tablename__ = "user_mentions"
-    
+
+    # Composite indexes matching the /mentions and dashboard filter
+    # combinations, so filtered pagination is an index seek instead of a scan
+    __table_args__ = (
+        Index("ix_user_mentions_product_date", "product_id", "original_date"),
+        Index("ix_user_mentions_product_sentiment", "product_id", "sentiment"),
+        Index("ix_user_mentions_product_priority", "product_id", "priority"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
     analysis_id = Column(Integer, ForeignKey("reputation_analyses.id"), nullable=True, index=True)
@@ -88,9 +96,11 @@ class UserMention(Base):
 
 class AlertSettings(Base):
     __tablename__ = "alert_settings"
-    
+
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    # One settings row per product; the unique index also backs the
+    # per-request lookup in the alert endpoints
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True, unique=True)
     
     # Alert threshold configuration
     threshold = Column(Float, default=0.8, nullable=False)  # Confidence threshold for triggering alerts
@@ -1,9 +1,10 @@
-import requests
+import asyncio
+import aiohttp
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
-import time
 from urllib.parse import quote
 
 
@@ -14,21 +15,51 @@ class RedditScraper:
         self.headers = {
             'User-Agent': 'Brand Reputation Analysis Bot 1.0'
         }
-    
+
+    @staticmethod
+    def _run_coroutine(coroutine):
+        """
+        Run a coroutine to completion from synchronous code
+
+        asyncio.run raises RuntimeError when called on a thread that is
+        already running an event loop - the scheduler's analysis task calls
+        these sync wrappers from inside the FastAPI loop - so in that case
+        the coroutine gets its own loop on a worker thread instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def _make_connector(self) -> aiohttp.TCPConnector:
+        # A fresh connector per run: connectors are bound to the event loop
+        # created by asyncio.run. limit_per_host keeps us polite to Reddit.
+        return aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300)
+
     def search_mentions(self, brand_name: str, max_posts: int = 100, time_filter: str = "month") -> List[Dict]:
         """
         Search for brand mentions on Reddit
-        
+
         Args:
             brand_name: Name of the brand to search for
             max_posts: Maximum number of posts to retrieve
             time_filter: Time filter (hour, day, week, month, year, all)
-            
+
         Returns:
             List of dictionaries containing post and comment data
         """
+        return self._run_coroutine(self.search_mentions_async(brand_name, max_posts, time_filter))
+
+    async def search_mentions_async(self, brand_name: str, max_posts: int = 100, time_filter: str = "month") -> List[Dict]:
+        """
+        Async implementation of search_mentions - the per-query searches are
+        independent HTTP calls, so they run concurrently on one session
+        """
         mentions = []
-        
+
         # Search queries for the brand
         search_queries = [
             brand_name,
@@ -39,19 +70,22 @@ class RedditScraper:
             f"{brand_name} good",
             f"{brand_name} bad"
         ]
-        
-        for query in search_queries:
-            try:
-                posts = self._search_posts(query, max_posts // len(search_queries), time_filter)
-                mentions.extend(posts)
-                
-                # Add delay to avoid rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                print(f"Error searching Reddit for '{query}': {e}")
+
+        async with aiohttp.ClientSession(connector=self._make_connector(), headers=self.headers) as session:
+            results = await asyncio.gather(
+                *[
+                    self._search_posts(session, query, max_posts // len(search_queries), time_filter)
+                    for query in search_queries
+                ],
+                return_exceptions=True
+            )
+
+        for query, result in zip(search_queries, results):
+            if isinstance(result, Exception):
+                print(f"Error searching Reddit for '{query}': {result}")
                 continue
-        
+            mentions.extend(result)
+
         # Remove duplicates based on post ID
         seen_ids = set()
         unique_mentions = []
@@ -59,54 +93,63 @@ class RedditScraper:
             if mention.get('external_id') not in seen_ids:
                 seen_ids.add(mention.get('external_id'))
                 unique_mentions.append(mention)
-        
+
         return unique_mentions[:max_posts]
-    
-    def _search_posts(self, query: str, limit: int, time_filter: str) -> List[Dict]:
+
+    async def _search_posts(self, session: aiohttp.ClientSession, query: str, limit: int, time_filter: str) -> List[Dict]:
         """
         Search for posts using Reddit's JSON API
-        
+
         Args:
+            session: Shared aiohttp session
             query: Search query
             limit: Number of posts to retrieve
             time_filter: Time filter for search
-            
+
         Returns:
             List of post data
         """
         posts = []
-        
+
         params = {
             'q': query,
             'sort': 'relevance',
             't': time_filter,
-            'limit': min(limit, 25),  # Reddit API limit
+            'limit': str(min(limit, 25)),  # Reddit API limit
             'type': 'link'
         }
-        
+
         try:
-            response = requests.get(self.search_url, headers=self.headers, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
+            async with session.get(self.search_url, params=params) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+            comment_fetches = []
             if 'data' in data and 'children' in data['data']:
                 for post_data in data['data']['children']:
                     post = post_data.get('data', {})
-                    
+
                     # Convert Reddit post to mention format
                     mention = self._convert_post_to_mention(post)
                     if mention:
                         posts.append(mention)
-                        
+
                         # Also get comments for this post if it has few comments
                         if post.get('num_comments', 0) <= 20:
-                            comments = self._get_post_comments(post.get('subreddit'), post.get('id'))
-                            posts.extend(comments)
-            
+                            comment_fetches.append(
+                                self._get_post_comments(session, post.get('subreddit'), post.get('id'))
+                            )
+
+            # Comment fetches for all posts of this query run concurrently
+            if comment_fetches:
+                for comments in await asyncio.gather(*comment_fetches, return_exceptions=True):
+                    if isinstance(comments, Exception):
+                        continue
+                    posts.extend(comments)
+
         except Exception as e:
             print(f"Error fetching Reddit posts for query '{query}': {e}")
-        
+
         return posts
     
     def _convert_post_to_mention(self, post: Dict) -> Optional[Dict]:
@@ -151,31 +194,31 @@ class RedditScraper:
             'num_comments': post.get('num_comments', 0)
         }
     
-    def _get_post_comments(self, subreddit: str, post_id: str, max_comments: int = 10) -> List[Dict]:
+    async def _get_post_comments(self, session: aiohttp.ClientSession, subreddit: str, post_id: str, max_comments: int = 10) -> List[Dict]:
         """
         Get comments for a specific post
-        
+
         Args:
+            session: Shared aiohttp session
             subreddit: Subreddit name
             post_id: Post ID
             max_comments: Maximum number of comments to retrieve
-            
+
         Returns:
             List of comment data in mention format
         """
         comments = []
-        
+
         if not subreddit or not post_id:
             return comments
-        
+
         try:
             # Get post comments
             comments_url = f"{self.base_url}/r/{subreddit}/comments/{post_id}.json"
-            response = requests.get(comments_url, headers=self.headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            
+            async with session.get(comments_url) as response:
+                response.raise_for_status()
+                data = await response.json()
+
             # Reddit returns [post_data, comments_data]
             if len(data) >= 2 and 'data' in data[1] and 'children' in data[1]['data']:
                 comment_children = data[1]['data']['children']
@@ -247,41 +290,61 @@ class RedditScraper:
         Returns:
             List of mentions from specified subreddits
         """
+        return self._run_coroutine(self.search_specific_subreddits_async(brand_name, subreddits, max_posts_per_sub))
+
+    async def search_specific_subreddits_async(self, brand_name: str, subreddits: List[str], max_posts_per_sub: int = 20) -> List[Dict]:
+        """
+        Async implementation of search_specific_subreddits - one concurrent
+        search request per subreddit on a shared session
+        """
         all_mentions = []
-        
-        for subreddit in subreddits:
-            try:
-                # Search within specific subreddit
-                subreddit_url = f"{self.base_url}/r/{subreddit}/search.json"
-                params = {
-                    'q': brand_name,
-                    'restrict_sr': 'on',  # Restrict to this subreddit
-                    'sort': 'relevance',
-                    't': 'month',
-                    'limit': max_posts_per_sub
-                }
-                
-                response = requests.get(subreddit_url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if 'data' in data and 'children' in data['data']:
-                    for post_data in data['data']['children']:
-                        post = post_data.get('data', {})
-                        mention = self._convert_post_to_mention(post)
-                        if mention:
-                            all_mentions.append(mention)
-                
-                # Add delay to avoid rate limiting
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Error searching subreddit r/{subreddit}: {e}")
+
+        async with aiohttp.ClientSession(connector=self._make_connector(), headers=self.headers) as session:
+            results = await asyncio.gather(
+                *[
+                    self._search_subreddit(session, brand_name, subreddit, max_posts_per_sub)
+                    for subreddit in subreddits
+                ],
+                return_exceptions=True
+            )
+
+        for subreddit, result in zip(subreddits, results):
+            if isinstance(result, Exception):
+                print(f"Error searching subreddit r/{subreddit}: {result}")
                 continue
-        
+            all_mentions.extend(result)
+
         return all_mentions
 
+    async def _search_subreddit(self, session: aiohttp.ClientSession, brand_name: str, subreddit: str, max_posts_per_sub: int) -> List[Dict]:
+        """
+        Search for brand mentions within a single subreddit
+        """
+        mentions = []
+
+        # Search within specific subreddit
+        subreddit_url = f"{self.base_url}/r/{subreddit}/search.json"
+        params = {
+            'q': brand_name,
+            'restrict_sr': 'on',  # Restrict to this subreddit
+            'sort': 'relevance',
+            't': 'month',
+            'limit': str(max_posts_per_sub)
+        }
+
+        async with session.get(subreddit_url, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        if 'data' in data and 'children' in data['data']:
+            for post_data in data['data']['children']:
+                post = post_data.get('data', {})
+                mention = self._convert_post_to_mention(post)
+                if mention:
+                    mentions.append(mention)
+
+        return mentions
+
 
 def get_uber_relevant_subreddits() -> List[str]:
     """
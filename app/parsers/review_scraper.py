@@ -16,7 +16,13 @@ class ReviewScraper:
         self.chrome_options.add_argument("--headless")
         self.chrome_options.add_argument("--no-sandbox")
         self.chrome_options.add_argument("--disable-dev-shm-usage")
-        
+
+        # Reuse one pooled session so repeated queries share TLS connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def scrape_app_store_reviews(self, app_url: str, max_reviews: int = 50) -> List[Dict]:
         """
         Scrape reviews from App Store
@@ -41,7 +47,7 @@ class ReviewScraper:
             # Use iTunes API to get reviews
             review_url = f"https://itunes.apple.com/rss/customerreviews/page=1/id={app_id}/sortby=mostrecent/json"
             
-            response = requests.get(review_url)
+            response = self.session.get(review_url)
             response.raise_for_status()
             
             data = response.json()
@@ -9,6 +9,12 @@ class SerpService:
     def __init__(self):
         self.api_key = os.getenv("SERPER_API_KEY")
         self.base_url = "https://google.serper.dev/search"
+
+        # Reuse one pooled session so repeated queries share TLS connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
     def search_brand_reputation(self, brand_name: str, location: str = "United States", time_period: str = "qdr:y") -> Dict:
         """
@@ -47,7 +53,7 @@ class SerpService:
             }
             
             try:
-                response = requests.post(self.base_url, headers=headers, json=payload)
+                response = self.session.post(self.base_url, headers=headers, json=payload)
                 response.raise_for_status()
                 
                 all_results[query] = response.json()
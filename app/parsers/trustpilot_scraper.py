@@ -11,6 +11,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+# TTL for cached review pages handed in by callers (seconds)
+PAGE_CACHE_TTL = 86400
+
 
 class TrustpilotScraper:
     def __init__(self):
@@ -18,7 +21,13 @@ class TrustpilotScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        
+
+        # Reuse one pooled session so repeated queries share TLS connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Chrome options for headless browsing
         self.chrome_options = Options()
         self.chrome_options.add_argument("--headless")
@@ -71,7 +80,7 @@ class TrustpilotScraper:
             search_url = f"{self.base_url}/search"
             params = {'query': company_name}
             
-            response = requests.get(search_url, headers=self.headers, params=params)
+            response = self.session.get(search_url, headers=self.headers, params=params)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -93,7 +102,7 @@ class TrustpilotScraper:
             ]
             
             for url in potential_urls:
-                response = requests.head(url, headers=self.headers)
+                response = self.session.head(url, headers=self.headers)
                 if response.status_code == 200:
                     return url
             
@@ -392,13 +401,15 @@ class TrustpilotScraper:
         except Exception:
             return datetime.now().isoformat()
     
-    def get_uber_trustpilot_reviews(self, max_reviews: int = 100) -> List[Dict]:
+    def get_uber_trustpilot_reviews(self, max_reviews: int = 100, cache=None, stop_after_cached: int = 3) -> List[Dict]:
         """
         Get Trustpilot reviews specifically for Uber
-        
+
         Args:
             max_reviews: Maximum number of reviews to retrieve
-            
+            cache: Optional diskcache.Cache for per-page review caching
+            stop_after_cached: Stop paginating after this many consecutive cached pages
+
         Returns:
             List of Uber reviews from Trustpilot
         """
@@ -416,7 +427,7 @@ class TrustpilotScraper:
         for url in uber_urls:
             print(f"   Trying Uber URL: {url}")
             try:
-                reviews = self._scrape_company_reviews_direct(url, max_reviews)
+                reviews = self._scrape_company_reviews_direct(url, max_reviews, cache=cache, stop_after_cached=stop_after_cached)
                 if reviews:
                     all_reviews.extend(reviews)
                     print(f"   ✅ Found {len(reviews)} reviews from {url}")
@@ -445,27 +456,28 @@ class TrustpilotScraper:
         
         return unique_reviews[:max_reviews]
     
-    def _scrape_company_reviews_direct(self, company_url: str, max_reviews: int) -> List[Dict]:
+    def _scrape_company_reviews_direct(self, company_url: str, max_reviews: int, cache=None, stop_after_cached: int = 3) -> List[Dict]:
         """
         Directly scrape reviews from a known company URL with pagination support
-        
+
         Args:
             company_url: Direct Trustpilot URL for the company
             max_reviews: Maximum number of reviews to retrieve
-            
+            cache: Optional diskcache.Cache holding previously scraped pages
+            stop_after_cached: Stop paginating after this many consecutive cached pages
+
         Returns:
             List of review data
         """
         reviews = []
-        
+        driver = None
+
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
             # Start with page 1
             page = 1
             collected_reviews = 0
-            
+            cache_hit_streak = 0
+
             while collected_reviews < max_reviews and page <= 10:  # Limit to 10 pages
                 try:
                     # Build URL with page parameter
@@ -473,7 +485,29 @@ class TrustpilotScraper:
                         page_url = f"{company_url}&page={page}"
                     else:
                         page_url = f"{company_url}?page={page}"
-                    
+
+                    # Serve the page from cache when warm - after a few
+                    # consecutive cached pages the rest of the run is assumed
+                    # warm too and pagination stops early
+                    if cache is not None:
+                        cached_page = cache.get(("trustpilot_page", page_url))
+                        if cached_page is not None:
+                            reviews.extend(cached_page[:max_reviews - collected_reviews])
+                            collected_reviews = len(reviews)
+                            cache_hit_streak += 1
+                            if cache_hit_streak >= stop_after_cached:
+                                print(f"   {cache_hit_streak} consecutive cached pages - stopping early")
+                                break
+                            page += 1
+                            continue
+                        cache_hit_streak = 0
+
+                    # Launch the browser lazily so fully cached runs never
+                    # pay the Chrome startup cost
+                    if driver is None:
+                        driver = webdriver.Chrome(options=self.chrome_options)
+                        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
                     print(f"   Scraping page {page}: {page_url}")
                     driver.get(page_url)
                     
@@ -539,7 +573,11 @@ class TrustpilotScraper:
                     
                     reviews.extend(page_reviews)
                     print(f"   Successfully extracted {len(page_reviews)} reviews from page {page}")
-                    
+
+                    if cache is not None and page_reviews:
+                        cache.set(("trustpilot_page", page_url), page_reviews, expire=PAGE_CACHE_TTL)
+
+
                     # If we got fewer reviews than expected, we might have reached the end
                     if len(page_reviews) < 10:  # Typical reviews per page
                         print(f"   Reached end of reviews (got {len(page_reviews)} reviews)")
@@ -552,12 +590,13 @@ class TrustpilotScraper:
                     print(f"   Error on page {page}: {e}")
                     break
             
-            driver.quit()
+            if driver is not None:
+                driver.quit()
             print(f"   Total reviews collected: {len(reviews)}")
-            
+
         except Exception as e:
             print(f"   Error in direct scraping: {e}")
-        
+
         return reviews
     
     def _remove_duplicate_reviews(self, reviews: List[Dict]) -> List[Dict]: